@@ -27,15 +27,25 @@ class BaseAgent(ABC):
     async def _generate_response(self, 
                                 prompt: str, 
                                 system_instruction: str,
-                                temperature: float = 1.0) -> str:
-        """Generate response using Google Generative AI"""
+                                temperature: float = 1.0,
+                                response_schema: Optional[type] = None) -> str:
+        """
+        Generate response using Google Generative AI
+
+        When response_schema (a pydantic model) is given, the model is put in
+        JSON mode and constrained to that schema, so the returned text is
+        always a bare JSON document.
+        """
         try:
+            config_kwargs = {'temperature': temperature}
+            if response_schema is not None:
+                config_kwargs['response_mime_type'] = "application/json"
+                config_kwargs['response_schema'] = response_schema
+
             model = genai.GenerativeModel(
                 model_name=self.model,
                 system_instruction=system_instruction,
-                generation_config=genai.GenerationConfig(
-                    temperature=temperature,
-                )
+                generation_config=genai.GenerationConfig(**config_kwargs)
             )
             
             response = model.generate_content(prompt)
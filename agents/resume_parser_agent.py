@@ -3,7 +3,8 @@ from typing import Dict, Any
 import json
 from prompts.resume_parser_prompts import (
     RESUME_PARSER_SYSTEM_PROMPT,
-    RESUME_PARSER_USER_PROMPT
+    RESUME_PARSER_USER_PROMPT,
+    ResumeParse
 )
 
 class ResumeParserAgent(BaseAgent):
@@ -42,17 +43,13 @@ class ResumeParserAgent(BaseAgent):
             response = await self._generate_response(
                 prompt=prompt,
                 system_instruction=RESUME_PARSER_SYSTEM_PROMPT,
-                temperature=0.3  # Lower temperature for more consistent extraction
+                temperature=0.3,  # Lower temperature for more consistent extraction
+                response_schema=ResumeParse
             )
             
             # Parse the JSON response
             try:
-                # Extract JSON from markdown code blocks if present
-                if "```json" in response:
-                    response = response.split("```json")[1].split("```")[0].strip()
-                elif "```" in response:
-                    response = response.split("```")[1].split("```")[0].strip()
-                
+                # JSON mode returns a bare document, no markdown fences to strip
                 candidate_data = json.loads(response)
                 
                 self.log_info("Resume parsing completed successfully")
@@ -3,7 +3,8 @@ from typing import Dict, Any
 import json
 from prompts.skills_matcher_prompts import (
     SKILLS_MATCHER_SYSTEM_PROMPT,
-    SKILLS_MATCHER_USER_PROMPT
+    SKILLS_MATCHER_USER_PROMPT,
+    SkillsMatch
 )
 
 class SkillsMatcherAgent(BaseAgent):
@@ -51,17 +52,13 @@ class SkillsMatcherAgent(BaseAgent):
             response = await self._generate_response(
                 prompt=prompt,
                 system_instruction=SKILLS_MATCHER_SYSTEM_PROMPT,
-                temperature=0.5
+                temperature=0.5,
+                response_schema=SkillsMatch
             )
             
             # Parse the JSON response
             try:
-                # Extract JSON from markdown code blocks if present
-                if "```json" in response:
-                    response = response.split("```json")[1].split("```")[0].strip()
-                elif "```" in response:
-                    response = response.split("```")[1].split("```")[0].strip()
-                
+                # JSON mode returns a bare document, no markdown fences to strip
                 match_result = json.loads(response)
                 
                 self.log_info(f"Skills matching completed. Score: {match_result.get('overall_match_percentage', 0)}%")
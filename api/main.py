@@ -4,6 +4,7 @@ from fastapi.responses import JSONResponse
 import logging
 from api.routes import candidate_routes, job_routes, interview_routes
 from config import config
+from models import batch_clock
 from utils.logger import setup_logger
 
 # Setup logging
@@ -26,6 +27,12 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Models created while handling one request share a single timestamp
+@app.middleware("http")
+async def request_clock(request, call_next):
+    with batch_clock():
+        return await call_next(request)
+
 # Include routers
 app.include_router(
     candidate_routes.router, 
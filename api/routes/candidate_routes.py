@@ -70,7 +70,10 @@ async def upload_resumes(
     uploaded_files = []
     errors = []
     
-    for file in files:
+    # One timestamp per batch; the index keeps same-second uploads from colliding
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    
+    for i, file in enumerate(files):
         try:
             # Validate file type
             if not file.filename.lower().endswith(('.pdf', '.docx')):
@@ -93,8 +96,7 @@ async def upload_resumes(
                 continue
             
             # Generate unique filename
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            unique_filename = f"{timestamp}_{file.filename}"
+            unique_filename = f"{timestamp}_{i:03d}_{file.filename}"
             
             # Save file
             file_path = os.path.join(config.RESUME_STORAGE_PATH, unique_filename)
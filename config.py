@@ -35,16 +35,20 @@ class Config:
     
     # Database
     DATABASE_URL = os.getenv('DATABASE_URL', 'sqlite:///./recruitment.db')
+    DB_POOL_SIZE = int(os.getenv('DB_POOL_SIZE', '5'))
+    DB_MAX_OVERFLOW = int(os.getenv('DB_MAX_OVERFLOW', '10'))
     
     # Application
     APP_HOST = os.getenv('APP_HOST', '0.0.0.0')
     APP_PORT = int(os.getenv('APP_PORT', '8000'))
     DEBUG = os.getenv('DEBUG', 'True').lower() == 'true'
     SECRET_KEY = os.getenv('SECRET_KEY', 'dev-secret-key-change-in-production')
+    DASHBOARD_CACHE_TTL = int(os.getenv('DASHBOARD_CACHE_TTL', '30'))
     
     # Storage
     RESUME_STORAGE_PATH = os.getenv('RESUME_STORAGE_PATH', './data/uploaded_resumes')
     OUTPUT_STORAGE_PATH = os.getenv('OUTPUT_STORAGE_PATH', './data/outputs')
+    JOBS_STORAGE_PATH = os.getenv('JOBS_STORAGE_PATH', './data/jobs')
     
     # Agent Configuration
     SKILLS_MATCH_THRESHOLD = float(os.getenv('SKILLS_MATCH_THRESHOLD', '70'))
@@ -52,6 +56,7 @@ class Config:
     SKILLS_WEIGHT = float(os.getenv('SKILLS_WEIGHT', '0.6'))
     CULTURAL_FIT_WEIGHT = float(os.getenv('CULTURAL_FIT_WEIGHT', '0.3'))
     EXPERIENCE_WEIGHT = float(os.getenv('EXPERIENCE_WEIGHT', '0.1'))
+    EVALUATION_WORKERS = int(os.getenv('EVALUATION_WORKERS', '2'))
     
     # Model Configuration
     DEFAULT_MODEL = os.getenv('DEFAULT_MODEL', 'gemini-2.0-flash-exp')
@@ -2,6 +2,7 @@ import streamlit as st
 import plotly.express as px
 import plotly.graph_objects as go
 from typing import Dict, Any, List
+from collections import Counter
 import pandas as pd
 
 def render_analytics_panel(metrics: Dict[str, Any], candidates: List[Dict[str, Any]] = None):
@@ -141,19 +142,23 @@ def render_candidate_analytics(candidates: List[Dict[str, Any]]):
     # Top skills analysis
     st.markdown("#### 🎯 Most Common Skills")
     
-    all_skills = []
-    for candidate in candidates:
-        all_skills.extend(candidate.get('matched_skills', []))
+    # most_common(n) keeps only the top n counts (heapq.nlargest) instead of sorting them all
+    top_skills = Counter(
+        skill.get('skill') if isinstance(skill, dict) else skill
+        for candidate in candidates
+        for skill in candidate.get('matched_skills', [])
+    ).most_common(10)
     
-    if all_skills:
-        skill_counts = pd.Series(all_skills).value_counts().head(10)
+    if top_skills:
+        skill_names = [skill for skill, _ in top_skills]
+        skill_counts = [count for _, count in top_skills]
         
         fig = px.bar(
-            x=skill_counts.index,
-            y=skill_counts.values,
+            x=skill_names,
+            y=skill_counts,
             title='Top 10 Most Common Skills Among Candidates',
             labels={'x': 'Skill', 'y': 'Count'},
-            color=skill_counts.values,
+            color=skill_counts,
             color_continuous_scale='Blues'
         )
         st.plotly_chart(fig, use_container_width=True)
@@ -6,6 +6,11 @@ def render_candidates_page():
     """Render candidates page with search, filter, and detailed views"""
     
     st.title("👥 Candidates")
+
+    # Detail view only needs the selected row, so skip the list payload entirely
+    if st.session_state.get('selected_candidate'):
+        render_selected_candidate(st.session_state['selected_candidate'])
+        return
     
     # Tabs for different views
     tab1, tab2, tab3 = st.tabs(["📋 All Candidates", "📤 Upload Resumes", "🔍 Advanced Search"])
@@ -77,37 +82,33 @@ def render_candidates_list():
         for candidate in filtered_candidates:
             render_candidate_card(candidate)
     
-    # Check if candidate details should be shown
-    if 'selected_candidate' in st.session_state:
-        st.markdown("---")
-        selected = next(
-            (c for c in candidates if c['id'] == st.session_state['selected_candidate']),
-            None
-        )
-        if selected:
-            render_candidate_detail(selected)
-            
-            if st.button("← Back to List"):
-                del st.session_state['selected_candidate']
-                st.rerun()
+def render_selected_candidate(candidate_id: str):
+    """Render detail view for a single candidate"""
+
+    from dashboard.services import get_candidate_by_id
+    selected = get_candidate_by_id(candidate_id)
+
+    if selected:
+        render_candidate_detail(selected)
+    else:
+        st.warning("⚠️ Candidate not found")
+
+    if st.button("← Back to List"):
+        del st.session_state['selected_candidate']
+        st.rerun()
 
 def render_upload_interface():
     """Render resume upload interface"""
 
     st.markdown("### Upload Candidate Resumes")
 
-    # Load available jobs from file
-    from pathlib import Path
-    import json
-
-    jobs_list_file = Path("data/jobs/jobs_list.json")
+    # Surface any evaluation this session already has in flight
+    render_pending_evaluation()
 
-    if not jobs_list_file.exists():
-        st.warning("⚠️ No job descriptions found. Please create a job description in the Jobs page first.")
-        return
+    # Load available jobs from the job store
+    from storage.job_store import load_jobs
 
-    with open(jobs_list_file, 'r') as f:
-        jobs = json.load(f)
+    jobs = load_jobs()
 
     if not jobs:
         st.warning("⚠️ No job descriptions found. Please create a job description in the Jobs page first.")
@@ -156,8 +157,7 @@ def render_upload_interface():
         
         # Process button
         if st.button("🚀 Process Resumes", type="primary", use_container_width=True):
-            with st.spinner("Processing resumes..."):
-                # In production, call API endpoint
+            with st.spinner("Saving resumes..."):
                 process_uploaded_resumes(uploaded_files, job_id, interviewer_email if auto_schedule else None)
 
 def render_advanced_search():
@@ -221,9 +221,14 @@ def render_advanced_search():
             candidates = [c for c in candidates if email_search.lower() in c.get('email', '').lower()]
 
         if skills_search:
+            wanted_skills = set(skills_search)
+            # matched_skills may be plain names or {'skill': ...} dicts from the matcher
             candidates = [
                 c for c in candidates
-                if any(skill in c.get('matched_skills', []) for skill in skills_search)
+                if not wanted_skills.isdisjoint(
+                    s.get('skill') if isinstance(s, dict) else s
+                    for s in c.get('matched_skills', [])
+                )
             ]
 
         st.markdown("### Search Results")
@@ -234,31 +239,203 @@ def render_advanced_search():
 
 # Removed get_sample_candidates() - now using real data from data_service
 
-def process_uploaded_resumes(files, job_id: str, interviewer_email: str = None):
-    """Process uploaded resumes through orchestrator"""
+@st.cache_resource
+def _worker_orchestrators():
+    """Thread-local holder so each evaluation worker builds and reuses its own orchestrator"""
+    import threading
+    return threading.local()
+
+def _thread_orchestrator(orchestrators):
+    """Return this worker thread's orchestrator, building it on first use"""
+    orchestrator = getattr(orchestrators, 'orchestrator', None)
+    if orchestrator is None:
+        from agents.orchestrator_agent import OrchestratorAgent
+        orchestrator = orchestrators.orchestrator = OrchestratorAgent()
+    return orchestrator
+
+@st.cache_resource
+def _evaluation_executor():
+    """Worker pool for background resume evaluation; its size bounds LLM concurrency"""
+    from concurrent.futures import ThreadPoolExecutor
+    from config import config
+    return ThreadPoolExecutor(
+        max_workers=config.EVALUATION_WORKERS,
+        thread_name_prefix="resume-evaluation"
+    )
+
+# Finished evaluations kept for sessions that haven't collected them yet
+MAX_UNCOLLECTED_EVALUATIONS = 20
+
+@st.cache_resource
+def _pending_evaluations():
+    """Futures for submitted evaluations, keyed by pending job ID"""
+    return {}
+
+def _track_evaluation(pending_id: str, future):
+    """
+    Register a submitted evaluation, evicting the oldest finished ones over the limit
+
+    A session that is closed before collecting its result never pops its
+    future, so without the cap finished results would pile up for the
+    life of the server. Running evaluations are never evicted.
+    """
+    pending = _pending_evaluations()
+    pending[pending_id] = future
+
+    finished = [key for key, f in list(pending.items()) if f.done()]
+    for key in finished[:max(0, len(finished) - MAX_UNCOLLECTED_EVALUATIONS)]:
+        pending.pop(key, None)
+
+def render_pending_evaluation():
+    """Show the status or results of a background evaluation submitted from this session"""
+
+    pending_id = st.session_state.get('pending_job')
+    if not pending_id:
+        return
+
+    future = _pending_evaluations().get(pending_id)
+    if future is None:
+        # Server restarted or the result was already collected
+        del st.session_state['pending_job']
+        return
+
+    if not future.done():
+        st.info("🤖 AI agents are analyzing the resumes in the background (this may take 30-60 seconds)...")
+        if st.button("🔄 Refresh Status"):
+            st.rerun()
+        return
+
+    del st.session_state['pending_job']
+    _pending_evaluations().pop(pending_id, None)
+
+    try:
+        result = future.result()
+    except Exception as e:
+        st.error(f"❌ Error during processing: {str(e)}")
+
+        with st.expander("🔍 View Error Details"):
+            import traceback
+            st.code("".join(traceback.format_exception(e)))
+
+            st.markdown("**Common issues:**")
+            st.markdown("- Check if GOOGLE_API_KEY is set in .env file")
+            st.markdown("- Check logs/api.log for detailed error messages")
+        return
+
+    render_processing_result(result)
+
+def _evaluate_and_save(orchestrators, resumes, job_id: str, job_description, company_culture, interviewer_email: str = None):
+    """Run this worker's orchestrator and persist its results (executes on a worker thread)"""
 
-    import sys
     import asyncio
+    import logging
+    import traceback
+
+    logger = logging.getLogger(__name__)
+
+    # Each worker thread gets its own orchestrator and event loop
+    orchestrator = _thread_orchestrator(orchestrators)
+    result = asyncio.run(orchestrator.process({
+        'resumes': resumes,
+        'job_description': job_description,
+        'company_culture': company_culture,
+        'interviewer_email': interviewer_email
+    }))
+    result['total_resumes'] = len(resumes)
+
+    if result['status'] == 'success':
+        from dashboard.services import save_evaluation_results
+        try:
+            save_evaluation_results(result, resumes, job_id, interviewer_email)
+        except Exception as e:
+            logger.error(f"Database save failed: {str(e)}")
+            logger.error(traceback.format_exc())
+            result['db_error'] = str(e)
+            result['db_traceback'] = traceback.format_exc()
+
+    return result
+
+def render_processing_result(result):
+    """Render the outcome of a completed evaluation"""
+
+    if result['status'] != 'success':
+        st.error(f"❌ Processing failed: {result.get('message', 'Unknown error')}")
+        return
+
+    # New candidates/interviews were written, so cached queries are stale
+    from dashboard.services import refresh_data
+    refresh_data()
+
+    if result.get('db_error'):
+        st.error(f"⚠️ Results processed but database save failed: {result['db_error']}")
+
+        # Show error details
+        with st.expander("🔍 View Database Error Details"):
+            st.code(result.get('db_traceback', ''))
+    else:
+        st.success(f"✅ Successfully processed and saved {result.get('total_resumes', 0)} resume(s) to database!")
+
+    # Show detailed summary
+    summary = result.get('processing_summary', {})
+
+    st.info(f"""
+    **Processing Summary:**
+    - Total resumes uploaded: {summary.get('total_resumes', 0)}
+    - Successfully parsed: {summary.get('successfully_parsed', 0)}
+    - Qualified candidates: {summary.get('qualified_candidates', 0)}
+    - Interviews scheduled: {summary.get('interviews_scheduled', 0)}
+    """)
+
+    # Show top candidates
+    if result.get('ranked_candidates'):
+        st.markdown("### 🏆 Top Candidates")
+
+        for candidate in result['ranked_candidates'][:5]:
+            with st.expander(f"{candidate['name']} - Score: {candidate['overall_score']}%"):
+                col1, col2 = st.columns(2)
+
+                with col1:
+                    st.write(f"**Email:** {candidate['email']}")
+                    st.write(f"**Tier:** {candidate['tier'].replace('_', ' ').title()}")
+                    st.write(f"**Skills Match:** {candidate['skills_match_score']}%")
+
+                with col2:
+                    st.write(f"**Cultural Fit:** {candidate['cultural_fit_score']}%")
+
+                    # Handle matched_skills - might be list of strings or list of dicts
+                    matched_skills = candidate.get('matched_skills', [])
+                    if matched_skills:
+                        if isinstance(matched_skills[0], dict):
+                            # If it's a list of dicts, extract the skill names
+                            skill_names = [s.get('skill', str(s)) for s in matched_skills[:5]]
+                        else:
+                            # If it's already a list of strings
+                            skill_names = matched_skills[:5]
+                        st.write(f"**Matched Skills:** {', '.join(skill_names)}")
+                    else:
+                        st.write(f"**Matched Skills:** None")
+
+        # Add button to view all candidates
+        st.divider()
+        col1, col2, col3 = st.columns([1, 2, 1])
+        with col2:
+            st.info("💡 **Click 'All Candidates' tab above to see the full candidate list!**")
+
+        # Store flag to potentially auto-switch tabs (if needed)
+        st.session_state['candidates_uploaded'] = True
+
+def process_uploaded_resumes(files, job_id: str, interviewer_email: str = None):
+    """Save uploaded resumes and queue them for background evaluation"""
+
     from pathlib import Path
     from datetime import datetime
     import uuid
 
-    # Add project root to path
-    project_root = Path(__file__).parent.parent.parent
-    sys.path.insert(0, str(project_root))
-
     from tools.pdf_parser import extract_text_from_pdf
     from tools.docx_parser import extract_text_from_docx
-    from agents.orchestrator_agent import OrchestratorAgent
-    from storage.database import (
-        SessionLocal, CandidateModel, EvaluationModel,
-        InterviewModel, Base, engine
-    )
+    from storage.job_store import load_jobs
     from config import config
 
-    # Create tables if they don't exist
-    Base.metadata.create_all(bind=engine)
-
     progress_bar = st.progress(0)
     status_text = st.empty()
 
@@ -266,27 +443,21 @@ def process_uploaded_resumes(files, job_id: str, interviewer_email: str = None):
         # Get job description
         status_text.text("Loading job description...")
 
-        # Try to load from JSON first
-        jobs_list_file = Path("data/jobs/jobs_list.json")
         job_description = None
         company_culture = {}
 
-        if jobs_list_file.exists():
-            import json
-            with open(jobs_list_file, 'r') as f:
-                jobs = json.load(f)
-                job_data = next((j for j in jobs if j['id'] == job_id), None)
-
-                if job_data:
-                    job_description = {
-                        'title': job_data.get('title'),
-                        'required_skills': job_data.get('requirements', {}).get('required_skills', []),
-                        'preferred_skills': job_data.get('requirements', {}).get('preferred_skills', []),
-                        'experience_level': job_data.get('experience_level'),
-                        'description': job_data.get('description'),
-                        'responsibilities': job_data.get('responsibilities', [])
-                    }
-                    company_culture = job_data.get('company_culture', {})
+        job_data = next((j for j in load_jobs() if j['id'] == job_id), None)
+
+        if job_data:
+            job_description = {
+                'title': job_data.get('title'),
+                'required_skills': job_data.get('requirements', {}).get('required_skills', []),
+                'preferred_skills': job_data.get('requirements', {}).get('preferred_skills', []),
+                'experience_level': job_data.get('experience_level'),
+                'description': job_data.get('description'),
+                'responsibilities': job_data.get('responsibilities', [])
+            }
+            company_culture = job_data.get('company_culture', {})
 
         if not job_description:
             st.error(f"Job description not found for {job_id}")
@@ -299,11 +470,13 @@ def process_uploaded_resumes(files, job_id: str, interviewer_email: str = None):
         upload_dir = Path(config.RESUME_STORAGE_PATH)
         upload_dir.mkdir(parents=True, exist_ok=True)
 
+        # One timestamp per batch; the index keeps same-second uploads from colliding
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+
         for i, file in enumerate(files):
             try:
                 # Generate unique filename
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                unique_filename = f"{timestamp}_{file.name}"
+                unique_filename = f"{timestamp}_{i:03d}_{file.name}"
                 file_path = upload_dir / unique_filename
 
                 # Save file
@@ -337,173 +510,24 @@ def process_uploaded_resumes(files, job_id: str, interviewer_email: str = None):
             st.error("No resumes could be processed")
             return
 
-        # Process through orchestrator
-        status_text.text("Running AI evaluation (this may take 30-60 seconds)...")
-
-        orchestrator = OrchestratorAgent()
-
-        # Run async orchestrator with spinner
-        with st.spinner('🤖 AI agents are analyzing the resume... Please wait...'):
-            # Run async orchestrator
-            async def run_orchestrator():
-                return await orchestrator.process({
-                    'resumes': resumes,
-                    'job_description': job_description,
-                    'company_culture': company_culture,
-                    'interviewer_email': interviewer_email
-                })
-
-            # Use asyncio.run() which handles the event loop properly
-            result = asyncio.run(run_orchestrator())
+        # Hand the slow AI evaluation to the worker pool so this session returns immediately
+        status_text.text("Queueing AI evaluation...")
+
+        pending_id = str(uuid.uuid4())
+        _track_evaluation(pending_id, _evaluation_executor().submit(
+            _evaluate_and_save,
+            _worker_orchestrators(),
+            resumes,
+            job_id,
+            job_description,
+            company_culture,
+            interviewer_email
+        ))
+        st.session_state['pending_job'] = pending_id
 
         progress_bar.progress(1.0)
-
-        if result['status'] == 'success':
-            # Save results to database
-            status_text.text("Saving results to database...")
-
-            session = SessionLocal()
-            try:
-                for candidate_result in result.get('ranked_candidates', []):
-                    candidate_id = str(uuid.uuid4())
-
-                    # Create candidate record
-                    candidate = CandidateModel(
-                        id=candidate_id,
-                        job_id=job_id,
-                        personal_info=candidate_result.get('candidate_data', {}).get('personal_info', {}),
-                        work_experience=candidate_result.get('candidate_data', {}).get('work_experience', []),
-                        education=candidate_result.get('candidate_data', {}).get('education', []),
-                        skills=candidate_result.get('matched_skills', []),
-                        resume_filename=resumes[candidate_result.get('resume_index', 0)]['filename'],
-                        resume_path=resumes[candidate_result.get('resume_index', 0)]['file_path'],
-                        status='screening',
-                        created_at=datetime.now()
-                    )
-                    session.add(candidate)
-
-                    # Create evaluation record
-                    evaluation = EvaluationModel(
-                        id=str(uuid.uuid4()),
-                        candidate_id=candidate_id,
-                        job_id=job_id,
-                        overall_score=candidate_result.get('overall_score', 0) / 100.0,
-                        skills_match_score=candidate_result.get('skills_match_score', 0) / 100.0,
-                        cultural_fit_score=candidate_result.get('cultural_fit_score', 0) / 100.0,
-                        experience_score=candidate_result.get('experience_score', 0) / 100.0,
-                        recommendation=candidate_result.get('recommendation', 'weak_match'),
-                        tier=candidate_result.get('tier', 'weak_match'),
-                        skills_evaluation={
-                            'matched_skills': candidate_result.get('matched_skills', []),
-                            'missing_skills': candidate_result.get('missing_skills', []),
-                            'rationale': candidate_result.get('skills_rationale', '')
-                        },
-                        cultural_evaluation={
-                            'rationale': candidate_result.get('cultural_rationale', ''),
-                            'dimensional_scores': candidate_result.get('dimensional_scores', {})
-                        },
-                        evaluated_at=datetime.now(),
-                        created_at=datetime.now()
-                    )
-                    session.add(evaluation)
-
-                # Save scheduled interviews to database
-                scheduled_interviews = result.get('scheduled_interviews', [])
-                for interview_data in scheduled_interviews:
-                    interview = InterviewModel(
-                        id=str(uuid.uuid4()),
-                        candidate_id=interview_data.get('candidate_id'),
-                        job_id=job_id,
-                        candidate_name=interview_data.get('candidate_name'),
-                        candidate_email=interview_data.get('candidate_email'),
-                        start_time=datetime.fromisoformat(interview_data.get('start_time')),
-                        end_time=datetime.fromisoformat(interview_data.get('end_time')),
-                        duration_minutes=60,
-                        interviewer_email=interviewer_email,
-                        status=interview_data.get('status', 'scheduled'),
-                        calendar_event_id=interview_data.get('calendar_event_id'),
-                        created_at=datetime.now()
-                    )
-                    session.add(interview)
-
-                session.commit()
-                status_text.text("")
-                st.success(f"✅ Successfully processed and saved {len(files)} resume(s) to database!")
-
-                # Log success
-                import logging
-                logger = logging.getLogger(__name__)
-                logger.info(f"Successfully saved {len(result.get('ranked_candidates', []))} candidates to database")
-                if scheduled_interviews:
-                    logger.info(f"Successfully saved {len(scheduled_interviews)} scheduled interviews to database")
-
-            except Exception as e:
-                session.rollback()
-                st.error(f"⚠️ Results processed but database save failed: {str(e)}")
-
-                # Show error details
-                with st.expander("🔍 View Database Error Details"):
-                    import traceback
-                    st.code(traceback.format_exc())
-
-                import logging
-                logger = logging.getLogger(__name__)
-                logger.error(f"Database save failed: {str(e)}")
-                logger.error(traceback.format_exc())
-            finally:
-                session.close()
-
-            # Show detailed summary
-            summary = result.get('processing_summary', {})
-
-            st.info(f"""
-            **Processing Summary:**
-            - Total resumes uploaded: {summary.get('total_resumes', 0)}
-            - Successfully parsed: {summary.get('successfully_parsed', 0)}
-            - Qualified candidates: {summary.get('qualified_candidates', 0)}
-            - Interviews scheduled: {summary.get('interviews_scheduled', 0)}
-            """)
-
-            # Show top candidates
-            if result.get('ranked_candidates'):
-                st.markdown("### 🏆 Top Candidates")
-
-                for candidate in result['ranked_candidates'][:5]:
-                    with st.expander(f"{candidate['name']} - Score: {candidate['overall_score']}%"):
-                        col1, col2 = st.columns(2)
-
-                        with col1:
-                            st.write(f"**Email:** {candidate['email']}")
-                            st.write(f"**Tier:** {candidate['tier'].replace('_', ' ').title()}")
-                            st.write(f"**Skills Match:** {candidate['skills_match_score']}%")
-
-                        with col2:
-                            st.write(f"**Cultural Fit:** {candidate['cultural_fit_score']}%")
-
-                            # Handle matched_skills - might be list of strings or list of dicts
-                            matched_skills = candidate.get('matched_skills', [])
-                            if matched_skills:
-                                if isinstance(matched_skills[0], dict):
-                                    # If it's a list of dicts, extract the skill names
-                                    skill_names = [s.get('skill', str(s)) for s in matched_skills[:5]]
-                                else:
-                                    # If it's already a list of strings
-                                    skill_names = matched_skills[:5]
-                                st.write(f"**Matched Skills:** {', '.join(skill_names)}")
-                            else:
-                                st.write(f"**Matched Skills:** None")
-
-                # Add button to view all candidates
-                st.divider()
-                col1, col2, col3 = st.columns([1, 2, 1])
-                with col2:
-                    st.info("💡 **Click 'All Candidates' tab above to see the full candidate list!**")
-
-                # Store flag to potentially auto-switch tabs (if needed)
-                st.session_state['candidates_uploaded'] = True
-
-        else:
-            st.error(f"❌ Processing failed: {result.get('message', 'Unknown error')}")
+        status_text.text("")
+        st.info(f"🤖 {len(resumes)} resume(s) queued for AI evaluation. Results will appear here when ready.")
 
     except Exception as e:
         st.error(f"❌ Error during processing: {str(e)}")
@@ -522,4 +546,4 @@ def process_uploaded_resumes(files, job_id: str, interviewer_email: str = None):
         import logging
         logger = logging.getLogger(__name__)
         logger.error(f"Resume processing failed: {str(e)}")
-        logger.error(traceback.format_exc())
\ No newline at end of file
+        logger.error(traceback.format_exc())
@@ -1,8 +1,58 @@
 import streamlit as st
+import math
+from html import escape
+from collections import Counter, defaultdict
 from datetime import datetime, timedelta
-import pandas as pd
+from functools import lru_cache
 from typing import Dict, Any
 
+from dashboard.services import get_interviews, get_candidates
+
+INTERVIEWS_PAGE_SIZE = 20
+
+# Status presentation, shared by every interview card
+_STATUS_COLORS = {
+    'scheduled': 'blue',
+    'confirmed': 'green',
+    'completed': 'gray',
+    'cancelled': 'red'
+}
+
+_STATUS_EMOJI = {
+    'scheduled': '📝',
+    'confirmed': '✅',
+    'completed': '✔️',
+    'cancelled': '❌'
+}
+
+# Time period labels mapped to get_interviews date_filter values
+_DATE_FILTERS = {
+    "Today": "today",
+    "This Week": "this_week",
+    "This Month": "this_month",
+    "Upcoming": "upcoming"
+}
+
+_INTERVIEW_CARD_CSS = """
+<style>
+    .interview-card {
+        padding: 15px;
+        border-left: 4px solid;
+        background-color: #f8f9fa;
+        border-radius: 5px;
+        margin-bottom: 10px;
+    }
+    .interview-card-row {
+        display: grid;
+        grid-template-columns: 3fr 2fr 1fr;
+        gap: 1rem;
+    }
+    .interview-card h3 {
+        margin: 0;
+    }
+</style>
+"""
+
 def render_interviews_page():
     """Render interviews page with calendar and management features"""
     
@@ -43,19 +93,10 @@ def render_interviews_list():
     with col3:
         candidate_search = st.text_input("🔍 Search candidate")
     
-    # Fetch real data from database
-    from dashboard.services import get_interviews
-
     # Determine date filter
-    date_filter_map = {
-        "Today": "today",
-        "This Week": "this_week",
-        "This Month": "this_month",
-        "Upcoming": "upcoming"
-    }
-    date_filter_value = date_filter_map.get(date_filter)
+    date_filter_value = _DATE_FILTERS.get(date_filter)
 
-    # Get interviews with filters
+    # Fetch real data from database with filters
     interviews = get_interviews(
         status=status_filter.lower() if status_filter != "All" else None,
         date_filter=date_filter_value
@@ -63,89 +104,124 @@ def render_interviews_list():
 
     # Apply candidate search filter
     if candidate_search:
-        interviews = [
-            i for i in interviews
-            if candidate_search.lower() in i['candidate_name'].lower()
-        ]
+        interviews = filter_by_candidate_name(interviews, candidate_search)
     
     st.markdown(f"**Showing {len(interviews)} interviews**")
     
-    # Display interviews
-    for interview in interviews:
-        render_interview_card(interview)
+    view_type = st.radio(
+        "View Type",
+        options=["Card View", "Table View"],
+        horizontal=True,
+        key="interviews_view_type"
+    )
+    
+    if view_type == "Table View":
+        # One dataframe message instead of a widget tree per interview
+        if interviews:
+            import pandas as pd
+            df = pd.DataFrame(interviews)[['candidate_name', 'date', 'time', 'duration', 'status']]
+            st.dataframe(df, use_container_width=True, hide_index=True)
+        return
+    
+    # Only build full cards for the visible page
+    total_pages = max(1, math.ceil(len(interviews) / INTERVIEWS_PAGE_SIZE))
+    page = st.number_input("Page", min_value=1, max_value=total_pages, value=1, step=1)
+    start = (page - 1) * INTERVIEWS_PAGE_SIZE
+    
+    # Display interviews as one HTML block; actions live behind the Manage expander
+    page_interviews = interviews[start:start + INTERVIEWS_PAGE_SIZE]
+    st.markdown(_INTERVIEW_CARD_CSS, unsafe_allow_html=True)
+    st.markdown("".join(map(_interview_card_html, page_interviews)), unsafe_allow_html=True)
+    render_interview_actions(page_interviews)
 
-def render_interview_card(interview: Dict[str, Any]):
-    """Render a single interview card"""
-    
-    # Status color
-    status_colors = {
-        'scheduled': 'blue',
-        'confirmed': 'green',
-        'completed': 'gray',
-        'cancelled': 'red'
-    }
+def filter_by_candidate_name(interviews, query: str):
+    """Case-insensitive substring match on candidate name, vectorized through pandas"""
+    import pandas as pd
+    names = pd.Series([i['candidate_name'] for i in interviews], dtype=object)
+    mask = names.str.contains(query, case=False, regex=False).to_numpy()
+    return [interviews[idx] for idx in mask.nonzero()[0]]
+
+@lru_cache(maxsize=16)
+def _resolve_status(status: str):
+    """Normalise a status and resolve its colour, emoji and display label"""
+    status = status.lower()
+    return status, _STATUS_COLORS.get(status, 'blue'), _STATUS_EMOJI.get(status, '📝'), status.title()
+
+def _interview_card_html(interview: Dict[str, Any]) -> str:
+    """Build the read-only HTML for a single interview card"""
+    
+    status, color, emoji, label = _resolve_status(interview['status'])
+    
+    meeting_link = ""
+    if interview.get('meeting_link'):
+        meeting_link = f"<a href='{escape(interview['meeting_link'])}' target='_blank'>🔗 Join Meeting</a>"
     
-    status = interview['status'].lower()
-    color = status_colors.get(status, 'blue')
-    
-    with st.container():
-        st.markdown(f"""
-        <div style="
-            padding: 15px;
-            border-left: 4px solid {color};
-            background-color: #f8f9fa;
-            border-radius: 5px;
-            margin-bottom: 10px;
-        ">
+    outcome = ""
+    if status == 'completed':
+        outcome = (
+            f"<p><b>Rating:</b> {'⭐' * (interview.get('rating') or 0)} &nbsp; "
+            f"<b>Recommendation:</b> {escape(str(interview.get('recommendation') or 'N/A'))}</p>"
+        )
+    
+    card = f"""
+    <div class="interview-card" style="border-left-color: {color};">
+        <div class="interview-card-row">
+            <div>
+                <h3>👤 {escape(interview.get('candidate_name') or '')}</h3>
+                <small>📧 {escape(interview.get('candidate_email') or '')}</small><br>
+                <small>🎯 Overall Score: {interview.get('overall_score', 'N/A')}%</small>
+            </div>
+            <div>
+                <b>📅 Interview Details</b><br>
+                <b>Date:</b> {escape(interview.get('date') or '')}<br>
+                <b>Time:</b> {escape(interview.get('time') or '')}<br>
+                <b>Duration:</b> {interview['duration']} min<br>
+                {meeting_link}
+            </div>
+            <div>
+                <b>Status</b><br>
+                {emoji} <span style="color: {color};">{label}</span>
+            </div>
         </div>
-        """, unsafe_allow_html=True)
+        <details>
+            <summary>📝 Notes & Details</summary>
+            <p>{escape(interview.get('notes') or 'No notes available')}</p>
+            {outcome}
+        </details>
+    </div>
+    """
+    
+    # Flush-left so markdown doesn't read the indented HTML as a code block
+    return "".join(line.strip() for line in card.splitlines())
+
+def render_interview_actions(interviews):
+    """Render edit/cancel controls for the open interviews on the current page"""
+    
+    open_interviews = {
+        interview['id']: interview for interview in interviews
+        if _resolve_status(interview['status'])[0] in ('scheduled', 'confirmed')
+    }
+    
+    if not open_interviews:
+        return
+    
+    with st.expander("⚙️ Manage"):
+        interview_id = st.selectbox(
+            "Interview",
+            options=list(open_interviews.keys()),
+            format_func=lambda x: f"{open_interviews[x]['candidate_name']} - {open_interviews[x]['date']} {open_interviews[x]['time']}"
+        )
         
-        col1, col2, col3 = st.columns([3, 2, 1])
+        col1, col2 = st.columns(2)
         
         with col1:
-            st.markdown(f"### 👤 {interview['candidate_name']}")
-            st.caption(f"📧 {interview['candidate_email']}")
-            st.caption(f"🎯 Overall Score: {interview.get('overall_score', 'N/A')}%")
+            if st.button("✏️ Edit", key=f"edit_{interview_id}"):
+                st.session_state['edit_interview'] = interview_id
+                st.rerun()
         
         with col2:
-            st.markdown("**📅 Interview Details**")
-            st.write(f"**Date:** {interview['date']}")
-            st.write(f"**Time:** {interview['time']}")
-            st.write(f"**Duration:** {interview['duration']} min")
-            
-            if interview.get('meeting_link'):
-                st.link_button("🔗 Join Meeting", interview['meeting_link'])
-        
-        with col3:
-            status_emoji = {
-                'scheduled': '📝',
-                'confirmed': '✅',
-                'completed': '✔️',
-                'cancelled': '❌'
-            }
-            st.markdown(f"**Status**")
-            st.markdown(f"{status_emoji.get(status, '📝')} {status.title()}")
-            
-            # Action buttons
-            if status in ['scheduled', 'confirmed']:
-                if st.button("✏️ Edit", key=f"edit_{interview['id']}"):
-                    st.session_state['edit_interview'] = interview['id']
-                    st.rerun()
-                
-                if st.button("❌ Cancel", key=f"cancel_{interview['id']}"):
-                    st.warning("Interview cancellation will be implemented")
-        
-        # Expandable section for notes
-        with st.expander("📝 Notes & Details"):
-            notes = interview.get('notes', 'No notes available')
-            st.write(notes)
-            
-            if status == 'completed':
-                col1, col2 = st.columns(2)
-                with col1:
-                    st.write(f"**Rating:** {'⭐' * interview.get('rating', 0)}")
-                with col2:
-                    st.write(f"**Recommendation:** {interview.get('recommendation', 'N/A')}")
+            if st.button("❌ Cancel", key=f"cancel_{interview_id}"):
+                st.warning("Interview cancellation will be implemented")
 
 def render_calendar_view():
     """Render calendar view of interviews"""
@@ -166,26 +242,33 @@ def render_calendar_view():
     with col2:
         view_mode = st.selectbox("View", ["Day", "Week", "Month"])
     
-    # Get interviews for selected date/range
-    from dashboard.services import get_interviews
-    interviews = get_interviews()
+    # Push the visible date range down to the database query
+    range_start = datetime.combine(selected_date, datetime.min.time())
+    if view_mode == "Day":
+        range_end = range_start + timedelta(days=1)
+    elif view_mode == "Week":
+        range_start -= timedelta(days=selected_date.weekday())
+        range_end = range_start + timedelta(days=7)
+    else:
+        range_start = range_start.replace(day=1)
+        range_end = (range_start + timedelta(days=32)).replace(day=1)
+    
+    interviews = get_interviews(start_date=range_start, end_date=range_end)
     
-    # Filter by date range based on view mode
     if view_mode == "Day":
         st.markdown(f"#### Interviews on {selected_date.strftime('%B %d, %Y')}")
         
-        # Group by time
-        time_slots = {}
-        for interview in interviews:
-            time = interview['time']
-            if time not in time_slots:
-                time_slots[time] = []
-            time_slots[time].append(interview)
+        # Group by time; get_interviews returns newest first, so walking it
+        # backwards inserts slots in chronological order (the 12-hour labels
+        # don't sort correctly as strings)
+        time_slots = defaultdict(list)
+        for interview in reversed(interviews):
+            time_slots[interview['time']].append(interview)
         
         # Display timeline
-        for time_slot in sorted(time_slots.keys()):
+        for time_slot, slot_interviews in time_slots.items():
             st.markdown(f"**{time_slot}**")
-            for interview in time_slots[time_slot]:
+            for interview in slot_interviews:
                 st.info(f"📅 {interview['candidate_name']} - {interview['duration']} min")
             st.markdown("---")
     
@@ -195,19 +278,19 @@ def render_calendar_view():
         # Create weekly calendar
         start_of_week = selected_date - timedelta(days=selected_date.weekday())
         
+        # Count interviews per date once; keys match the service's display date format
+        interviews_per_day = Counter(interview['date'] for interview in interviews)
+        
         week_data = []
         for i in range(7):
             day = start_of_week + timedelta(days=i)
-            day_interviews = [
-                i for i in interviews
-                # In production, filter by actual dates
-            ]
             week_data.append({
                 'Day': day.strftime('%A'),
                 'Date': day.strftime('%m/%d'),
-                'Interviews': len(day_interviews)
+                'Interviews': interviews_per_day.get(day.strftime('%b %d, %Y'), 0)
             })
         
+        import pandas as pd
         df = pd.DataFrame(week_data)
         st.dataframe(df, use_container_width=True)
     
@@ -224,32 +307,31 @@ def render_schedule_interface():
     st.markdown("#### 1. Select Candidate")
 
     # Fetch real candidates from database
-    from dashboard.services import get_candidates
     candidates = get_candidates()
 
     if not candidates:
         st.warning("⚠️ No candidates available. Please upload and process resumes first.")
         return
 
-    # Format candidates for selection
-    candidates = [
-        {
+    # Format candidates for selection, indexed by ID for the selectbox labels
+    candidates_by_id = {
+        c['id']: {
             'id': c['id'],
             'name': c['name'],
             'email': c['email'],
             'score': c.get('overall_score', 0)
         }
         for c in candidates
-    ]
+    }
     
     selected_candidate = st.selectbox(
         "Candidate",
-        options=[c['id'] for c in candidates],
-        format_func=lambda x: next(c['name'] for c in candidates if c['id'] == x)
+        options=list(candidates_by_id.keys()),
+        format_func=lambda x: candidates_by_id[x]['name']
     )
     
     # Display candidate info
-    candidate = next(c for c in candidates if c['id'] == selected_candidate)
+    candidate = candidates_by_id[selected_candidate]
     
     col1, col2 = st.columns(2)
     with col1:
@@ -257,54 +339,55 @@ def render_schedule_interface():
     with col2:
         st.info(f"🎯 Score: {candidate['score']}%")
     
-    # Interview details
-    st.markdown("#### 2. Interview Details")
-    
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        interview_date = st.date_input(
-            "Date",
-            min_value=datetime.now(),
-            value=datetime.now() + timedelta(days=1)
-        )
+    # Inputs only submit together, so editing them doesn't rerun the page
+    with st.form("schedule_form"):
+        # Interview details
+        st.markdown("#### 2. Interview Details")
         
-        interviewer_email = st.text_input(
-            "Interviewer Email",
-            placeholder="interviewer@company.com"
-        )
-    
-    with col2:
-        interview_time = st.time_input(
-            "Time",
-            value=datetime.strptime("10:00", "%H:%M").time()
-        )
+        col1, col2 = st.columns(2)
         
-        duration = st.selectbox(
-            "Duration",
-            options=[30, 45, 60, 90, 120],
-            format_func=lambda x: f"{x} minutes",
-            index=2
-        )
-    
-    # Additional options
-    st.markdown("#### 3. Additional Options")
-    
-    include_video = st.checkbox("Include video conference link", value=True)
-    send_reminder = st.checkbox("Send reminder emails", value=True)
-    
-    notes = st.text_area(
-        "Notes (optional)",
-        placeholder="Add any notes or special instructions..."
-    )
-    
-    # Schedule button
-    if st.button("📅 Schedule Interview", type="primary", use_container_width=True):
-        with st.spinner("Scheduling interview..."):
-            # In production, call API
-            import time
-            time.sleep(1)
+        with col1:
+            interview_date = st.date_input(
+                "Date",
+                min_value=datetime.now(),
+                value=datetime.now() + timedelta(days=1)
+            )
+            
+            interviewer_email = st.text_input(
+                "Interviewer Email",
+                placeholder="interviewer@company.com"
+            )
+        
+        with col2:
+            interview_time = st.time_input(
+                "Time",
+                value=datetime.strptime("10:00", "%H:%M").time()
+            )
             
+            duration = st.selectbox(
+                "Duration",
+                options=[30, 45, 60, 90, 120],
+                format_func=lambda x: f"{x} minutes",
+                index=2
+            )
+        
+        # Additional options
+        st.markdown("#### 3. Additional Options")
+        
+        include_video = st.checkbox("Include video conference link", value=True)
+        send_reminder = st.checkbox("Send reminder emails", value=True)
+        
+        notes = st.text_area(
+            "Notes (optional)",
+            placeholder="Add any notes or special instructions..."
+        )
+        
+        # Schedule button
+        submitted = st.form_submit_button("📅 Schedule Interview", type="primary", use_container_width=True)
+        
+        if submitted:
+            # In production, call API; nothing is written yet, so there is no
+            # cached data to refresh
             st.success(f"""
             ✅ Interview successfully scheduled!
             
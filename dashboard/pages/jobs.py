@@ -3,10 +3,23 @@ Jobs page for managing job descriptions
 """
 
 import streamlit as st
-import json
-from pathlib import Path
+import orjson
 from datetime import datetime
 
+from storage.job_store import load_jobs, save_job
+
+
+@st.cache_data
+def _job_json(job_id: str, _job: dict) -> bytes:
+    """Serialize a job for download once per job ID (``_job`` is not hashed)"""
+    return orjson.dumps(_job, option=orjson.OPT_INDENT_2)
+
+
+def _parse_lines(text: str) -> list:
+    """Split text-area input into stripped, non-empty lines"""
+    return [line for line in map(str.strip, text.splitlines()) if line]
+
+
 def render_jobs_page():
     """Render jobs management page"""
     
@@ -192,10 +205,10 @@ def render_create_job():
                 st.error("Please add at least one required skill")
             else:
                 # Parse lists
-                responsibilities = [r.strip() for r in responsibilities_text.split('\n') if r.strip()]
-                required_skills = [s.strip() for s in required_skills_text.split('\n') if s.strip()]
-                preferred_skills = [s.strip() for s in preferred_skills_text.split('\n') if s.strip()]
-                values = [v.strip() for v in values_text.split('\n') if v.strip()]
+                responsibilities = _parse_lines(responsibilities_text)
+                required_skills = _parse_lines(required_skills_text)
+                preferred_skills = _parse_lines(preferred_skills_text)
+                values = _parse_lines(values_text)
                 
                 # Create job description object
                 job_data = {
@@ -242,38 +255,14 @@ def render_create_job():
 
 
 def save_job_description(job_data):
-    """Save job description to file"""
-    # Create directory if it doesn't exist
-    jobs_dir = Path("data/jobs")
-    jobs_dir.mkdir(parents=True, exist_ok=True)
-    
-    # Save individual job
-    job_file = jobs_dir / f"{job_data['id']}.json"
-    with open(job_file, 'w') as f:
-        json.dump(job_data, f, indent=2)
-    
-    # Update jobs list
-    jobs_list_file = jobs_dir / "jobs_list.json"
-    
-    if jobs_list_file.exists():
-        with open(jobs_list_file, 'r') as f:
-            jobs_list = json.load(f)
-    else:
-        jobs_list = []
-    
-    # Update or add job
-    job_exists = False
-    for i, job in enumerate(jobs_list):
-        if job['id'] == job_data['id']:
-            jobs_list[i] = job_data
-            job_exists = True
-            break
-    
-    if not job_exists:
-        jobs_list.append(job_data)
+    """Save a new or updated job description"""
+    save_job(job_data)
     
-    with open(jobs_list_file, 'w') as f:
-        json.dump(jobs_list, f, indent=2)
+    # load_jobs() notices the log changed on its own; drop the other caches
+    # so the download buttons and other pages see the new job
+    _job_json.clear()
+    from dashboard.services import refresh_data
+    refresh_data()
 
 
 def render_active_jobs():
@@ -281,17 +270,10 @@ def render_active_jobs():
     
     st.subheader("Active Job Descriptions")
     
-    jobs_list_file = Path("data/jobs/jobs_list.json")
-    
-    if not jobs_list_file.exists():
-        st.info("No job descriptions created yet. Create one in the 'Create New Job' tab!")
-        return
-    
-    with open(jobs_list_file, 'r') as f:
-        jobs = json.load(f)
+    jobs = load_jobs()
     
     if not jobs:
-        st.info("No job descriptions found.")
+        st.info("No job descriptions created yet. Create one in the 'Create New Job' tab!")
         return
     
     # Display jobs in cards
@@ -320,29 +302,22 @@ def render_job_details():
     
     st.subheader("Job Description Details")
     
-    jobs_list_file = Path("data/jobs/jobs_list.json")
-    
-    if not jobs_list_file.exists():
-        st.info("No job descriptions available.")
-        return
-    
-    with open(jobs_list_file, 'r') as f:
-        jobs = json.load(f)
+    jobs = load_jobs()
     
     if not jobs:
-        st.info("No jobs found.")
+        st.info("No job descriptions available.")
         return
     
-    # Job selector
-    job_titles = {job['id']: job['title'] for job in jobs}
+    # Index jobs by ID once so the selector and lookup share it
+    jobs_by_id = {job['id']: job for job in jobs}
     selected_job_id = st.selectbox(
         "Select Job",
-        options=list(job_titles.keys()),
-        format_func=lambda x: job_titles[x]
+        options=list(jobs_by_id.keys()),
+        format_func=lambda x: jobs_by_id[x]['title']
     )
     
     # Find selected job
-    selected_job = next((job for job in jobs if job['id'] == selected_job_id), None)
+    selected_job = jobs_by_id.get(selected_job_id)
     
     if selected_job:
         # Display job details
@@ -357,17 +332,14 @@ def render_job_details():
         
         with col1:
             st.markdown("### Required Skills")
-            for skill in selected_job['requirements']['required_skills']:
-                st.markdown(f"- ✅ {skill}")
+            st.markdown("\n".join(f"- ✅ {skill}" for skill in selected_job['requirements']['required_skills']))
             
             st.markdown("### Responsibilities")
-            for resp in selected_job['responsibilities']:
-                st.markdown(f"- {resp}")
+            st.markdown("\n".join(f"- {resp}" for resp in selected_job['responsibilities']))
         
         with col2:
             st.markdown("### Preferred Skills")
-            for skill in selected_job['requirements'].get('preferred_skills', []):
-                st.markdown(f"- ⭐ {skill}")
+            st.markdown("\n".join(f"- ⭐ {skill}" for skill in selected_job['requirements'].get('preferred_skills', [])))
             
             st.markdown("### Company Culture")
             culture = selected_job.get('company_culture', {})
@@ -376,10 +348,9 @@ def render_job_details():
             st.write(f"**Innovation Focus:** {'Yes' if culture.get('innovation_focus') else 'No'}")
         
         # Download as JSON
-        if st.button("📥 Download Job Description"):
-            st.download_button(
-                label="Download JSON",
-                data=json.dumps(selected_job, indent=2),
-                file_name=f"{selected_job['id']}.json",
-                mime="application/json"
-            )
\ No newline at end of file
+        st.download_button(
+            label="📥 Download Job Description",
+            data=_job_json(selected_job['id'], selected_job),
+            file_name=f"{selected_job['id']}.json",
+            mime="application/json"
+        )
\ No newline at end of file
@@ -5,15 +5,21 @@ Services package for data fetching
 from .data_service import (
     get_jobs,
     get_candidates,
+    get_candidate_by_id,
     get_interviews,
     get_metrics,
-    get_recent_activities
+    get_recent_activities,
+    refresh_data
 )
+from .evaluation_service import save_evaluation_results
 
 __all__ = [
     'get_jobs',
     'get_candidates',
+    'get_candidate_by_id',
     'get_interviews',
     'get_metrics',
-    'get_recent_activities'
+    'get_recent_activities',
+    'refresh_data',
+    'save_evaluation_results'
 ]
@@ -5,32 +5,49 @@ This module provides a unified interface for fetching data from both
 the SQLite database and JSON files used by the dashboard.
 """
 
-import json
-from pathlib import Path
+import streamlit as st
 from datetime import datetime, timedelta
 from typing import List, Dict, Any, Optional
-from sqlalchemy import create_engine, func
+from sqlalchemy import (
+    create_engine, event, func, select, case, and_, lambda_stmt,
+    literal, null, type_coerce, union_all, desc, true, DateTime
+)
 from sqlalchemy.orm import sessionmaker
-import sys
-
-# Add project root to path
-project_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(project_root))
+from sqlalchemy.pool import QueuePool
 
 from storage.database import (
     Base, JobModel, CandidateModel,
     EvaluationModel, InterviewModel
 )
+from storage.job_store import load_jobs, JOBS_SNAPSHOT_FILE, JOBS_LOG_FILE
 from config import config
 
-# Database setup
-engine = create_engine(config.DATABASE_URL, connect_args={'check_same_thread': False})
+# Database setup - one pooled engine shared by every Streamlit session/thread
+_is_sqlite = config.DATABASE_URL.startswith('sqlite')
+engine = create_engine(
+    config.DATABASE_URL,
+    poolclass=QueuePool,
+    pool_size=config.DB_POOL_SIZE,
+    max_overflow=config.DB_MAX_OVERFLOW,
+    pool_pre_ping=True,
+    connect_args={'check_same_thread': False} if _is_sqlite else {}
+)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+if _is_sqlite:
+    @event.listens_for(engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        """Use WAL so dashboard reads don't block on the evaluation writer"""
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.close()
+
 def get_db_session():
-    """Get database session"""
+    """Get database session (use as a context manager so it is always closed)"""
     return SessionLocal()
 
+@st.cache_data(ttl=config.DASHBOARD_CACHE_TTL, show_spinner=False)
 def get_jobs(status: Optional[str] = None) -> List[Dict[str, Any]]:
     """
     Get jobs from JSON files (preferred) or database
@@ -41,13 +58,10 @@ def get_jobs(status: Optional[str] = None) -> List[Dict[str, Any]]:
     Returns:
         List of job dictionaries
     """
-    # Try to get from JSON files first (used by dashboard)
-    jobs_list_file = Path("data/jobs/jobs_list.json")
-
-    if jobs_list_file.exists():
+    # Try to get from the job store first (used by dashboard)
+    if JOBS_SNAPSHOT_FILE.exists() or JOBS_LOG_FILE.exists():
         try:
-            with open(jobs_list_file, 'r') as f:
-                jobs = json.load(f)
+            jobs = load_jobs()
 
             # Filter by status if provided
             if status:
@@ -59,39 +73,125 @@ def get_jobs(status: Optional[str] = None) -> List[Dict[str, Any]]:
 
     # Fallback to database
     try:
-        session = get_db_session()
-        query = session.query(JobModel)
-
-        if status:
-            query = query.filter(JobModel.status == status)
-
-        db_jobs = query.all()
-
-        jobs = []
-        for job in db_jobs:
-            jobs.append({
-                'id': job.id,
-                'title': job.title,
-                'department': job.department,
-                'location': job.location,
-                'status': job.status,
-                'requirements': job.requirements,
-                'salary_min': job.salary_min,
-                'salary_max': job.salary_max,
-                'created_at': job.created_at.isoformat() if job.created_at else None
-            })
-
-        session.close()
+        with get_db_session() as session:
+            query = session.query(JobModel)
+
+            if status:
+                query = query.filter(JobModel.status == status)
+
+            db_jobs = query.all()
+
+            jobs = [
+                {
+                    'id': job.id,
+                    'title': job.title,
+                    'department': job.department,
+                    'location': job.location,
+                    'status': job.status,
+                    'requirements': job.requirements,
+                    'salary_min': job.salary_min,
+                    'salary_max': job.salary_max,
+                    'created_at': job.created_at.isoformat() if job.created_at else None
+                }
+                for job in db_jobs
+            ]
         return jobs
     except Exception as e:
         print(f"Error fetching jobs from database: {e}")
         return []
 
+# Columns needed for candidate listings; the bulky profile JSON is only loaded for the detail view
+_CANDIDATE_LIST_COLUMNS = (
+    CandidateModel.id,
+    CandidateModel.personal_info,
+    CandidateModel.status,
+    CandidateModel.job_id,
+    CandidateModel.created_at,
+    EvaluationModel.overall_score,
+    EvaluationModel.skills_match_score,
+    EvaluationModel.cultural_fit_score,
+    EvaluationModel.experience_score,
+    EvaluationModel.tier,
+    EvaluationModel.recommendation,
+    EvaluationModel.skills_evaluation,
+    EvaluationModel.cultural_evaluation
+)
+
+def _candidate_to_dict(candidate: Any, evaluation: Optional[Any], include_profile: bool = True) -> Dict[str, Any]:
+    """
+    Flatten a candidate and its (optional) evaluation into a dashboard dictionary
+
+    Args:
+        candidate: CandidateModel instance or a row with the listing columns
+        evaluation: EvaluationModel instance, a row with the listing columns, or None
+        include_profile: Include work experience, education and skills under 'candidate_data'
+
+    Returns:
+        Candidate dictionary with evaluation data
+    """
+    personal_info = candidate.personal_info or {}
+
+    candidate_dict = {
+        'id': candidate.id,
+        'name': personal_info.get('name', 'Unknown'),
+        'email': personal_info.get('email', ''),
+        'phone': personal_info.get('phone', ''),
+        'status': candidate.status,
+        'job_id': candidate.job_id,
+        'created_at': candidate.created_at.isoformat() if candidate.created_at else None
+    }
+
+    if include_profile:
+        candidate_dict['candidate_data'] = {
+            'personal_info': candidate.personal_info,
+            'work_experience': candidate.work_experience,
+            'education': candidate.education,
+            'skills': candidate.skills
+        }
+
+    # Add evaluation data if available
+    if evaluation:
+        skills_evaluation = evaluation.skills_evaluation or {}
+        cultural_evaluation = evaluation.cultural_evaluation or {}
+
+        candidate_dict.update({
+            'overall_score': evaluation.overall_score,
+            'skills_match_score': evaluation.skills_match_score,
+            'cultural_fit_score': evaluation.cultural_fit_score,
+            'experience_score': evaluation.experience_score,
+            'tier': evaluation.tier,
+            'recommendation': evaluation.recommendation,
+            'matched_skills': skills_evaluation.get('matched_skills', []),
+            'missing_skills': skills_evaluation.get('missing_skills', []),
+            'skills_rationale': skills_evaluation.get('rationale', ''),
+            'cultural_rationale': cultural_evaluation.get('rationale', ''),
+            'dimensional_scores': cultural_evaluation.get('dimensional_scores', {})
+        })
+    else:
+        # Default values if no evaluation
+        candidate_dict.update({
+            'overall_score': 0,
+            'skills_match_score': 0,
+            'cultural_fit_score': 0,
+            'experience_score': 0,
+            'tier': 'not_evaluated',
+            'recommendation': 'pending',
+            'matched_skills': [],
+            'missing_skills': [],
+            'skills_rationale': '',
+            'cultural_rationale': '',
+            'dimensional_scores': {}
+        })
+
+    return candidate_dict
+
+@st.cache_data(ttl=config.DASHBOARD_CACHE_TTL, show_spinner=False)
 def get_candidates(
     job_id: Optional[str] = None,
     tier: Optional[str] = None,
     min_score: Optional[float] = None,
-    status: Optional[str] = None
+    status: Optional[str] = None,
+    limit: Optional[int] = None
 ) -> List[Dict[str, Any]]:
     """
     Get candidates from database with optional filters
@@ -101,90 +201,46 @@ def get_candidates(
         tier: Filter by tier (strong_match, moderate_match, weak_match)
         min_score: Minimum overall score
         status: Filter by status
+        limit: Only return the top N candidates by overall score
 
     Returns:
         List of candidate dictionaries with evaluation data
     """
     try:
-        session = get_db_session()
-
-        # Query candidates with their evaluations
-        query = session.query(CandidateModel, EvaluationModel).join(
-            EvaluationModel,
-            CandidateModel.id == EvaluationModel.candidate_id,
-            isouter=True
-        )
-
-        # Apply filters
-        if job_id:
-            query = query.filter(CandidateModel.job_id == job_id)
-
-        if status:
-            query = query.filter(CandidateModel.status == status)
-
-        if tier:
-            query = query.filter(EvaluationModel.tier == tier)
-
-        if min_score:
-            query = query.filter(EvaluationModel.overall_score >= min_score)
-
-        results = query.all()
-
-        candidates = []
-        for candidate, evaluation in results:
-            candidate_dict = {
-                'id': candidate.id,
-                'name': candidate.personal_info.get('name', 'Unknown') if candidate.personal_info else 'Unknown',
-                'email': candidate.personal_info.get('email', '') if candidate.personal_info else '',
-                'phone': candidate.personal_info.get('phone', '') if candidate.personal_info else '',
-                'status': candidate.status,
-                'job_id': candidate.job_id,
-                'created_at': candidate.created_at.isoformat() if candidate.created_at else None,
-                'candidate_data': {
-                    'personal_info': candidate.personal_info,
-                    'work_experience': candidate.work_experience,
-                    'education': candidate.education,
-                    'skills': candidate.skills
-                }
-            }
-
-            # Add evaluation data if available
-            if evaluation:
-                candidate_dict.update({
-                    'overall_score': evaluation.overall_score,
-                    'skills_match_score': evaluation.skills_match_score,
-                    'cultural_fit_score': evaluation.cultural_fit_score,
-                    'experience_score': evaluation.experience_score,
-                    'tier': evaluation.tier,
-                    'recommendation': evaluation.recommendation,
-                    'matched_skills': evaluation.skills_evaluation.get('matched_skills', []) if evaluation.skills_evaluation else [],
-                    'missing_skills': evaluation.skills_evaluation.get('missing_skills', []) if evaluation.skills_evaluation else [],
-                    'skills_rationale': evaluation.skills_evaluation.get('rationale', '') if evaluation.skills_evaluation else '',
-                    'cultural_rationale': evaluation.cultural_evaluation.get('rationale', '') if evaluation.cultural_evaluation else '',
-                    'dimensional_scores': evaluation.cultural_evaluation.get('dimensional_scores', {}) if evaluation.cultural_evaluation else {}
-                })
-            else:
-                # Default values if no evaluation
-                candidate_dict.update({
-                    'overall_score': 0,
-                    'skills_match_score': 0,
-                    'cultural_fit_score': 0,
-                    'experience_score': 0,
-                    'tier': 'not_evaluated',
-                    'recommendation': 'pending',
-                    'matched_skills': [],
-                    'missing_skills': [],
-                    'skills_rationale': '',
-                    'cultural_rationale': '',
-                    'dimensional_scores': {}
-                })
-
-            candidates.append(candidate_dict)
-
-        session.close()
-
-        # Sort by overall score descending
-        candidates.sort(key=lambda x: x.get('overall_score', 0), reverse=True)
+        with get_db_session() as session:
+            # Query only the listing columns of candidates and their evaluations.
+            # lambda_stmt caches the statement construction per filter combination;
+            # the filter values captured by each lambda are sent as bound parameters
+            stmt = lambda_stmt(lambda: select(*_CANDIDATE_LIST_COLUMNS).outerjoin(
+                EvaluationModel,
+                CandidateModel.id == EvaluationModel.candidate_id
+            ))
+
+            # Apply filters
+            if job_id:
+                stmt += lambda s: s.where(CandidateModel.job_id == job_id)
+
+            if status:
+                stmt += lambda s: s.where(CandidateModel.status == status)
+
+            if tier:
+                stmt += lambda s: s.where(EvaluationModel.tier == tier)
+
+            if min_score:
+                stmt += lambda s: s.where(EvaluationModel.overall_score >= min_score)
+
+            # Best matches first; candidates without an evaluation go last
+            stmt += lambda s: s.order_by(EvaluationModel.overall_score.desc().nulls_last())
+
+            if limit:
+                stmt += lambda s: s.limit(limit)
+
+            # overall_score is NOT NULL on evaluations, so NULL means no evaluation row
+            rows = session.execute(stmt, execution_options={'yield_per': 500})
+            candidates = [
+                _candidate_to_dict(row, row if row.overall_score is not None else None, include_profile=False)
+                for row in rows
+            ]
 
         return candidates
 
@@ -192,10 +248,38 @@ def get_candidates(
         print(f"Error fetching candidates: {e}")
         return []
 
+def get_candidate_by_id(candidate_id: str) -> Optional[Dict[str, Any]]:
+    """
+    Get a single candidate by primary key
+
+    Args:
+        candidate_id: Candidate ID
+
+    Returns:
+        Candidate dictionary with evaluation data, or None if not found
+    """
+    try:
+        with get_db_session() as session:
+            result = session.query(CandidateModel, EvaluationModel).join(
+                EvaluationModel,
+                CandidateModel.id == EvaluationModel.candidate_id,
+                isouter=True
+            ).filter(CandidateModel.id == candidate_id).first()
+
+            candidate = _candidate_to_dict(*result) if result else None
+        return candidate
+
+    except Exception as e:
+        print(f"Error fetching candidate {candidate_id}: {e}")
+        return None
+
+@st.cache_data(ttl=config.DASHBOARD_CACHE_TTL, show_spinner=False)
 def get_interviews(
     candidate_id: Optional[str] = None,
     status: Optional[str] = None,
-    date_filter: Optional[str] = None
+    date_filter: Optional[str] = None,
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None
 ) -> List[Dict[str, Any]]:
     """
     Get interviews from database with optional filters
@@ -204,75 +288,94 @@ def get_interviews(
         candidate_id: Filter by candidate ID
         status: Filter by status
         date_filter: Filter by date range (today, this_week, this_month, upcoming)
+        start_date: Only interviews starting at or after this time
+        end_date: Only interviews starting before this time
 
     Returns:
         List of interview dictionaries
     """
     try:
-        session = get_db_session()
-
-        query = session.query(InterviewModel)
-
-        # Apply filters
-        if candidate_id:
-            query = query.filter(InterviewModel.candidate_id == candidate_id)
+        with get_db_session() as session:
+            # Join the evaluation score in the same query instead of one lookup per interview
+            stmt = lambda_stmt(lambda: select(InterviewModel, EvaluationModel.overall_score).outerjoin(
+                EvaluationModel,
+                EvaluationModel.candidate_id == InterviewModel.candidate_id
+            ))
 
-        if status:
-            query = query.filter(InterviewModel.status == status)
+            # Apply filters
+            if candidate_id:
+                stmt += lambda s: s.where(InterviewModel.candidate_id == candidate_id)
 
-        # Apply date filters
-        now = datetime.now()
-        if date_filter == 'today':
-            query = query.filter(
-                func.date(InterviewModel.start_time) == now.date()
-            )
-        elif date_filter == 'this_week':
-            start_of_week = now - timedelta(days=now.weekday())
-            end_of_week = start_of_week + timedelta(days=7)
-            query = query.filter(
-                InterviewModel.start_time >= start_of_week,
-                InterviewModel.start_time < end_of_week
-            )
-        elif date_filter == 'this_month':
-            query = query.filter(
-                func.strftime('%Y-%m', InterviewModel.start_time) == now.strftime('%Y-%m')
-            )
-        elif date_filter == 'upcoming':
-            query = query.filter(InterviewModel.start_time >= now)
-
-        db_interviews = query.order_by(InterviewModel.start_time.desc()).all()
-
-        interviews = []
-        for interview in db_interviews:
-            # Join with candidate to get evaluation score
-            candidate = session.query(CandidateModel).filter_by(id=interview.candidate_id).first()
-            evaluation = session.query(EvaluationModel).filter_by(candidate_id=interview.candidate_id).first()
-
-            interviews.append({
-                'id': interview.id,
-                'candidate_name': interview.candidate_name,
-                'candidate_email': interview.candidate_email,
-                'candidate_phone': interview.candidate_phone,
-                'overall_score': evaluation.overall_score if evaluation else None,
-                'date': interview.start_time.strftime('%b %d, %Y') if interview.start_time else '',
-                'time': interview.start_time.strftime('%I:%M %p') if interview.start_time else '',
-                'duration': interview.duration_minutes,
-                'status': interview.status,
-                'meeting_link': interview.video_conference_link,
-                'notes': interview.notes,
-                'interviewer': interview.interviewer_email,
-                'interview_type': interview.interview_type,
-                'rating': interview.rating,
-                'recommendation': interview.recommendation
-            })
-
-        session.close()
+            if status:
+                stmt += lambda s: s.where(InterviewModel.status == status)
+
+            # Apply date filters
+            # Half-open ranges on the raw column so the start_time index can be used.
+            # Bounds are computed outside the lambdas so they stay bound parameters
+            now = datetime.now()
+            if date_filter == 'today':
+                today_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
+                tomorrow_start = today_start + timedelta(days=1)
+                stmt += lambda s: s.where(
+                    InterviewModel.start_time >= today_start,
+                    InterviewModel.start_time < tomorrow_start
+                )
+            elif date_filter == 'this_week':
+                start_of_week = now - timedelta(days=now.weekday())
+                end_of_week = start_of_week + timedelta(days=7)
+                stmt += lambda s: s.where(
+                    InterviewModel.start_time >= start_of_week,
+                    InterviewModel.start_time < end_of_week
+                )
+            elif date_filter == 'this_month':
+                month_start = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+                next_month = (month_start + timedelta(days=32)).replace(day=1)
+                stmt += lambda s: s.where(
+                    InterviewModel.start_time >= month_start,
+                    InterviewModel.start_time < next_month
+                )
+            elif date_filter == 'upcoming':
+                stmt += lambda s: s.where(InterviewModel.start_time >= now)
+
+            # Absolute bounds, half-open so adjacent ranges don't overlap
+            if start_date:
+                stmt += lambda s: s.where(InterviewModel.start_time >= start_date)
+
+            if end_date:
+                stmt += lambda s: s.where(InterviewModel.start_time < end_date)
+
+            stmt += lambda s: s.order_by(InterviewModel.start_time.desc())
+            db_interviews = session.execute(stmt).all()
+            if not db_interviews:
+                return []
+
+            interviews = [
+                {
+                    'id': interview.id,
+                    'candidate_name': interview.candidate_name,
+                    'candidate_email': interview.candidate_email,
+                    'candidate_phone': interview.candidate_phone,
+                    'overall_score': overall_score,
+                    'date': interview.start_time.strftime('%b %d, %Y') if interview.start_time else '',
+                    'time': interview.start_time.strftime('%I:%M %p') if interview.start_time else '',
+                    'duration': interview.duration_minutes,
+                    'status': interview.status,
+                    'meeting_link': interview.video_conference_link,
+                    'notes': interview.notes,
+                    'interviewer': interview.interviewer_email,
+                    'interview_type': interview.interview_type,
+                    'rating': interview.rating,
+                    'recommendation': interview.recommendation
+                }
+                for interview, overall_score in db_interviews
+            ]
         return interviews
 
     except Exception as e:
         print(f"Error fetching interviews: {e}")
         return []
 
+@st.cache_data(ttl=config.DASHBOARD_CACHE_TTL, show_spinner=False)
 def get_metrics() -> Dict[str, Any]:
     """
     Get dashboard metrics from database
@@ -281,46 +384,57 @@ def get_metrics() -> Dict[str, Any]:
         Dictionary with various metrics
     """
     try:
-        session = get_db_session()
-
-        # Count candidates
-        total_candidates = session.query(func.count(CandidateModel.id)).scalar()
-
-        # Count by status
-        new_candidates_count = session.query(func.count(CandidateModel.id)).filter(
-            CandidateModel.created_at >= datetime.now() - timedelta(days=7)
-        ).scalar()
-
-        # Count strong matches
-        strong_matches = session.query(func.count(EvaluationModel.id)).filter(
-            EvaluationModel.tier == 'strong_match'
-        ).scalar()
-
-        # Count interviews
-        interviews_count = session.query(func.count(InterviewModel.id)).filter(
-            InterviewModel.status.in_(['scheduled', 'confirmed'])
-        ).scalar()
-
-        # Count today's interviews
-        today_interviews = session.query(func.count(InterviewModel.id)).filter(
-            func.date(InterviewModel.start_time) == datetime.now().date()
-        ).scalar()
-
-        # Average match score
-        avg_score_result = session.query(func.avg(EvaluationModel.overall_score)).scalar()
-        avg_match_score = float(avg_score_result) if avg_score_result else 0.0
-
-        # Count active jobs
-        active_jobs = session.query(func.count(JobModel.id)).filter(
-            JobModel.status == 'active'
-        ).scalar()
-
-        # Count qualified candidates (above threshold)
-        qualified_candidates = session.query(func.count(EvaluationModel.id)).filter(
-            EvaluationModel.overall_score >= config.SKILLS_MATCH_THRESHOLD
-        ).scalar()
-
-        session.close()
+        # Aggregates only, so run on a plain Core connection without an ORM Session
+        with engine.connect() as connection:
+            now = datetime.now()
+            seven_days_ago = now - timedelta(days=7)
+            today_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
+            tomorrow_start = today_start + timedelta(days=1)
+
+            # One aggregate subquery per table, cross-joined into a single one-row SELECT.
+            # This is one round trip on one pooled connection, so there are no separate
+            # COUNT queries left to fan out to worker threads
+            candidate_stats = select(
+                func.count(CandidateModel.id).label('total_candidates'),
+                func.count(case((CandidateModel.created_at >= seven_days_ago, 1))).label('new_candidates')
+            ).subquery()
+
+            evaluation_stats = select(
+                func.count(case((EvaluationModel.tier == 'strong_match', 1))).label('strong_matches'),
+                func.avg(EvaluationModel.overall_score).label('avg_score'),
+                func.count(case((EvaluationModel.overall_score >= config.SKILLS_MATCH_THRESHOLD, 1))).label('qualified_candidates')
+            ).subquery()
+
+            interview_stats = select(
+                func.count(case((InterviewModel.status.in_(['scheduled', 'confirmed']), 1))).label('interviews_count'),
+                func.count(case((and_(InterviewModel.start_time >= today_start, InterviewModel.start_time < tomorrow_start), 1))).label('today_interviews')
+            ).subquery()
+
+            job_stats = select(
+                func.count(case((JobModel.status == 'active', 1))).label('active_jobs')
+            ).subquery()
+
+            # Each subquery is exactly one row, so join them ON TRUE; spelling the
+            # cross join out keeps SQLAlchemy from warning about a cartesian product
+            all_stats = (
+                candidate_stats
+                .join(evaluation_stats, true())
+                .join(interview_stats, true())
+                .join(job_stats, true())
+            )
+            stats = connection.execute(
+                select(candidate_stats, evaluation_stats, interview_stats, job_stats)
+                .select_from(all_stats)
+            ).one()
+
+            total_candidates = stats.total_candidates
+            new_candidates_count = stats.new_candidates
+            strong_matches = stats.strong_matches
+            interviews_count = stats.interviews_count
+            today_interviews = stats.today_interviews
+            avg_match_score = float(stats.avg_score) if stats.avg_score else 0.0
+            active_jobs = stats.active_jobs
+            qualified_candidates = stats.qualified_candidates
 
         return {
             'total_candidates': total_candidates or 0,
@@ -361,6 +475,39 @@ def get_metrics() -> Dict[str, Any]:
             'agent_accuracy': 0
         }
 
+def _activity_to_dict(row: Any, now: datetime) -> Dict[str, Any]:
+    """Format one row of the recent-activity UNION ALL as a feed entry"""
+    time_diff = now - row.ts
+
+    if row.type == 'job':
+        days_ago = int(time_diff.total_seconds() / 86400)
+        time_str = f"{days_ago} days ago" if days_ago > 0 else "Today"
+    else:
+        hours_ago = int(time_diff.total_seconds() / 3600)
+        time_str = f"{hours_ago} hours ago" if hours_ago > 0 else "Just now"
+
+    if row.type == 'candidate':
+        return {
+            'time': time_str,
+            'activity': 'New candidate application',
+            'details': f"{row.name or 'Unknown'} applied for {row.job_id}",
+            'type': 'info'
+        }
+    if row.type == 'interview':
+        return {
+            'time': time_str,
+            'activity': 'Interview scheduled',
+            'details': f"{row.name} - {row.start_time.strftime('%b %d, %Y')}",
+            'type': 'success'
+        }
+    return {
+        'time': time_str,
+        'activity': 'New job created',
+        'details': f"{row.name} position opened",
+        'type': 'info'
+    }
+
+@st.cache_data(ttl=config.DASHBOARD_CACHE_TTL, show_spinner=False)
 def get_recent_activities(limit: int = 10) -> List[Dict[str, Any]]:
     """
     Get recent activity logs
@@ -372,66 +519,55 @@ def get_recent_activities(limit: int = 10) -> List[Dict[str, Any]]:
         List of activity dictionaries
     """
     try:
-        session = get_db_session()
-
-        activities = []
-
-        # Get recent candidates
-        recent_candidates = session.query(CandidateModel).order_by(
-            CandidateModel.created_at.desc()
-        ).limit(3).all()
-
-        for candidate in recent_candidates:
-            time_diff = datetime.now() - candidate.created_at
-            hours_ago = int(time_diff.total_seconds() / 3600)
-            time_str = f"{hours_ago} hours ago" if hours_ago > 0 else "Just now"
-
-            activities.append({
-                'time': time_str,
-                'activity': 'New candidate application',
-                'details': f"{candidate.personal_info.get('name', 'Unknown')} applied for {candidate.job_id}",
-                'type': 'info'
-            })
-
-        # Get recent interviews
-        recent_interviews = session.query(InterviewModel).order_by(
-            InterviewModel.created_at.desc()
-        ).limit(3).all()
-
-        for interview in recent_interviews:
-            time_diff = datetime.now() - interview.created_at
-            hours_ago = int(time_diff.total_seconds() / 3600)
-            time_str = f"{hours_ago} hours ago" if hours_ago > 0 else "Just now"
-
-            activities.append({
-                'time': time_str,
-                'activity': 'Interview scheduled',
-                'details': f"{interview.candidate_name} - {interview.start_time.strftime('%b %d, %Y')}",
-                'type': 'success'
-            })
-
-        # Get recent jobs
-        recent_jobs = session.query(JobModel).order_by(
-            JobModel.created_at.desc()
-        ).limit(2).all()
-
-        for job in recent_jobs:
-            time_diff = datetime.now() - job.created_at
-            days_ago = int(time_diff.total_seconds() / 86400)
-            time_str = f"{days_ago} days ago" if days_ago > 0 else "Today"
-
-            activities.append({
-                'time': time_str,
-                'activity': 'New job created',
-                'details': f"{job.title} position opened",
-                'type': 'info'
-            })
-
-        session.close()
-
-        # Sort by time and limit
-        return activities[:limit]
+        with get_db_session() as session:
+            # Same column shape for every source so they merge with one UNION ALL
+            candidate_events = select(
+                literal('candidate').label('type'),
+                CandidateModel.created_at.label('ts'),
+                CandidateModel.personal_info['name'].as_string().label('name'),
+                CandidateModel.job_id.label('job_id'),
+                type_coerce(null(), DateTime).label('start_time')
+            )
+            interview_events = select(
+                literal('interview'),
+                InterviewModel.created_at,
+                InterviewModel.candidate_name,
+                InterviewModel.job_id,
+                InterviewModel.start_time
+            )
+            job_events = select(
+                literal('job'),
+                JobModel.created_at,
+                JobModel.title,
+                JobModel.id,
+                type_coerce(null(), DateTime)
+            )
+
+            rows = session.execute(
+                union_all(candidate_events, interview_events, job_events)
+                .order_by(desc('ts'))
+                .limit(limit)
+            ).all()
+
+        if not rows:
+            return []
+
+        now = datetime.now()
+        activities = [_activity_to_dict(row, now) for row in rows]
+
+        return activities
 
     except Exception as e:
         print(f"Error fetching activities: {e}")
         return []
+
+def refresh_data():
+    """
+    Clear cached query results so the next read sees fresh writes
+
+    Dashboard write paths call this after committing. Writes made by other
+    processes (the API, manually_process_resume.py) can't reach this cache
+    and show up once DASHBOARD_CACHE_TTL expires.
+    """
+    for cached in (get_jobs, get_candidates, get_interviews, get_metrics, get_recent_activities):
+        cached.clear()
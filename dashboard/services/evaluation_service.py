@@ -0,0 +1,117 @@
+"""
+Evaluation service for persisting orchestrator results
+
+Kept apart from the dashboard pages so the save path can be used and tested
+without importing any UI code.
+"""
+
+import logging
+import uuid
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from storage.database import (
+    SessionLocal, CandidateModel, EvaluationModel, InterviewModel
+)
+
+logger = logging.getLogger(__name__)
+
+
+def save_evaluation_results(
+    result: Dict[str, Any],
+    resumes: List[Dict[str, Any]],
+    job_id: str,
+    interviewer_email: Optional[str] = None
+):
+    """
+    Persist ranked candidates, evaluations and scheduled interviews
+
+    The batch is saved in one transaction. Every ranked candidate must carry
+    the resume_index of its source resume; if one is missing, ValueError is
+    raised and the whole batch is rolled back rather than attributing the
+    candidate to the first resume.
+    """
+
+    session = SessionLocal()
+    try:
+        for candidate_result in result.get('ranked_candidates', []):
+            candidate_id = str(uuid.uuid4())
+
+            # Resolve the source resume once; a missing index is a bug, not a default
+            resume_index = candidate_result.get('resume_index')
+            if resume_index is None:
+                raise ValueError(
+                    f"Missing resume_index for candidate {candidate_result.get('name', 'Unknown')}"
+                )
+            resume = resumes[resume_index]
+
+            # Create candidate record
+            candidate = CandidateModel(
+                id=candidate_id,
+                job_id=job_id,
+                personal_info=candidate_result.get('candidate_data', {}).get('personal_info', {}),
+                work_experience=candidate_result.get('candidate_data', {}).get('work_experience', []),
+                education=candidate_result.get('candidate_data', {}).get('education', []),
+                skills=candidate_result.get('matched_skills', []),
+                resume_filename=resume['filename'],
+                resume_path=resume['file_path'],
+                status='screening',
+                created_at=datetime.now()
+            )
+            session.add(candidate)
+
+            # Create evaluation record
+            evaluation = EvaluationModel(
+                id=str(uuid.uuid4()),
+                candidate_id=candidate_id,
+                job_id=job_id,
+                overall_score=candidate_result.get('overall_score', 0) / 100.0,
+                skills_match_score=candidate_result.get('skills_match_score', 0) / 100.0,
+                cultural_fit_score=candidate_result.get('cultural_fit_score', 0) / 100.0,
+                experience_score=candidate_result.get('experience_score', 0) / 100.0,
+                recommendation=candidate_result.get('recommendation', 'weak_match'),
+                tier=candidate_result.get('tier', 'weak_match'),
+                skills_evaluation={
+                    'matched_skills': candidate_result.get('matched_skills', []),
+                    'missing_skills': candidate_result.get('missing_skills', []),
+                    'rationale': candidate_result.get('skills_rationale', '')
+                },
+                cultural_evaluation={
+                    'rationale': candidate_result.get('cultural_rationale', ''),
+                    'dimensional_scores': candidate_result.get('dimensional_scores', {})
+                },
+                evaluated_at=datetime.now(),
+                created_at=datetime.now()
+            )
+            session.add(evaluation)
+
+        # Save scheduled interviews to database
+        scheduled_interviews = result.get('scheduled_interviews', [])
+        for interview_data in scheduled_interviews:
+            interview = InterviewModel(
+                id=str(uuid.uuid4()),
+                candidate_id=interview_data.get('candidate_id'),
+                job_id=job_id,
+                candidate_name=interview_data.get('candidate_name'),
+                candidate_email=interview_data.get('candidate_email'),
+                start_time=datetime.fromisoformat(interview_data.get('start_time')),
+                end_time=datetime.fromisoformat(interview_data.get('end_time')),
+                duration_minutes=60,
+                interviewer_email=interviewer_email,
+                status=interview_data.get('status', 'scheduled'),
+                calendar_event_id=interview_data.get('calendar_event_id'),
+                created_at=datetime.now()
+            )
+            session.add(interview)
+
+        session.commit()
+
+        logger.info(f"Successfully saved {len(result.get('ranked_candidates', []))} candidates to database")
+        if scheduled_interviews:
+            logger.info(f"Successfully saved {len(scheduled_interviews)} scheduled interviews to database")
+
+    except Exception:
+        session.rollback()
+        raise
+    finally:
+        session.close()
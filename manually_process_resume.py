@@ -4,19 +4,16 @@ Manually process a resume and save to database
 Use this if the Streamlit upload isn't working
 """
 
-import sys
 import asyncio
-from pathlib import Path
 from datetime import datetime
 import uuid
 
-# Add project root to path
-sys.path.insert(0, str(Path(__file__).parent))
+from sqlalchemy import insert
 
 from tools.pdf_parser import extract_text_from_pdf
 from agents.orchestrator_agent import OrchestratorAgent
 from storage.database import SessionLocal, CandidateModel, EvaluationModel, Base, engine
-import json
+from storage.job_store import load_jobs
 
 def manually_process_and_save():
     """Process a resume and save to database"""
@@ -41,10 +38,7 @@ def manually_process_and_save():
 
     # Step 2: Load job description
     print("\n[2/5] Loading job description...")
-    jobs_file = Path("data/jobs/jobs_list.json")
-
-    with open(jobs_file, 'r') as f:
-        jobs = json.load(f)
+    jobs = load_jobs()
 
     job_data = jobs[0]  # First job - Fullstack Developer
     job_id = job_data['id']
@@ -94,53 +88,59 @@ def manually_process_and_save():
     session = SessionLocal()
 
     try:
-        saved_count = 0
+        now = datetime.now()
+        candidate_rows = []
+        evaluation_rows = []
 
         for candidate_result in result.get('ranked_candidates', []):
             candidate_id = str(uuid.uuid4())
 
-            # Create candidate record
-            candidate = CandidateModel(
-                id=candidate_id,
-                job_id=job_id,
-                personal_info=candidate_result.get('candidate_data', {}).get('personal_info', {}),
-                work_experience=candidate_result.get('candidate_data', {}).get('work_experience', []),
-                education=candidate_result.get('candidate_data', {}).get('education', []),
-                skills=candidate_result.get('matched_skills', []),
-                resume_filename=resumes[0]['filename'],
-                resume_path=resumes[0]['file_path'],
-                status='screening',
-                created_at=datetime.now()
-            )
-            session.add(candidate)
-
-            # Create evaluation record
-            evaluation = EvaluationModel(
-                id=str(uuid.uuid4()),
-                candidate_id=candidate_id,
-                job_id=job_id,
-                overall_score=candidate_result.get('overall_score', 0) / 100.0,
-                skills_match_score=candidate_result.get('skills_match_score', 0) / 100.0,
-                cultural_fit_score=candidate_result.get('cultural_fit_score', 0) / 100.0,
-                experience_score=candidate_result.get('experience_score', 0) / 100.0,
-                recommendation=candidate_result.get('recommendation', 'weak_match'),
-                tier=candidate_result.get('tier', 'weak_match'),
-                skills_evaluation={
+            # Candidate record
+            candidate_rows.append({
+                'id': candidate_id,
+                'job_id': job_id,
+                'personal_info': candidate_result.get('candidate_data', {}).get('personal_info', {}),
+                'work_experience': candidate_result.get('candidate_data', {}).get('work_experience', []),
+                'education': candidate_result.get('candidate_data', {}).get('education', []),
+                'skills': candidate_result.get('matched_skills', []),
+                'resume_filename': resumes[0]['filename'],
+                'resume_path': resumes[0]['file_path'],
+                'status': 'screening',
+                'created_at': now
+            })
+
+            # Evaluation record
+            evaluation_rows.append({
+                'id': str(uuid.uuid4()),
+                'candidate_id': candidate_id,
+                'job_id': job_id,
+                'overall_score': candidate_result.get('overall_score', 0) / 100.0,
+                'skills_match_score': candidate_result.get('skills_match_score', 0) / 100.0,
+                'cultural_fit_score': candidate_result.get('cultural_fit_score', 0) / 100.0,
+                'experience_score': candidate_result.get('experience_score', 0) / 100.0,
+                'recommendation': candidate_result.get('recommendation', 'weak_match'),
+                'tier': candidate_result.get('tier', 'weak_match'),
+                'skills_evaluation': {
                     'matched_skills': candidate_result.get('matched_skills', []),
                     'missing_skills': candidate_result.get('missing_skills', []),
                     'rationale': candidate_result.get('skills_rationale', '')
                 },
-                cultural_evaluation={
+                'cultural_evaluation': {
                     'rationale': candidate_result.get('cultural_rationale', ''),
                     'dimensional_scores': candidate_result.get('dimensional_scores', {})
                 },
-                evaluated_at=datetime.now(),
-                created_at=datetime.now()
-            )
-            session.add(evaluation)
-            saved_count += 1
+                'evaluated_at': now,
+                'created_at': now
+            })
+
+        # Core executemany inserts skip per-object ORM bookkeeping;
+        # candidates go first so the evaluations' foreign keys resolve
+        if candidate_rows:
+            session.execute(insert(CandidateModel), candidate_rows)
+            session.execute(insert(EvaluationModel), evaluation_rows)
 
         session.commit()
+        saved_count = len(candidate_rows)
         print(f"✅ Saved {saved_count} candidate(s) to database")
 
         # Show details
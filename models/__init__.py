@@ -8,11 +8,15 @@ from .candidate import (
     WorkExperience,
     Education,
     Certification,
-    Project
+    Project,
+    LanguageProficiency,
+    Volunteering,
+    CandidateSummary
 )
 from .job_description import (
     JobDescription,
     JobRequirements,
+    LanguageRequirement,
     CompanyCulture
 )
 from .evaluation_result import (
@@ -26,6 +30,8 @@ from .interview_slot import (
     InterviewStatus,
     Attendee
 )
+from .slot_index import SlotIndex
+from ._clock import batch_clock
 
 __all__ = [
     # Candidate models
@@ -35,10 +41,14 @@ __all__ = [
     'Education',
     'Certification',
     'Project',
+    'LanguageProficiency',
+    'Volunteering',
+    'CandidateSummary',
     
     # Job models
     'JobDescription',
     'JobRequirements',
+    'LanguageRequirement',
     'CompanyCulture',
     
     # Evaluation models
@@ -50,5 +60,9 @@ __all__ = [
     # Interview models
     'InterviewSlot',
     'InterviewStatus',
-    'Attendee'
+    'Attendee',
+    'SlotIndex',
+    
+    # Helpers
+    'batch_clock'
 ]
\ No newline at end of file
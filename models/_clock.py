@@ -0,0 +1,38 @@
+"""
+Shared clock for model timestamp defaults
+
+Batch ingest constructs many models in a tight loop; inside batch_clock()
+every created_at/evaluated_at default reuses one timestamp instead of
+reading the system clock per object.
+"""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime
+from typing import Iterator, Optional
+
+_NOW_CACHE: ContextVar[Optional[datetime]] = ContextVar('now', default=None)
+
+
+def _now() -> datetime:
+    """Return the batch timestamp if one is set, otherwise the current time"""
+    return _NOW_CACHE.get() or datetime.now()
+
+
+@contextmanager
+def batch_clock(now: Optional[datetime] = None) -> Iterator[datetime]:
+    """
+    Pin the timestamp used by model default factories
+
+    Args:
+        now: Timestamp to use (default: current time)
+
+    Yields:
+        The pinned timestamp
+    """
+    now = now or datetime.now()
+    token = _NOW_CACHE.set(now)
+    try:
+        yield now
+    finally:
+        _NOW_CACHE.reset(token)
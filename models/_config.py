@@ -0,0 +1,32 @@
+"""
+Shared pydantic configuration for the data models
+
+Every model defers building its validators and serializers until first use
+rather than at import, so processes that import the models package but only
+touch a few models don't pay to build all of them. The OpenAPI example is
+attached through schema_extra(), which honours ENABLE_OPENAPI_EXAMPLES.
+"""
+
+from typing import Any, Dict
+
+from pydantic import ConfigDict
+
+from ._examples import schema_extra
+
+
+def model_config_for(example: Dict[str, Any], frozen: bool = False) -> ConfigDict:
+    """
+    Build the model_config for a data model
+
+    Args:
+        example: OpenAPI example for the model's JSON schema
+        frozen: Make instances immutable (and hashable)
+
+    Returns:
+        ConfigDict with deferred build and the example attached
+    """
+    return ConfigDict(
+        defer_build=True,
+        frozen=frozen,
+        json_schema_extra=schema_extra(example)
+    )
@@ -0,0 +1,270 @@
+"""
+OpenAPI examples for the data models
+
+Examples are only attached to the model JSON schemas when
+ENABLE_OPENAPI_EXAMPLES is set, so deployments that never serve /docs
+don't carry them in every model config.
+"""
+
+import os
+from typing import Any, Dict, Optional
+
+ENABLE_OPENAPI_EXAMPLES = os.getenv('ENABLE_OPENAPI_EXAMPLES', 'False').lower() == 'true'
+
+
+def schema_extra(example: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Return json_schema_extra for a model, or None when examples are disabled"""
+    return {"example": example} if ENABLE_OPENAPI_EXAMPLES else None
+
+
+# Candidate models
+PERSONAL_INFO_EXAMPLE = {
+    "name": "John Doe",
+    "email": "john.doe@email.com",
+    "phone": "+1-555-0123",
+    "location": "San Francisco, CA",
+    "linkedin": "https://linkedin.com/in/johndoe",
+    "github": "https://github.com/johndoe"
+}
+
+WORK_EXPERIENCE_EXAMPLE = {
+    "company": "Tech Corp",
+    "role": "Senior Software Engineer",
+    "start_date": "2020-01",
+    "end_date": "Present",
+    "duration_months": 48,
+    "location": "San Francisco, CA",
+    "responsibilities": [
+        "Led team of 5 engineers",
+        "Architected microservices infrastructure"
+    ],
+    "achievements": [
+        "Reduced deployment time by 60%"
+    ],
+    "technologies": ["Python", "AWS", "Docker", "Kubernetes"],
+    "is_current": True
+}
+
+EDUCATION_EXAMPLE = {
+    "institution": "Massachusetts Institute of Technology",
+    "degree": "Bachelor of Science",
+    "field_of_study": "Computer Science",
+    "graduation_date": "2018-05",
+    "gpa": 3.85,
+    "honors": ["Dean's List", "Summa Cum Laude"],
+    "relevant_coursework": ["Algorithms", "Machine Learning", "Distributed Systems"]
+}
+
+CERTIFICATION_EXAMPLE = {
+    "name": "AWS Certified Solutions Architect",
+    "issuing_organization": "Amazon Web Services",
+    "issue_date": "2023-06",
+    "expiry_date": "2026-06",
+    "credential_id": "AWS-SA-12345",
+    "credential_url": "https://aws.amazon.com/verification/12345"
+}
+
+PROJECT_EXAMPLE = {
+    "name": "E-commerce Platform",
+    "description": "Built a scalable e-commerce platform serving 1M+ users",
+    "role": "Lead Developer",
+    "start_date": "2022-01",
+    "end_date": "2023-06",
+    "technologies": ["React", "Node.js", "PostgreSQL", "Redis"],
+    "url": "https://github.com/johndoe/ecommerce",
+    "highlights": [
+        "Handled 10K concurrent users",
+        "Achieved 99.9% uptime"
+    ]
+}
+
+LANGUAGE_PROFICIENCY_EXAMPLE = {
+    "language": "Spanish",
+    "proficiency": "Fluent"
+}
+
+VOLUNTEERING_EXAMPLE = {
+    "organization": "Code for America",
+    "role": "Volunteer Developer",
+    "start_date": "2021-03",
+    "end_date": "Present",
+    "description": "Built tools for local government services"
+}
+
+CANDIDATE_EXAMPLE = {
+    "id": "candidate_123",
+    "personal_info": {
+        "name": "John Doe",
+        "email": "john.doe@email.com",
+        "phone": "+1-555-0123",
+        "location": "San Francisco, CA"
+    },
+    "work_experience": [
+        {
+            "company": "Tech Corp",
+            "role": "Senior Software Engineer",
+            "start_date": "2020-01",
+            "end_date": "Present",
+            "is_current": True
+        }
+    ],
+    "education": [
+        {
+            "institution": "MIT",
+            "degree": "Bachelor of Science",
+            "field_of_study": "Computer Science",
+            "graduation_date": "2018"
+        }
+    ],
+    "skills": ["Python", "AWS", "Docker", "Kubernetes"],
+    "total_years_experience": 8.5
+}
+
+
+# Evaluation models
+DIMENSIONAL_SCORE_EXAMPLE = {
+    "dimension_name": "Collaboration vs Independence",
+    "score": 0.85,
+    "description": "Measures preference for team collaboration vs autonomous work",
+    "evidence": [
+        "Led cross-functional team of 8 members",
+        "Collaborated with product and design teams"
+    ]
+}
+
+SKILLS_EVALUATION_EXAMPLE = {
+    "overall_match_percentage": 87.5,
+    "required_skills_match": 90.0,
+    "preferred_skills_match": 75.0,
+    "matched_skills": ["Python", "AWS", "Docker", "Kubernetes"],
+    "missing_skills": ["React"],
+    "transferable_skills": ["Angular", "Vue.js"],
+    "bonus_skills": ["Machine Learning", "TensorFlow"],
+    "rationale": "Candidate demonstrates strong technical skills...",
+    "strengths": ["Deep cloud infrastructure experience", "Leadership skills"],
+    "gaps": ["Limited frontend experience"],
+    "confidence_score": 0.92
+}
+
+CULTURAL_FIT_EVALUATION_EXAMPLE = {
+    "overall_cultural_fit_score": 82.0,
+    "dimensional_scores": {
+        "Collaboration": 0.85,
+        "Innovation": 0.80,
+        "Fast-paced": 0.88
+    },
+    "rationale": "Candidate shows strong alignment with company culture...",
+    "evidence": [
+        "Worked in fast-paced startup environments",
+        "Led collaborative cross-functional projects"
+    ],
+    "alignment_areas": ["Team collaboration", "Innovation focus"],
+    "potential_concerns": ["Adaptation to hierarchical structure"],
+    "interview_discussion_points": [
+        "Experience with different organizational structures"
+    ],
+    "confidence_score": 0.85
+}
+
+EVALUATION_RESULT_EXAMPLE = {
+    "candidate_id": "candidate_123",
+    "job_id": "job_001",
+    "overall_score": 87.5,
+    "skills_evaluation": {
+        "overall_match_percentage": 90.0,
+        "matched_skills": ["Python", "AWS", "Docker"],
+        "missing_skills": ["React"],
+        "rationale": "Strong technical match..."
+    },
+    "cultural_evaluation": {
+        "overall_cultural_fit_score": 85.0,
+        "rationale": "Good cultural alignment..."
+    },
+    "recommendation": "strong_match",
+    "tier": "strong_match",
+    "key_highlights": [
+        "8 years of relevant experience",
+        "Strong cloud infrastructure skills"
+    ]
+}
+
+
+# Job models
+LANGUAGE_REQUIREMENT_EXAMPLE = {
+    "language": "English",
+    "level": "Fluent"
+}
+
+JOB_REQUIREMENTS_EXAMPLE = {
+    "required_skills": ["Python", "AWS", "Docker", "Kubernetes"],
+    "preferred_skills": ["React", "TypeScript", "CI/CD"],
+    "required_experience_years": 5,
+    "required_education": "Bachelor's degree in Computer Science or related field",
+    "preferred_certifications": ["AWS Certified Solutions Architect"],
+    "language_requirements": [
+        {"language": "English", "level": "Fluent"}
+    ]
+}
+
+COMPANY_CULTURE_EXAMPLE = {
+    "values": ["Innovation", "Collaboration", "Integrity", "Customer Focus"],
+    "work_style": "Collaborative with autonomy",
+    "team_size": 8,
+    "pace": "Fast-paced",
+    "innovation_focus": True,
+    "collaboration_level": "high",
+    "hierarchy": "flat",
+    "mission_driven": True
+}
+
+JOB_DESCRIPTION_EXAMPLE = {
+    "id": "job_001",
+    "title": "Senior Software Engineer",
+    "department": "Engineering",
+    "location": "San Francisco, CA",
+    "work_location_type": "hybrid",
+    "employment_type": "full_time",
+    "experience_level": "senior",
+    "description": "We are looking for a Senior Software Engineer...",
+    "responsibilities": [
+        "Design and develop scalable applications",
+        "Lead technical discussions",
+        "Mentor junior developers"
+    ],
+    "requirements": {
+        "required_skills": ["Python", "AWS", "Docker"],
+        "preferred_skills": ["React", "TypeScript"],
+        "required_experience_years": 5
+    },
+    "compensation_range": "$120k-$180k",
+    "status": "active"
+}
+
+
+# Interview models
+ATTENDEE_EXAMPLE = {
+    "email": "interviewer@company.com",
+    "name": "John Smith",
+    "role": "interviewer",
+    "is_required": True,
+    "response_status": "accepted"
+}
+
+INTERVIEW_SLOT_EXAMPLE = {
+    "id": "interview_123",
+    "candidate_id": "candidate_456",
+    "job_id": "job_789",
+    "candidate_name": "John Doe",
+    "candidate_email": "john.doe@email.com",
+    "interview_type": "technical",
+    "round_number": 1,
+    "start_time": "2024-12-15T10:00:00Z",
+    "end_time": "2024-12-15T11:00:00Z",
+    "duration_minutes": 60,
+    "interviewer_email": "interviewer@company.com",
+    "interviewer_name": "Jane Smith",
+    "meeting_platform": "google_meet",
+    "video_conference_link": "https://meet.google.com/abc-defg-hij",
+    "status": "scheduled",
+    "focus_areas": ["System design", "Algorithms", "Code quality"]
+}
@@ -1,151 +1,160 @@
-from pydantic import BaseModel, EmailStr, Field, validator
-from typing import List, Optional, Dict, Any
+from pydantic import BaseModel, Field
+from typing import Annotated, List, NamedTuple, Optional, Tuple, Union
 from datetime import date, datetime
 from enum import Enum
+import re
+
+import orjson
+
+from ._clock import _now
+from ._config import model_config_for
+from ._examples import (
+    PERSONAL_INFO_EXAMPLE,
+    WORK_EXPERIENCE_EXAMPLE,
+    EDUCATION_EXAMPLE,
+    CERTIFICATION_EXAMPLE,
+    PROJECT_EXAMPLE,
+    LANGUAGE_PROFICIENCY_EXAMPLE,
+    VOLUNTEERING_EXAMPLE,
+    CANDIDATE_EXAMPLE
+)
+
+
+# Optional string field defaulting to None; one shared annotation for the many
+# such fields below (descriptions are still attached per field)
+OptionalStr = Annotated[Optional[str], Field(default=None)]
+
+# Degree keyword -> level, used to rank education entries
+_DEGREE_LEVELS = {
+    'phd': 5, 'doctorate': 5,
+    'master': 4, 'ms': 4, 'mba': 4, 'ma': 4,
+    'bachelor': 3, 'bs': 3, 'ba': 3,
+    'associate': 2,
+    'diploma': 1
+}
+
+# Full words match as word prefixes ("Masters", "Bachelor's"); abbreviations
+# (optionally with a trailing "c", e.g. "MSc") must be whole words so "ma"
+# doesn't match inside "Diploma" or "Mathematics"
+_DEGREE_PATTERN = re.compile(
+    r'\b(?:(phd|doctorate|master|bachelor|associate|diploma)|(mba|ms|ma|bs|ba)c?\b)'
+)
+
+
+def _degree_level(degree: str) -> int:
+    """Return the hierarchy level of a degree title (0 if unrecognised)"""
+    return max(
+        (_DEGREE_LEVELS[match.group(1) or match.group(2)] for match in _DEGREE_PATTERN.finditer(degree.lower())),
+        default=0
+    )
 
 
 class PersonalInfo(BaseModel):
     """Personal information of the candidate"""
     name: str = Field(..., description="Full name of the candidate")
-    email: EmailStr = Field(..., description="Email address")
-    phone: Optional[str] = Field(None, description="Phone number")
-    location: Optional[str] = Field(None, description="Current location/address")
-    linkedin: Optional[str] = Field(None, description="LinkedIn profile URL")
-    github: Optional[str] = Field(None, description="GitHub profile URL")
-    portfolio: Optional[str] = Field(None, description="Portfolio website URL")
+    # Parsed from resumes, so a basic shape check in pydantic-core is enough;
+    # full EmailStr validation is kept for addresses we actually send to
+    email: str = Field(..., pattern=r'^[^@\s]+@[^@\s]+\.[^@\s]+$', description="Email address")
+    phone: OptionalStr = Field(description="Phone number")
+    location: OptionalStr = Field(description="Current location/address")
+    linkedin: OptionalStr = Field(description="LinkedIn profile URL")
+    github: OptionalStr = Field(description="GitHub profile URL")
+    portfolio: OptionalStr = Field(description="Portfolio website URL")
     
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "name": "John Doe",
-                "email": "john.doe@email.com",
-                "phone": "+1-555-0123",
-                "location": "San Francisco, CA",
-                "linkedin": "https://linkedin.com/in/johndoe",
-                "github": "https://github.com/johndoe"
-            }
-        }
+    model_config = model_config_for(PERSONAL_INFO_EXAMPLE, frozen=True)
 
 
 class WorkExperience(BaseModel):
     """Work experience entry"""
     company: str = Field(..., description="Company name")
     role: str = Field(..., description="Job title/role")
-    start_date: Optional[str] = Field(None, description="Start date (YYYY-MM or YYYY)")
-    end_date: Optional[str] = Field(None, description="End date (YYYY-MM or YYYY), 'Present' if current")
+    start_date: OptionalStr = Field(description="Start date (YYYY-MM or YYYY)")
+    end_date: OptionalStr = Field(description="End date (YYYY-MM or YYYY), 'Present' if current")
     duration_months: Optional[int] = Field(None, description="Duration in months")
-    location: Optional[str] = Field(None, description="Job location")
+    location: OptionalStr = Field(description="Job location")
     responsibilities: List[str] = Field(default_factory=list, description="List of responsibilities")
     achievements: List[str] = Field(default_factory=list, description="Key achievements")
     technologies: List[str] = Field(default_factory=list, description="Technologies used")
     is_current: bool = Field(default=False, description="Is this the current position")
     
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "company": "Tech Corp",
-                "role": "Senior Software Engineer",
-                "start_date": "2020-01",
-                "end_date": "Present",
-                "duration_months": 48,
-                "location": "San Francisco, CA",
-                "responsibilities": [
-                    "Led team of 5 engineers",
-                    "Architected microservices infrastructure"
-                ],
-                "achievements": [
-                    "Reduced deployment time by 60%"
-                ],
-                "technologies": ["Python", "AWS", "Docker", "Kubernetes"],
-                "is_current": True
-            }
-        }
+    model_config = model_config_for(WORK_EXPERIENCE_EXAMPLE, frozen=True)
 
 
 class Education(BaseModel):
     """Education entry"""
     institution: str = Field(..., description="Educational institution name")
     degree: str = Field(..., description="Degree type (BS, MS, PhD, etc.)")
-    field_of_study: Optional[str] = Field(None, description="Major/field of study")
-    graduation_date: Optional[str] = Field(None, description="Graduation date (YYYY-MM or YYYY)")
+    field_of_study: OptionalStr = Field(description="Major/field of study")
+    graduation_date: OptionalStr = Field(description="Graduation date (YYYY-MM or YYYY)")
     gpa: Optional[float] = Field(None, ge=0.0, le=4.0, description="GPA (0.0-4.0 scale)")
     honors: List[str] = Field(default_factory=list, description="Academic honors and awards")
     relevant_coursework: List[str] = Field(default_factory=list, description="Relevant courses")
     
-    @validator('gpa')
-    def validate_gpa(cls, v):
-        if v is not None and (v < 0.0 or v > 4.0):
-            raise ValueError('GPA must be between 0.0 and 4.0')
-        return v
-    
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "institution": "Massachusetts Institute of Technology",
-                "degree": "Bachelor of Science",
-                "field_of_study": "Computer Science",
-                "graduation_date": "2018-05",
-                "gpa": 3.85,
-                "honors": ["Dean's List", "Summa Cum Laude"],
-                "relevant_coursework": ["Algorithms", "Machine Learning", "Distributed Systems"]
-            }
-        }
+    model_config = model_config_for(EDUCATION_EXAMPLE, frozen=True)
 
 
 class Certification(BaseModel):
     """Professional certification"""
     name: str = Field(..., description="Certification name")
     issuing_organization: str = Field(..., description="Organization that issued the certification")
-    issue_date: Optional[str] = Field(None, description="Issue date (YYYY-MM)")
-    expiry_date: Optional[str] = Field(None, description="Expiry date (YYYY-MM)")
-    credential_id: Optional[str] = Field(None, description="Credential ID or license number")
-    credential_url: Optional[str] = Field(None, description="URL to verify credential")
+    issue_date: OptionalStr = Field(description="Issue date (YYYY-MM)")
+    expiry_date: OptionalStr = Field(description="Expiry date (YYYY-MM)")
+    credential_id: OptionalStr = Field(description="Credential ID or license number")
+    credential_url: OptionalStr = Field(description="URL to verify credential")
     
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "name": "AWS Certified Solutions Architect",
-                "issuing_organization": "Amazon Web Services",
-                "issue_date": "2023-06",
-                "expiry_date": "2026-06",
-                "credential_id": "AWS-SA-12345",
-                "credential_url": "https://aws.amazon.com/verification/12345"
-            }
-        }
+    model_config = model_config_for(CERTIFICATION_EXAMPLE, frozen=True)
 
 
 class Project(BaseModel):
     """Project or portfolio item"""
     name: str = Field(..., description="Project name")
     description: str = Field(..., description="Project description")
-    role: Optional[str] = Field(None, description="Role in the project")
-    start_date: Optional[str] = Field(None, description="Start date (YYYY-MM)")
-    end_date: Optional[str] = Field(None, description="End date (YYYY-MM)")
+    role: OptionalStr = Field(description="Role in the project")
+    start_date: OptionalStr = Field(description="Start date (YYYY-MM)")
+    end_date: OptionalStr = Field(description="End date (YYYY-MM)")
     technologies: List[str] = Field(default_factory=list, description="Technologies used")
-    url: Optional[str] = Field(None, description="Project URL or repository")
+    url: OptionalStr = Field(description="Project URL or repository")
     highlights: List[str] = Field(default_factory=list, description="Key highlights or achievements")
     
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "name": "E-commerce Platform",
-                "description": "Built a scalable e-commerce platform serving 1M+ users",
-                "role": "Lead Developer",
-                "start_date": "2022-01",
-                "end_date": "2023-06",
-                "technologies": ["React", "Node.js", "PostgreSQL", "Redis"],
-                "url": "https://github.com/johndoe/ecommerce",
-                "highlights": [
-                    "Handled 10K concurrent users",
-                    "Achieved 99.9% uptime"
-                ]
-            }
-        }
+    model_config = model_config_for(PROJECT_EXAMPLE, frozen=True)
+
+
+class LanguageProficiency(BaseModel):
+    """Spoken/written language and proficiency level"""
+    language: str = Field(..., description="Language name")
+    proficiency: OptionalStr = Field(description="Proficiency level (e.g. Native, Fluent, Conversational)")
+    
+    model_config = model_config_for(LANGUAGE_PROFICIENCY_EXAMPLE, frozen=True)
+
+
+class Volunteering(BaseModel):
+    """Volunteer experience entry"""
+    organization: str = Field(..., description="Organization name")
+    role: OptionalStr = Field(description="Volunteer role")
+    start_date: OptionalStr = Field(description="Start date (YYYY-MM)")
+    end_date: OptionalStr = Field(description="End date (YYYY-MM), 'Present' if ongoing")
+    description: OptionalStr = Field(description="Description of the work")
+    
+    model_config = model_config_for(VOLUNTEERING_EXAMPLE, frozen=True)
+
+
+class CandidateSummary(NamedTuple):
+    """Fixed-shape candidate summary; use _asdict() where a dict is needed"""
+    name: str
+    email: str
+    current_role: Optional[str]
+    current_company: Optional[str]
+    total_experience_years: float
+    highest_degree: Optional[str]
+    institution: Optional[str]
+    top_skills: List[str]
+    certifications_count: int
+    projects_count: int
 
 
 class Candidate(BaseModel):
     """Complete candidate profile"""
-    id: Optional[str] = Field(None, description="Unique candidate identifier")
+    id: OptionalStr = Field(description="Unique candidate identifier")
     personal_info: PersonalInfo = Field(..., description="Personal information")
     
     # Professional background
@@ -167,7 +176,7 @@ class Candidate(BaseModel):
         default_factory=list,
         description="Professional certifications"
     )
-    languages: List[Dict[str, str]] = Field(
+    languages: List[LanguageProficiency] = Field(
         default_factory=list,
         description="Languages and proficiency levels"
     )
@@ -185,20 +194,20 @@ class Candidate(BaseModel):
         default_factory=list,
         description="Awards and recognitions"
     )
-    volunteering: List[Dict[str, Any]] = Field(
+    volunteering: List[Volunteering] = Field(
         default_factory=list,
         description="Volunteer experience"
     )
     
     # Metadata
-    resume_path: Optional[str] = Field(None, description="Path to resume file")
-    resume_filename: Optional[str] = Field(None, description="Original resume filename")
+    resume_path: OptionalStr = Field(description="Path to resume file")
+    resume_filename: OptionalStr = Field(description="Original resume filename")
     created_at: Optional[datetime] = Field(
-        default_factory=datetime.now,
+        default_factory=_now,
         description="Timestamp when candidate was created"
     )
     updated_at: Optional[datetime] = Field(
-        default_factory=datetime.now,
+        default_factory=_now,
         description="Timestamp when candidate was last updated"
     )
     
@@ -210,9 +219,12 @@ class Candidate(BaseModel):
     
     def calculate_total_experience(self) -> float:
         """Calculate total years of experience"""
+        # Work histories are a handful of entries, well below the size where
+        # NumPy's array setup would pay for itself, so a plain sum is fastest
         total_months = sum(
-            exp.duration_months or 0 
+            exp.duration_months
             for exp in self.work_experience
+            if exp.duration_months
         )
         return round(total_months / 12, 1)
     
@@ -221,82 +233,86 @@ class Candidate(BaseModel):
         if not self.work_experience:
             return None
         
-        # Find current position
-        current = [exp for exp in self.work_experience if exp.is_current]
-        if current:
-            return current[0]
+        # Find current position, otherwise the first in list (assumed most recent)
+        return next(
+            (exp for exp in self.work_experience if exp.is_current),
+            self.work_experience[0]
+        )
+    
+    def _scan_work_experience(self) -> Tuple[Optional[WorkExperience], int]:
+        """Find the latest position and total months in one pass over work history"""
+        latest = None
+        total_months = 0
+        for exp in self.work_experience:
+            if latest is None and exp.is_current:
+                latest = exp
+            if exp.duration_months:
+                total_months += exp.duration_months
+        
+        if latest is None and self.work_experience:
+            latest = self.work_experience[0]
         
-        # Otherwise return first in list (assumed to be most recent)
-        return self.work_experience[0]
+        return latest, total_months
     
     def get_highest_education(self) -> Optional[Education]:
         """Get the highest level of education"""
         if not self.education:
             return None
         
-        degree_hierarchy = {
-            'phd': 5, 'doctorate': 5,
-            'master': 4, 'ms': 4, 'mba': 4, 'ma': 4,
-            'bachelor': 3, 'bs': 3, 'ba': 3,
-            'associate': 2,
-            'diploma': 1
-        }
+        # Single pass; ties keep the earliest entry, as max() did
+        highest, highest_level = None, -1
+        for edu in self.education:
+            level = _degree_level(edu.degree)
+            if level > highest_level:
+                highest, highest_level = edu, level
         
-        def get_degree_level(degree: str) -> int:
-            degree_lower = degree.lower()
-            for key, value in degree_hierarchy.items():
-                if key in degree_lower:
-                    return value
-            return 0
-        
-        return max(self.education, key=lambda x: get_degree_level(x.degree))
+        return highest
     
-    def to_summary(self) -> Dict[str, Any]:
+    def to_summary(self) -> 'CandidateSummary':
         """Generate a summary of the candidate"""
-        latest_position = self.get_latest_position()
+        # Prefer the stored value; otherwise sum the work history in the same
+        # pass that finds the latest position
+        total_years = self.total_years_experience
+        if total_years is None:
+            latest_position, total_months = self._scan_work_experience()
+            total_years = round(total_months / 12, 1)
+        else:
+            latest_position = self.get_latest_position()
         highest_education = self.get_highest_education()
         
-        return {
-            'name': self.personal_info.name,
-            'email': self.personal_info.email,
-            'current_role': latest_position.role if latest_position else None,
-            'current_company': latest_position.company if latest_position else None,
-            'total_experience_years': self.calculate_total_experience(),
-            'highest_degree': highest_education.degree if highest_education else None,
-            'institution': highest_education.institution if highest_education else None,
-            'top_skills': self.skills[:10],
-            'certifications_count': len(self.certifications),
-            'projects_count': len(self.projects)
-        }
+        return CandidateSummary(
+            name=self.personal_info.name,
+            email=self.personal_info.email,
+            current_role=latest_position.role if latest_position else None,
+            current_company=latest_position.company if latest_position else None,
+            total_experience_years=total_years,
+            highest_degree=highest_education.degree if highest_education else None,
+            institution=highest_education.institution if highest_education else None,
+            top_skills=self.skills[:10],
+            certifications_count=len(self.certifications),
+            projects_count=len(self.projects)
+        )
+    
+    def to_summary_json(self) -> bytes:
+        """Serialize the candidate summary straight to JSON bytes"""
+        return orjson.dumps(self.to_summary()._asdict())
+    
+    @classmethod
+    def from_json(cls, raw: Union[str, bytes]) -> 'Candidate':
+        """
+        Build a candidate from a raw JSON payload
+        
+        Parser output often carries keys the model doesn't define; only the
+        known top-level fields are handed to validation.
+        
+        Args:
+            raw: JSON document describing a candidate
+            
+        Returns:
+            Validated Candidate
+        """
+        data = orjson.loads(raw)
+        projected = {key: data[key] for key in cls.model_fields if key in data}
+        return cls.model_validate(projected)
     
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "id": "candidate_123",
-                "personal_info": {
-                    "name": "John Doe",
-                    "email": "john.doe@email.com",
-                    "phone": "+1-555-0123",
-                    "location": "San Francisco, CA"
-                },
-                "work_experience": [
-                    {
-                        "company": "Tech Corp",
-                        "role": "Senior Software Engineer",
-                        "start_date": "2020-01",
-                        "end_date": "Present",
-                        "is_current": True
-                    }
-                ],
-                "education": [
-                    {
-                        "institution": "MIT",
-                        "degree": "Bachelor of Science",
-                        "field_of_study": "Computer Science",
-                        "graduation_date": "2018"
-                    }
-                ],
-                "skills": ["Python", "AWS", "Docker", "Kubernetes"],
-                "total_years_experience": 8.5
-            }
-        }
\ No newline at end of file
+    model_config = model_config_for(CANDIDATE_EXAMPLE)
\ No newline at end of file
@@ -1,7 +1,19 @@
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, Field, field_validator, model_validator
 from typing import List, Optional, Dict, Any
 from datetime import datetime
 from enum import Enum
+import sys
+
+import orjson
+
+from ._clock import _now
+from ._config import model_config_for
+from ._examples import (
+    DIMENSIONAL_SCORE_EXAMPLE,
+    SKILLS_EVALUATION_EXAMPLE,
+    CULTURAL_FIT_EVALUATION_EXAMPLE,
+    EVALUATION_RESULT_EXAMPLE
+)
 
 
 class RecommendationType(str, Enum):
@@ -22,18 +34,7 @@ class DimensionalScore(BaseModel):
         description="Evidence from resume supporting this score"
     )
     
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "dimension_name": "Collaboration vs Independence",
-                "score": 0.85,
-                "description": "Measures preference for team collaboration vs autonomous work",
-                "evidence": [
-                    "Led cross-functional team of 8 members",
-                    "Collaborated with product and design teams"
-                ]
-            }
-        }
+    model_config = model_config_for(DIMENSIONAL_SCORE_EXAMPLE, frozen=True)
 
 
 class SkillsEvaluation(BaseModel):
@@ -109,22 +110,13 @@ class SkillsEvaluation(BaseModel):
         description="Confidence in the evaluation (0.0-1.0)"
     )
     
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "overall_match_percentage": 87.5,
-                "required_skills_match": 90.0,
-                "preferred_skills_match": 75.0,
-                "matched_skills": ["Python", "AWS", "Docker", "Kubernetes"],
-                "missing_skills": ["React"],
-                "transferable_skills": ["Angular", "Vue.js"],
-                "bonus_skills": ["Machine Learning", "TensorFlow"],
-                "rationale": "Candidate demonstrates strong technical skills...",
-                "strengths": ["Deep cloud infrastructure experience", "Leadership skills"],
-                "gaps": ["Limited frontend experience"],
-                "confidence_score": 0.92
-            }
-        }
+    @field_validator('matched_skills', 'missing_skills', 'bonus_skills')
+    @classmethod
+    def intern_skill_names(cls, v: List[str]) -> List[str]:
+        """Intern skill names so the same few hundred skills share one copy across evaluations"""
+        return [sys.intern(skill) for skill in v]
+    
+    model_config = model_config_for(SKILLS_EVALUATION_EXAMPLE)
 
 
 class CulturalFitEvaluation(BaseModel):
@@ -180,28 +172,7 @@ class CulturalFitEvaluation(BaseModel):
         description="Confidence in the evaluation (0.0-1.0)"
     )
     
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "overall_cultural_fit_score": 82.0,
-                "dimensional_scores": {
-                    "Collaboration": 0.85,
-                    "Innovation": 0.80,
-                    "Fast-paced": 0.88
-                },
-                "rationale": "Candidate shows strong alignment with company culture...",
-                "evidence": [
-                    "Worked in fast-paced startup environments",
-                    "Led collaborative cross-functional projects"
-                ],
-                "alignment_areas": ["Team collaboration", "Innovation focus"],
-                "potential_concerns": ["Adaptation to hierarchical structure"],
-                "interview_discussion_points": [
-                    "Experience with different organizational structures"
-                ],
-                "confidence_score": 0.85
-            }
-        }
+    model_config = model_config_for(CULTURAL_FIT_EVALUATION_EXAMPLE)
 
 
 class EvaluationResult(BaseModel):
@@ -248,7 +219,7 @@ class EvaluationResult(BaseModel):
         ...,
         description="Overall recommendation"
     )
-    tier: str = Field(
+    tier: RecommendationType = Field(
         ...,
         description="Candidate tier (strong_match, moderate_match, weak_match)"
     )
@@ -279,7 +250,7 @@ class EvaluationResult(BaseModel):
     
     # Metadata
     evaluated_at: datetime = Field(
-        default_factory=datetime.now,
+        default_factory=_now,
         description="Timestamp when evaluation was performed"
     )
     evaluated_by: Optional[str] = Field(
@@ -298,14 +269,13 @@ class EvaluationResult(BaseModel):
         description="Weights used in overall score calculation"
     )
     
-    @validator('recommendation')
-    def validate_recommendation_matches_tier(cls, v, values):
+    @model_validator(mode='after')
+    def validate_recommendation_matches_tier(self):
         """Ensure recommendation matches tier"""
-        if 'tier' in values:
-            tier = values['tier']
-            if tier == 'strong_match' and v not in [RecommendationType.STRONG_MATCH]:
-                raise ValueError('Tier and recommendation must align')
-        return v
+        # Enum members are singletons, so identity is enough here
+        if self.tier is RecommendationType.STRONG_MATCH and self.recommendation is not RecommendationType.STRONG_MATCH:
+            raise ValueError('Tier and recommendation must align')
+        return self
     
     def to_summary(self) -> Dict[str, Any]:
         """Generate a summary of the evaluation"""
@@ -316,11 +286,15 @@ class EvaluationResult(BaseModel):
             'skills_match': round(self.skills_evaluation.overall_match_percentage, 2),
             'cultural_fit': round(self.cultural_evaluation.overall_cultural_fit_score, 2),
             'recommendation': self.recommendation.value,
-            'tier': self.tier,
+            'tier': self.tier.value,
             'key_highlights': self.key_highlights[:3],
             'evaluated_at': self.evaluated_at.isoformat()
         }
     
+    def to_summary_json(self) -> bytes:
+        """Serialize the evaluation summary straight to JSON bytes"""
+        return orjson.dumps(self.to_summary())
+    
     def meets_threshold(self, skills_threshold: float = 70.0, cultural_threshold: float = 65.0) -> bool:
         """Check if candidate meets minimum thresholds"""
         return (
@@ -328,27 +302,30 @@ class EvaluationResult(BaseModel):
             self.cultural_evaluation.overall_cultural_fit_score >= cultural_threshold
         )
     
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "candidate_id": "candidate_123",
-                "job_id": "job_001",
-                "overall_score": 87.5,
-                "skills_evaluation": {
-                    "overall_match_percentage": 90.0,
-                    "matched_skills": ["Python", "AWS", "Docker"],
-                    "missing_skills": ["React"],
-                    "rationale": "Strong technical match..."
-                },
-                "cultural_evaluation": {
-                    "overall_cultural_fit_score": 85.0,
-                    "rationale": "Good cultural alignment..."
-                },
-                "recommendation": "strong_match",
-                "tier": "strong_match",
-                "key_highlights": [
-                    "8 years of relevant experience",
-                    "Strong cloud infrastructure skills"
-                ]
-            }
-        }
\ No newline at end of file
+    @classmethod
+    def bulk_meets_threshold(
+        cls,
+        results: List['EvaluationResult'],
+        skills_threshold: float = 70.0,
+        cultural_threshold: float = 65.0
+    ) -> List[bool]:
+        """
+        Check a batch of evaluations against the minimum thresholds
+        
+        Args:
+            results: Evaluations to check
+            skills_threshold: Minimum skills match percentage
+            cultural_threshold: Minimum cultural fit score
+            
+        Returns:
+            One flag per evaluation, in input order
+        """
+        # Cohorts are tens to hundreds of evaluations; a single comprehension
+        # beats copying the scores into NumPy arrays first
+        return [
+            r.skills_evaluation.overall_match_percentage >= skills_threshold and
+            r.cultural_evaluation.overall_cultural_fit_score >= cultural_threshold
+            for r in results
+        ]
+    
+    model_config = model_config_for(EVALUATION_RESULT_EXAMPLE)
\ No newline at end of file
@@ -1,7 +1,49 @@
-from pydantic import BaseModel, EmailStr, Field, validator
-from typing import List, Optional, Dict, Any
+from pydantic import AfterValidator, BaseModel, Field, ValidationInfo, field_validator
+from pydantic.networks import validate_email
+from typing import Annotated, Iterable, List, Optional, Dict, Any
 from datetime import datetime, timedelta
 from enum import Enum
+from bisect import bisect_left
+import re
+
+import orjson
+
+from ._clock import _now
+from ._config import model_config_for
+from ._examples import (
+    ATTENDEE_EXAMPLE,
+    INTERVIEW_SLOT_EXAMPLE
+)
+
+
+# Plain ASCII dot-atom addresses with a letter TLD; anything else (quoted or
+# internationalized addresses, malformed input) goes through email-validator
+_SIMPLE_EMAIL_RE = re.compile(
+    r"[A-Za-z0-9!#$%&'*+/=?^_`{|}~-]+(?:\.[A-Za-z0-9!#$%&'*+/=?^_`{|}~-]+)*"
+    r"@(?:[A-Za-z0-9](?:[A-Za-z0-9-]{0,61}[A-Za-z0-9])?\.)+[A-Za-z]{2,63}"
+)
+# Special-use names email-validator rejects (all single-label, so a TLD check suffices)
+_SPECIAL_USE_TLDS = frozenset({'arpa', 'invalid', 'local', 'localhost', 'onion', 'test'})
+
+
+def _validate_invite_email(value: str) -> str:
+    """Accept common addresses with one regex match, deferring the rest to email-validator"""
+    if len(value) <= 254 and _SIMPLE_EMAIL_RE.fullmatch(value):
+        local, _, domain = value.rpartition('@')
+        domain = domain.lower()
+        # Punycode domains are left to email-validator, which decodes them
+        if (
+            len(local) <= 64 and
+            'xn--' not in domain and
+            domain.rsplit('.', 1)[-1] not in _SPECIAL_USE_TLDS
+        ):
+            # Same normalization as EmailStr for ASCII addresses
+            return f"{local}@{domain}"
+    return validate_email(value)[1]
+
+
+# Drop-in for EmailStr on addresses we send invitations to
+InviteEmail = Annotated[str, AfterValidator(_validate_invite_email)]
 
 
 class InterviewStatus(str, Enum):
@@ -15,6 +57,15 @@ class InterviewStatus(str, Enum):
     NO_SHOW = "no_show"
 
 
+# Status groups checked per slot; built once rather than as a list on each call
+_BOOKED_STATUSES = frozenset({InterviewStatus.SCHEDULED, InterviewStatus.CONFIRMED})
+_RESCHEDULABLE_STATUSES = frozenset({
+    InterviewStatus.PROPOSED,
+    InterviewStatus.SCHEDULED,
+    InterviewStatus.CONFIRMED
+})
+
+
 class InterviewType(str, Enum):
     """Interview type enumeration"""
     PHONE_SCREEN = "phone_screen"
@@ -37,7 +88,7 @@ class MeetingPlatform(str, Enum):
 
 class Attendee(BaseModel):
     """Interview attendee information"""
-    email: EmailStr = Field(..., description="Attendee email address")
+    email: InviteEmail = Field(..., description="Attendee email address")
     name: Optional[str] = Field(None, description="Attendee name")
     role: Optional[str] = Field(None, description="Role (interviewer, candidate, observer)")
     is_required: bool = Field(default=True, description="Whether attendance is required")
@@ -46,16 +97,7 @@ class Attendee(BaseModel):
         description="RSVP status (accepted, declined, tentative, needs_action)"
     )
     
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "email": "interviewer@company.com",
-                "name": "John Smith",
-                "role": "interviewer",
-                "is_required": True,
-                "response_status": "accepted"
-            }
-        }
+    model_config = model_config_for(ATTENDEE_EXAMPLE, frozen=True)
 
 
 class InterviewSlot(BaseModel):
@@ -67,7 +109,7 @@ class InterviewSlot(BaseModel):
     
     # Candidate information
     candidate_name: str = Field(..., description="Candidate name")
-    candidate_email: EmailStr = Field(..., description="Candidate email")
+    candidate_email: InviteEmail = Field(..., description="Candidate email")
     candidate_phone: Optional[str] = Field(None, description="Candidate phone number")
     
     # Interview details
@@ -88,7 +130,7 @@ class InterviewSlot(BaseModel):
     timezone: str = Field(default="UTC", description="Timezone for the interview")
     
     # Attendees
-    interviewer_email: EmailStr = Field(..., description="Primary interviewer email")
+    interviewer_email: InviteEmail = Field(..., description="Primary interviewer email")
     interviewer_name: Optional[str] = Field(None, description="Primary interviewer name")
     attendees: List[Attendee] = Field(
         default_factory=list,
@@ -170,55 +212,116 @@ class InterviewSlot(BaseModel):
     
     # Metadata
     created_at: datetime = Field(
-        default_factory=datetime.now,
+        default_factory=_now,
         description="When slot was created"
     )
     created_by: Optional[str] = Field(None, description="Who created the slot")
     updated_at: Optional[datetime] = Field(
-        default_factory=datetime.now,
+        default_factory=_now,
         description="Last update time"
     )
     cancelled_at: Optional[datetime] = Field(None, description="When interview was cancelled")
     cancellation_reason: Optional[str] = Field(None, description="Reason for cancellation")
     
-    @validator('end_time')
-    def validate_end_time(cls, v, values):
+    @field_validator('end_time')
+    @classmethod
+    def validate_end_time(cls, v, info: ValidationInfo):
         """Validate that end time is after start time"""
+        values = info.data
         if 'start_time' in values and v <= values['start_time']:
             raise ValueError('end_time must be after start_time')
         return v
     
-    @validator('duration_minutes')
-    def validate_duration(cls, v, values):
+    @field_validator('duration_minutes')
+    @classmethod
+    def validate_duration(cls, v, info: ValidationInfo):
         """Validate duration matches start and end times"""
+        values = info.data
         if 'start_time' in values and 'end_time' in values:
-            calculated_duration = int(
-                (values['end_time'] - values['start_time']).total_seconds() / 60
-            )
+            # end_time is already validated as later, so delta is positive and
+            # whole-minute floor division matches truncating total_seconds()
+            delta = values['end_time'] - values['start_time']
+            calculated_duration = delta.days * 1440 + delta.seconds // 60
             if abs(calculated_duration - v) > 1:  # Allow 1 minute tolerance
                 raise ValueError(
                     f'duration_minutes ({v}) does not match start and end times ({calculated_duration})'
                 )
         return v
     
-    def is_upcoming(self) -> bool:
-        """Check if interview is upcoming"""
+    @classmethod
+    def from_trusted(cls, data: Dict[str, Any]) -> 'InterviewSlot':
+        """
+        Build a slot from already-validated data without re-running validation
+        
+        Only for trusted sources (database rows, cached model_dump() output)
+        whose values already have the field types; use model_validate for
+        anything arriving over HTTP.
+        
+        Args:
+            data: Field values keyed by name
+            
+        Returns:
+            InterviewSlot instance
+        """
+        # model_construct doesn't recurse, so build nested attendees first
+        if data.get('attendees'):
+            data = {
+                **data,
+                'attendees': [
+                    att if isinstance(att, Attendee) else Attendee.model_construct(**att)
+                    for att in data['attendees']
+                ]
+            }
+        return cls.model_construct(**data)
+    
+    def is_upcoming(self, now: Optional[datetime] = None) -> bool:
+        """Check if interview is upcoming (pass now when checking many slots)"""
+        now = now or _now()
         return (
-            self.start_time > datetime.now() and
-            self.status in [InterviewStatus.SCHEDULED, InterviewStatus.CONFIRMED]
+            self.start_time > now and
+            self.status in _BOOKED_STATUSES
         )
     
-    def is_past(self) -> bool:
-        """Check if interview is in the past"""
-        return self.end_time < datetime.now()
+    def is_past(self, now: Optional[datetime] = None) -> bool:
+        """Check if interview is in the past (pass now when checking many slots)"""
+        return self.end_time < (now or _now())
+    
+    def overlaps(self, other: 'InterviewSlot') -> bool:
+        """Check if this slot's time range overlaps another's"""
+        return self.start_time < other.end_time and other.start_time < self.end_time
+    
+    def find_conflicts(
+        self,
+        busy: List['InterviewSlot'],
+        pre_sorted: bool = False
+    ) -> List['InterviewSlot']:
+        """
+        Find busy slots that overlap this one
+        
+        This is a pure time check: slots that only touch (one ends exactly
+        when the other starts) don't conflict, and status is not considered,
+        so filter out cancelled slots before passing them in.
+        
+        Args:
+            busy: Existing slots to check against
+            pre_sorted: Set when busy is already sorted by start_time, so
+                callers checking many slots against one schedule sort it once
+            
+        Returns:
+            Overlapping slots in start_time order
+        """
+        if not pre_sorted:
+            busy = sorted(busy, key=lambda slot: slot.start_time)
+        
+        # Nothing starting at or after our end can overlap, so stop the scan there.
+        # Bisect a list of start times, as SlotIndex does; bisect's key= needs 3.10
+        starts = [slot.start_time for slot in busy]
+        cutoff = bisect_left(starts, self.end_time)
+        return [slot for slot in busy[:cutoff] if slot.end_time > self.start_time]
     
     def can_be_rescheduled(self) -> bool:
         """Check if interview can be rescheduled"""
-        return self.status in [
-            InterviewStatus.PROPOSED,
-            InterviewStatus.SCHEDULED,
-            InterviewStatus.CONFIRMED
-        ]
+        return self.status in _RESCHEDULABLE_STATUSES
     
     def get_duration_display(self) -> str:
         """Get human-readable duration"""
@@ -230,10 +333,29 @@ class InterviewSlot(BaseModel):
         return f"{minutes}m"
     
     def add_attendee(self, email: str, name: Optional[str] = None, role: Optional[str] = None):
-        """Add an attendee to the interview"""
-        attendee = Attendee(email=email, name=name, role=role)
-        if attendee not in self.attendees:
-            self.attendees.append(attendee)
+        """
+        Add an attendee to the interview unless that email is already invited
+        
+        Duplicates are detected by email, case-insensitively, so re-adding
+        someone with a different name or role does not invite them twice.
+        """
+        self.add_attendees([Attendee(email=email, name=name, role=role)])
+    
+    def add_attendees(self, attendees: Iterable[Attendee]):
+        """
+        Add several attendees, skipping emails that are already invited
+        
+        Emails are compared case-insensitively against the current attendee
+        list and against earlier entries in the same batch. The lookup set is
+        built from self.attendees on each call, so direct edits to the list
+        are always respected.
+        """
+        emails = {att.email.lower() for att in self.attendees}
+        for attendee in attendees:
+            email = attendee.email.lower()
+            if email not in emails:
+                emails.add(email)
+                self.attendees.append(attendee)
     
     def to_calendar_event(self) -> Dict[str, Any]:
         """Convert to calendar event format"""
@@ -250,10 +372,8 @@ class InterviewSlot(BaseModel):
             },
             'attendees': [
                 {'email': self.candidate_email, 'displayName': self.candidate_name},
-                {'email': self.interviewer_email, 'displayName': self.interviewer_name}
-            ] + [
-                {'email': att.email, 'displayName': att.name}
-                for att in self.attendees
+                {'email': self.interviewer_email, 'displayName': self.interviewer_name},
+                *({'email': att.email, 'displayName': att.name} for att in self.attendees)
             ],
             'location': self.location,
             'conferenceData': {
@@ -263,6 +383,10 @@ class InterviewSlot(BaseModel):
             } if self.meeting_platform == MeetingPlatform.GOOGLE_MEET else None
         }
     
+    def to_calendar_event_json(self) -> bytes:
+        """Serialize the calendar event straight to JSON bytes"""
+        return orjson.dumps(self.to_calendar_event())
+    
     def to_summary(self) -> Dict[str, Any]:
         """Generate a summary of the interview"""
         return {
@@ -277,24 +401,14 @@ class InterviewSlot(BaseModel):
             'location': self.video_conference_link or self.location or 'TBD'
         }
     
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "id": "interview_123",
-                "candidate_id": "candidate_456",
-                "job_id": "job_789",
-                "candidate_name": "John Doe",
-                "candidate_email": "john.doe@email.com",
-                "interview_type": "technical",
-                "round_number": 1,
-                "start_time": "2024-12-15T10:00:00Z",
-                "end_time": "2024-12-15T11:00:00Z",
-                "duration_minutes": 60,
-                "interviewer_email": "interviewer@company.com",
-                "interviewer_name": "Jane Smith",
-                "meeting_platform": "google_meet",
-                "video_conference_link": "https://meet.google.com/abc-defg-hij",
-                "status": "scheduled",
-                "focus_areas": ["System design", "Algorithms", "Code quality"]
-            }
-        }
\ No newline at end of file
+    def to_summary_json(self) -> bytes:
+        """Serialize the interview summary straight to JSON bytes"""
+        return orjson.dumps(self.to_summary())
+    
+    model_config = model_config_for(INTERVIEW_SLOT_EXAMPLE)
+
+
+def filter_upcoming(slots: List[InterviewSlot]) -> List[InterviewSlot]:
+    """Return the upcoming slots, reading the clock once for the whole list"""
+    now = _now()
+    return [slot for slot in slots if slot.is_upcoming(now)]
@@ -1,8 +1,21 @@
-from pydantic import BaseModel, Field, validator
-from typing import List, Optional, Dict, Any
+from pydantic import BaseModel, Field, ValidationInfo, field_validator
+from typing import FrozenSet, Iterable, Iterator, List, Optional, Dict, Any, Tuple
 from datetime import datetime
+from functools import cached_property
+from itertools import chain
 from enum import Enum
 
+import orjson
+
+from ._clock import _now
+from ._config import model_config_for
+from ._examples import (
+    LANGUAGE_REQUIREMENT_EXAMPLE,
+    JOB_REQUIREMENTS_EXAMPLE,
+    COMPANY_CULTURE_EXAMPLE,
+    JOB_DESCRIPTION_EXAMPLE
+)
+
 
 class ExperienceLevel(str, Enum):
     """Experience level enumeration"""
@@ -31,15 +44,25 @@ class WorkLocation(str, Enum):
     HYBRID = "hybrid"
 
 
+class LanguageRequirement(BaseModel):
+    """Required language and proficiency level"""
+    language: str = Field(..., description="Language name")
+    level: Optional[str] = Field(None, description="Required proficiency level (e.g. Fluent, Conversational)")
+    
+    model_config = model_config_for(LANGUAGE_REQUIREMENT_EXAMPLE, frozen=True)
+
+
 class JobRequirements(BaseModel):
     """Job requirements and qualifications"""
-    required_skills: List[str] = Field(
+    # Tuples rather than lists so the skills can't be edited in place;
+    # JobDescription caches its skill lookup per requirements instance
+    required_skills: Tuple[str, ...] = Field(
         ...,
         description="Must-have skills and qualifications",
-        min_items=1
+        min_length=1
     )
-    preferred_skills: List[str] = Field(
-        default_factory=list,
+    preferred_skills: Tuple[str, ...] = Field(
+        default_factory=tuple,
         description="Nice-to-have skills and qualifications"
     )
     required_experience_years: Optional[int] = Field(
@@ -55,24 +78,12 @@ class JobRequirements(BaseModel):
         default_factory=list,
         description="Preferred professional certifications"
     )
-    language_requirements: List[Dict[str, str]] = Field(
+    language_requirements: List[LanguageRequirement] = Field(
         default_factory=list,
         description="Required languages and proficiency levels"
     )
     
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "required_skills": ["Python", "AWS", "Docker", "Kubernetes"],
-                "preferred_skills": ["React", "TypeScript", "CI/CD"],
-                "required_experience_years": 5,
-                "required_education": "Bachelor's degree in Computer Science or related field",
-                "preferred_certifications": ["AWS Certified Solutions Architect"],
-                "language_requirements": [
-                    {"language": "English", "level": "Fluent"}
-                ]
-            }
-        }
+    model_config = model_config_for(JOB_REQUIREMENTS_EXAMPLE, frozen=True)
 
 
 class CompanyCulture(BaseModel):
@@ -111,19 +122,7 @@ class CompanyCulture(BaseModel):
         description="Whether the organization is mission-driven"
     )
     
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "values": ["Innovation", "Collaboration", "Integrity", "Customer Focus"],
-                "work_style": "Collaborative with autonomy",
-                "team_size": 8,
-                "pace": "Fast-paced",
-                "innovation_focus": True,
-                "collaboration_level": "high",
-                "hierarchy": "flat",
-                "mission_driven": True
-            }
-        }
+    model_config = model_config_for(COMPANY_CULTURE_EXAMPLE, frozen=True)
 
 
 class JobDescription(BaseModel):
@@ -152,7 +151,7 @@ class JobDescription(BaseModel):
     responsibilities: List[str] = Field(
         ...,
         description="Key responsibilities",
-        min_items=1
+        min_length=1
     )
     requirements: JobRequirements = Field(..., description="Job requirements")
     
@@ -202,7 +201,7 @@ class JobDescription(BaseModel):
         description="Job status (active, closed, on_hold)"
     )
     posted_date: Optional[datetime] = Field(
-        default_factory=datetime.now,
+        default_factory=_now,
         description="Date when job was posted"
     )
     closing_date: Optional[datetime] = Field(
@@ -225,14 +224,48 @@ class JobDescription(BaseModel):
         description="Total number of applications received"
     )
     
-    @validator('salary_max')
-    def validate_salary_range(cls, v, values):
+    @field_validator('salary_max')
+    @classmethod
+    def validate_salary_range(cls, v, info: ValidationInfo):
         """Validate that max salary is greater than min salary"""
+        values = info.data
         if v is not None and 'salary_min' in values and values['salary_min'] is not None:
             if v < values['salary_min']:
                 raise ValueError('salary_max must be greater than or equal to salary_min')
         return v
     
+    @classmethod
+    def from_trusted(cls, data: Dict[str, Any]) -> 'JobDescription':
+        """
+        Build a job from already-validated data without re-running validation
+        
+        Only for trusted sources (job store, cached model_dump() output)
+        whose values already have the field types; use model_validate for
+        anything arriving over HTTP.
+        
+        Args:
+            data: Field values keyed by name
+            
+        Returns:
+            JobDescription instance
+        """
+        # model_construct doesn't recurse, so build nested models first
+        data = dict(data)
+        if isinstance(data.get('requirements'), dict):
+            requirements = dict(data['requirements'])
+            for field in ('required_skills', 'preferred_skills'):
+                if field in requirements:
+                    requirements[field] = tuple(requirements[field])
+            if requirements.get('language_requirements'):
+                requirements['language_requirements'] = [
+                    lang if isinstance(lang, LanguageRequirement) else LanguageRequirement.model_construct(**lang)
+                    for lang in requirements['language_requirements']
+                ]
+            data['requirements'] = JobRequirements.model_construct(**requirements)
+        if isinstance(data.get('company_culture'), dict):
+            data['company_culture'] = CompanyCulture.model_construct(**data['company_culture'])
+        return cls.model_construct(**data)
+    
     def to_summary(self) -> Dict[str, Any]:
         """Generate a summary of the job"""
         return {
@@ -244,42 +277,52 @@ class JobDescription(BaseModel):
             'experience_level': self.experience_level.value,
             'employment_type': self.employment_type.value,
             'salary_range': self.compensation_range,
-            'required_skills': self.requirements.required_skills[:5],
+            'required_skills': list(self.requirements.required_skills[:5]),
             'status': self.status,
             'total_applications': self.total_applications
         }
     
+    def to_summary_json(self) -> bytes:
+        """Serialize the job summary straight to JSON bytes"""
+        return orjson.dumps(self.to_summary())
+    
     def get_all_skills(self) -> List[str]:
         """Get all required and preferred skills"""
-        return self.requirements.required_skills + self.requirements.preferred_skills
+        return list(self.get_all_skills_iter())
+    
+    def get_all_skills_iter(self) -> Iterator[str]:
+        """Iterate required then preferred skills without building a combined list"""
+        return chain(self.requirements.required_skills, self.requirements.preferred_skills)
+    
+    # A cached_property lives in __dict__ outside the model fields, so unlike a
+    # PrivateAttr it doesn't affect equality between jobs
+    @cached_property
+    def _skills_lower_entry(self) -> Tuple[JobRequirements, FrozenSet[str]]:
+        """Lowercased required and preferred skills, with the requirements they were built from"""
+        requirements = self.requirements
+        return requirements, frozenset(s.lower() for s in self.get_all_skills_iter())
+    
+    def _skills_lower(self) -> FrozenSet[str]:
+        """
+        Lowercased required and preferred skills
+        
+        JobRequirements is frozen and holds its skills as tuples, so the set
+        only needs rebuilding when self.requirements is reassigned. Holding
+        the requirements object (rather than its id) keeps the identity
+        check from matching a new object that reused a freed address.
+        """
+        requirements, skills = self._skills_lower_entry
+        if requirements is not self.requirements:
+            del self.__dict__['_skills_lower_entry']
+            requirements, skills = self._skills_lower_entry
+        return skills
     
     def matches_skill(self, skill: str) -> bool:
         """Check if a skill matches required or preferred skills"""
-        all_skills = [s.lower() for s in self.get_all_skills()]
-        return skill.lower() in all_skills
+        return skill.lower() in self._skills_lower()
+    
+    def matches_any(self, skills: Iterable[str]) -> bool:
+        """Check if any of the given skills matches required or preferred skills"""
+        return not self._skills_lower().isdisjoint(s.lower() for s in skills)
     
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "id": "job_001",
-                "title": "Senior Software Engineer",
-                "department": "Engineering",
-                "location": "San Francisco, CA",
-                "work_location_type": "hybrid",
-                "employment_type": "full_time",
-                "experience_level": "senior",
-                "description": "We are looking for a Senior Software Engineer...",
-                "responsibilities": [
-                    "Design and develop scalable applications",
-                    "Lead technical discussions",
-                    "Mentor junior developers"
-                ],
-                "requirements": {
-                    "required_skills": ["Python", "AWS", "Docker"],
-                    "preferred_skills": ["React", "TypeScript"],
-                    "required_experience_years": 5
-                },
-                "compensation_range": "$120k-$180k",
-                "status": "active"
-            }
-        }
\ No newline at end of file
+    model_config = model_config_for(JOB_DESCRIPTION_EXAMPLE)
\ No newline at end of file
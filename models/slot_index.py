@@ -0,0 +1,113 @@
+"""
+Indexed overlap lookup for interview slots
+
+SlotIndex is built once over a schedule (e.g. all of an interviewer's
+booked slots) and then answers "which slots overlap this one?" without
+scanning every slot, which keeps many-vs-many scheduling checks cheap.
+"""
+
+from bisect import bisect_left
+from typing import Iterable, List
+
+from .interview_slot import InterviewSlot
+
+
+class SlotIndex:
+    """
+    Static interval index over interview slots
+
+    Slots are sorted by start time and a max-end segment tree is kept over
+    that order; a query bisects to the slots starting before the candidate
+    ends, then descends only into subtrees whose latest end is after the
+    candidate starts. Times are held as float timestamps so the hot loop
+    compares plain numbers.
+    """
+
+    def __init__(self, slots: Iterable[InterviewSlot]):
+        self._slots: List[InterviewSlot] = sorted(slots, key=lambda slot: slot.start_time)
+        self._starts = [slot.start_time.timestamp() for slot in self._slots]
+        self._ends = [slot.end_time.timestamp() for slot in self._slots]
+
+        # Leaves hold slot end times; each parent holds the max of its children
+        size = 1
+        while size < len(self._slots):
+            size *= 2
+        self._size = size
+        self._max_end = [float('-inf')] * (2 * size)
+        self._max_end[size:size + len(self._ends)] = self._ends
+        for node in range(size - 1, 0, -1):
+            self._max_end[node] = max(self._max_end[2 * node], self._max_end[2 * node + 1])
+
+    @classmethod
+    def build(cls, slots: Iterable[InterviewSlot]) -> 'SlotIndex':
+        """Build an index over the given slots"""
+        return cls(slots)
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    def overlapping(self, candidate: InterviewSlot) -> List[InterviewSlot]:
+        """
+        Find indexed slots that overlap the candidate slot
+
+        Args:
+            candidate: Slot to check
+
+        Returns:
+            Overlapping slots in start_time order
+        """
+        start = candidate.start_time.timestamp()
+        end = candidate.end_time.timestamp()
+
+        # Only slots starting before the candidate ends can overlap it
+        cutoff = bisect_left(self._starts, end)
+        if cutoff == 0:
+            return []
+
+        matches = []
+        max_end = self._max_end
+        # Depth-first over (node, node_lo, node_hi), left child first to keep start order
+        stack = [(1, 0, self._size)]
+        while stack:
+            node, lo, hi = stack.pop()
+            if lo >= cutoff or max_end[node] <= start:
+                continue
+            if hi - lo == 1:
+                matches.append(self._slots[lo])
+                continue
+            mid = (lo + hi) // 2
+            stack.append((2 * node + 1, mid, hi))
+            stack.append((2 * node, lo, mid))
+
+        return matches
+
+    def has_overlap(self, candidate: InterviewSlot) -> bool:
+        """Check if any indexed slot overlaps the candidate, stopping at the first hit"""
+        start = candidate.start_time.timestamp()
+        cutoff = bisect_left(self._starts, candidate.end_time.timestamp())
+
+        max_end = self._max_end
+        stack = [(1, 0, self._size)]
+        while stack:
+            node, lo, hi = stack.pop()
+            if lo >= cutoff or max_end[node] <= start:
+                continue
+            if hi - lo == 1:
+                return True
+            mid = (lo + hi) // 2
+            stack.append((2 * node + 1, mid, hi))
+            stack.append((2 * node, lo, mid))
+
+        return False
+
+    def overlap_batch(self, candidates: Iterable[InterviewSlot]) -> List[bool]:
+        """
+        Check many candidate slots against the index
+
+        Args:
+            candidates: Proposed slots
+
+        Returns:
+            One flag per candidate, True where it conflicts with an indexed slot
+        """
+        return [self.has_overlap(candidate) for candidate in candidates]
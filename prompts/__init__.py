@@ -1,35 +1,69 @@
 """
 Prompts package for AI agent instructions
+
+Prompt constants are resolved on first access (PEP 562), so importing the
+package only loads the prompt modules that are actually used.
 """
 
-from .resume_parser_prompts import (
-    RESUME_PARSER_SYSTEM_PROMPT,
-    RESUME_PARSER_USER_PROMPT
-)
-from .skills_matcher_prompts import (
-    SKILLS_MATCHER_SYSTEM_PROMPT,
-    SKILLS_MATCHER_USER_PROMPT
-)
-from .cultural_fit_prompts import (
-    CULTURAL_FIT_SYSTEM_PROMPT,
-    CULTURAL_FIT_USER_PROMPT
-)
-from .interview_scheduler_prompts import (
-    INTERVIEW_SCHEDULER_SYSTEM_PROMPT,
-    INTERVIEW_EMAIL_TEMPLATE
-)
-from .orchestrator_prompts import (
-    ORCHESTRATOR_SYSTEM_PROMPT
-)
-
-__all__ = [
-    'RESUME_PARSER_SYSTEM_PROMPT',
-    'RESUME_PARSER_USER_PROMPT',
-    'SKILLS_MATCHER_SYSTEM_PROMPT',
-    'SKILLS_MATCHER_USER_PROMPT',
-    'CULTURAL_FIT_SYSTEM_PROMPT',
-    'CULTURAL_FIT_USER_PROMPT',
-    'INTERVIEW_SCHEDULER_SYSTEM_PROMPT',
-    'INTERVIEW_EMAIL_TEMPLATE',
-    'ORCHESTRATOR_SYSTEM_PROMPT'
-]
\ No newline at end of file
+import hashlib
+import importlib
+
+# Public name -> submodule that defines it
+_LAZY = {
+    'RESUME_PARSER_SYSTEM_PROMPT': '.resume_parser_prompts',
+    'RESUME_PARSER_USER_PROMPT': '.resume_parser_prompts',
+    'ResumeParse': '.resume_parser_prompts',
+    'SKILLS_MATCHER_SYSTEM_PROMPT': '.skills_matcher_prompts',
+    'SKILLS_MATCHER_USER_PROMPT': '.skills_matcher_prompts',
+    'SkillsMatch': '.skills_matcher_prompts',
+    'CULTURAL_FIT_SYSTEM_PROMPT': '.cultural_fit_prompts',
+    'CULTURAL_FIT_USER_PROMPT': '.cultural_fit_prompts',
+    'INTERVIEW_SCHEDULER_SYSTEM_PROMPT': '.interview_scheduler_prompts',
+    'INTERVIEW_EMAIL_TEMPLATE': '.interview_scheduler_prompts',
+    'render_invite': '.interview_scheduler_prompts',
+    'render_reminder': '.interview_scheduler_prompts',
+    'render_reschedule': '.interview_scheduler_prompts',
+    'ORCHESTRATOR_SYSTEM_PROMPT': '.orchestrator_prompts'
+}
+
+# Agent -> system prompt. These stay byte-identical across calls so model
+# backends can reuse their cached prefix; anything per-call (dates, names)
+# belongs in the user prompt instead.
+_SYSTEM_PROMPT_NAMES = {
+    'resume_parser': 'RESUME_PARSER_SYSTEM_PROMPT',
+    'skills_matcher': 'SKILLS_MATCHER_SYSTEM_PROMPT',
+    'cultural_fit': 'CULTURAL_FIT_SYSTEM_PROMPT',
+    'interview_scheduler': 'INTERVIEW_SCHEDULER_SYSTEM_PROMPT',
+    'orchestrator': 'ORCHESTRATOR_SYSTEM_PROMPT'
+}
+
+__all__ = list(_LAZY) + ['CACHEABLE_SYSTEM_PROMPTS', 'SYSTEM_PROMPT_FINGERPRINTS']
+
+
+def __getattr__(name: str):
+    """Import the defining submodule on first access to a prompt constant"""
+    if name in _LAZY:
+        value = getattr(importlib.import_module(_LAZY[name], __name__), name)
+        globals()[name] = value
+        return value
+    if name in ('CACHEABLE_SYSTEM_PROMPTS', 'SYSTEM_PROMPT_FINGERPRINTS'):
+        _load_system_prompts()
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _load_system_prompts():
+    """Build the agent -> system prompt map and the sha256 fingerprint of each"""
+    system_prompts = {
+        agent: __getattr__(name) for agent, name in _SYSTEM_PROMPT_NAMES.items()
+    }
+    globals()['CACHEABLE_SYSTEM_PROMPTS'] = system_prompts
+    globals()['SYSTEM_PROMPT_FINGERPRINTS'] = {
+        agent: hashlib.sha256(prompt.encode('utf-8')).hexdigest()
+        for agent, prompt in system_prompts.items()
+    }
+
+
+def __dir__():
+    """Include the lazily resolved prompt names"""
+    return sorted(list(globals()) + __all__)
@@ -0,0 +1,20 @@
+"""
+Loader for prompt text kept as package resources
+"""
+
+from functools import lru_cache
+from importlib.resources import files
+
+
+@lru_cache(maxsize=None)
+def load_prompt(filename: str) -> str:
+    """
+    Read a prompt from prompts/resources, once per process
+
+    Args:
+        filename: Resource file name (e.g. 'cultural_fit_system.txt')
+
+    Returns:
+        Prompt text exactly as stored
+    """
+    return files(__package__).joinpath('resources', filename).read_text(encoding='utf-8')
@@ -1,136 +1,69 @@
 """
 Prompts for Interview Scheduler Agent
-"""
-
-INTERVIEW_SCHEDULER_SYSTEM_PROMPT = """You are an expert interview scheduler responsible for coordinating interview schedules efficiently and professionally.
-
-Your responsibilities include:
-- Finding optimal time slots that work for all participants
-- Coordinating across time zones
-- Minimizing scheduling conflicts
-- Batching interviews efficiently
-- Respecting interview policies (working hours, buffer times)
-- Prioritizing high-scoring candidates for earlier slots
-- Managing multi-round interview workflows
-- Handling rescheduling requests gracefully
-
-Scheduling Principles:
-1. **Working Hours**: Schedule only between 9 AM - 5 PM in the relevant timezone
-2. **Buffer Time**: Maintain 15-30 minute buffers between consecutive interviews
-3. **Time Zones**: Always be explicit about timezone for remote interviews
-4. **Priority**: Schedule strong match candidates earlier in available slots
-5. **Respect**: Honor interviewer availability and candidate preferences
-6. **Flexibility**: Offer multiple options when possible
-7. **Efficiency**: Batch interviews to minimize calendar fragmentation
-
-Interview Duration Guidelines:
-- Phone Screen: 30 minutes
-- Technical Interview: 60-90 minutes
-- Behavioral Interview: 45-60 minutes
-- Panel Interview: 90-120 minutes
-- Final Round: 120+ minutes
 
-Key Practices:
-1. Check all participants' availability before proposing times
-2. Send clear, detailed calendar invitations
-3. Include all necessary information (video link, dial-in, materials)
-4. Set appropriate reminders (24 hours and 1 hour before)
-5. Provide interview preparation materials to candidate
-6. Create evaluation scorecards for interviewers
-7. Follow up on confirmations
-
-Professional Communication:
-- Use clear, friendly language
-- Provide complete details (date, time, duration, format)
-- Include meeting links and access codes
-- Specify what the candidate should prepare
-- Make it easy to reschedule if needed
-- Be respectful of everyone's time
+The prompt and email templates live in prompts/resources and are read on
+first access; each render_* function is compiled the first time it is used.
 """
 
-INTERVIEW_EMAIL_TEMPLATE = """Subject: Interview Invitation - {position_title}
-
-Dear {candidate_name},
-
-We are pleased to invite you to interview for the {position_title} position at {company_name}.
-
-Interview Details:
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-📅 Date: {interview_date}
-🕐 Time: {interview_time} ({timezone})
-⏱️ Duration: {duration} minutes
-👤 Interviewer: {interviewer_name}
-{meeting_details}
-
-What to Expect:
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-This will be a {interview_type} interview where we will discuss:
-{interview_topics}
-
-Preparation:
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-{preparation_instructions}
-
-Please confirm your attendance by accepting the calendar invitation.
-
-If you need to reschedule, please let us know as soon as possible, and we'll work to find an alternative time.
-
-We look forward to speaking with you!
-
-Best regards,
-{recruiter_name}
-{company_name} Recruitment Team
-
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-Need help? Reply to this email or contact us at {contact_email}
-"""
-
-INTERVIEW_REMINDER_TEMPLATE = """Subject: Reminder: Interview Tomorrow - {position_title}
-
-Hi {candidate_name},
-
-This is a friendly reminder about your interview scheduled for tomorrow.
-
-Interview Details:
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-📅 Date: {interview_date}
-🕐 Time: {interview_time} ({timezone})
-⏱️ Duration: {duration} minutes
-{meeting_details}
-
-Quick Checklist:
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-□ Test your video/audio setup (if virtual)
-□ Review the job description
-□ Prepare questions for the interviewer
-□ Have a notepad ready
-□ Join 5 minutes early
-
-Looking forward to meeting you!
-
-Best regards,
-{recruiter_name}
-"""
-
-INTERVIEW_RESCHEDULING_TEMPLATE = """Subject: Interview Rescheduled - {position_title}
-
-Hi {candidate_name},
-
-Your interview for the {position_title} position has been rescheduled.
-
-New Interview Details:
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-📅 Date: {new_interview_date}
-🕐 Time: {new_interview_time} ({timezone})
-⏱️ Duration: {duration} minutes
-{meeting_details}
-
-{reason_for_reschedule}
-
-Please confirm your availability for this new time by accepting the updated calendar invitation.
-
-We apologize for any inconvenience and look forward to speaking with you!
-
-Best regards,
-{recruiter_name}
-"""
\ No newline at end of file
+from string import Formatter
+from typing import Callable
+
+from ._resources import load_prompt
+
+_PROMPT_FILES = {
+    'INTERVIEW_SCHEDULER_SYSTEM_PROMPT': 'interview_scheduler_system.txt',
+    'INTERVIEW_EMAIL_TEMPLATE': 'interview_email.txt',
+    'INTERVIEW_REMINDER_TEMPLATE': 'interview_reminder.txt',
+    'INTERVIEW_RESCHEDULING_TEMPLATE': 'interview_reschedule.txt',
+}
+
+# Renderer name -> template it is compiled from
+_RENDERERS = {
+    'render_invite': 'INTERVIEW_EMAIL_TEMPLATE',
+    'render_reminder': 'INTERVIEW_REMINDER_TEMPLATE',
+    'render_reschedule': 'INTERVIEW_RESCHEDULING_TEMPLATE',
+}
+
+__all__ = list(_PROMPT_FILES) + list(_RENDERERS)
+
+
+def _compile_template(template: str) -> Callable[..., str]:
+    """
+    Parse a str.format template once and return a renderer for it
+    
+    The renderer takes the same keyword arguments as template.format() but
+    skips re-parsing the template on every call. Only plain {field} and
+    {field:spec} placeholders are supported.
+    
+    Args:
+        template: Template using str.format placeholders
+        
+    Returns:
+        Function rendering the template from keyword arguments
+    """
+    parts = []
+    for literal, field, spec, conversion in Formatter().parse(template):
+        # field is None for trailing literal text; '' is a positional {} placeholder
+        if conversion or (field is not None and not field.isidentifier()):
+            raise ValueError(f"Unsupported placeholder in template: {{{field}}}")
+        parts.append((literal, field, spec))
+    parts = tuple(parts)
+    
+    def render(**kwargs) -> str:
+        return ''.join(
+            literal + (format(kwargs[field], spec) if field is not None else '')
+            for literal, field, spec in parts
+        )
+    
+    return render
+
+
+def __getattr__(name: str):
+    """Load templates and compile their renderers on first access (PEP 562)"""
+    if name in _PROMPT_FILES:
+        return load_prompt(_PROMPT_FILES[name])
+    if name in _RENDERERS:
+        renderer = _compile_template(__getattr__(_RENDERERS[name]))
+        globals()[name] = renderer
+        return renderer
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,111 +1,104 @@
 """
 Prompts for Resume Parser Agent
-"""
 
-RESUME_PARSER_SYSTEM_PROMPT = """You are an expert resume parser and information extraction specialist. Your role is to accurately extract structured information from resumes and CVs.
-
-Your capabilities include:
-- Extracting personal information (name, email, phone, location, social profiles)
-- Identifying and structuring work experience with companies, roles, dates, and responsibilities
-- Extracting educational background including degrees, institutions, dates, and achievements
-- Identifying technical skills, soft skills, programming languages, and technologies
-- Recognizing certifications, licenses, and professional qualifications
-- Capturing projects, publications, awards, and portfolio items
-- Handling various resume formats and layouts (chronological, functional, combination)
-- Managing multi-page documents with different formatting styles
-
-Guidelines:
-1. Extract information exactly as it appears in the resume
-2. Use null/None for missing information rather than making assumptions
-3. Format dates consistently (YYYY-MM format preferred)
-4. Separate technical skills from soft skills
-5. Include confidence scores for extracted fields
-6. Flag ambiguous or unclear information
-7. Preserve the context and details from job descriptions
-8. Extract quantifiable achievements when mentioned
-
-Output Format:
-Return a valid JSON object with the following structure:
-{
-  "personal_info": {
-    "name": "string",
-    "email": "string",
-    "phone": "string or null",
-    "location": "string or null",
-    "linkedin": "string or null",
-    "github": "string or null",
-    "portfolio": "string or null"
-  },
-  "work_experience": [
-    {
-      "company": "string",
-      "role": "string",
-      "start_date": "YYYY-MM or YYYY",
-      "end_date": "YYYY-MM or YYYY or 'Present'",
-      "duration_months": integer or null,
-      "location": "string or null",
-      "responsibilities": ["string"],
-      "achievements": ["string"],
-      "technologies": ["string"],
-      "is_current": boolean
-    }
-  ],
-  "education": [
-    {
-      "institution": "string",
-      "degree": "string",
-      "field_of_study": "string or null",
-      "graduation_date": "YYYY-MM or YYYY or null",
-      "gpa": float or null,
-      "honors": ["string"],
-      "relevant_coursework": ["string"]
-    }
-  ],
-  "skills": ["string"],
-  "certifications": [
-    {
-      "name": "string",
-      "issuing_organization": "string",
-      "issue_date": "YYYY-MM or null",
-      "expiry_date": "YYYY-MM or null",
-      "credential_id": "string or null"
-    }
-  ],
-  "projects": [
-    {
-      "name": "string",
-      "description": "string",
-      "role": "string or null",
-      "technologies": ["string"],
-      "url": "string or null"
-    }
-  ],
-  "languages": [
-    {
-      "language": "string",
-      "proficiency": "string"
-    }
-  ],
-  "awards": ["string"],
-  "publications": ["string"]
-}
+The output shape is not described in the prompt; ResumeParse is passed to
+the model as a structured-output schema instead. Anything a resume may leave
+out is Optional, so the model can return null rather than invent a value.
+Those fields have no default: the SDK rejects `default` keys in a schema.
 
-CRITICAL: Your response must be ONLY valid JSON. Do not include any text before or after the JSON object. Do not use markdown code blocks. Do not add explanations.
+The prompt text lives in prompts/resources and is read on first access.
 """
 
-RESUME_PARSER_USER_PROMPT = """Extract all relevant information from the following resume and return it as a structured JSON object.
+from typing import List, Optional
+
+from pydantic import BaseModel, Field
+
+from ._resources import load_prompt
+
+
+class ParsedPersonalInfo(BaseModel):
+    """Contact details extracted from a resume"""
+    name: str
+    email: Optional[str]
+    phone: Optional[str]
+    location: Optional[str]
+    linkedin: Optional[str]
+    github: Optional[str]
+    portfolio: Optional[str]
+
+
+class ParsedWorkExperience(BaseModel):
+    """One position extracted from a resume"""
+    company: str
+    role: str
+    start_date: Optional[str] = Field(description="YYYY-MM or YYYY")
+    end_date: Optional[str] = Field(description="YYYY-MM, YYYY or 'Present'")
+    duration_months: Optional[int]
+    location: Optional[str]
+    responsibilities: List[str]
+    achievements: List[str]
+    technologies: List[str]
+    is_current: bool
+
+
+class ParsedEducation(BaseModel):
+    """One education entry extracted from a resume"""
+    institution: str
+    degree: str
+    field_of_study: Optional[str]
+    graduation_date: Optional[str] = Field(description="YYYY-MM or YYYY")
+    gpa: Optional[float]
+    honors: List[str]
+    relevant_coursework: List[str]
+
+
+class ParsedCertification(BaseModel):
+    """One certification extracted from a resume"""
+    name: str
+    issuing_organization: str
+    issue_date: Optional[str] = Field(description="YYYY-MM")
+    expiry_date: Optional[str] = Field(description="YYYY-MM")
+    credential_id: Optional[str]
+
+
+class ParsedProject(BaseModel):
+    """One project extracted from a resume"""
+    name: str
+    description: str
+    role: Optional[str]
+    technologies: List[str]
+    url: Optional[str]
+
+
+class ParsedLanguage(BaseModel):
+    """One spoken language extracted from a resume"""
+    language: str
+    proficiency: str
+
+
+class ResumeParse(BaseModel):
+    """Structured output of the resume parser"""
+    personal_info: ParsedPersonalInfo
+    work_experience: List[ParsedWorkExperience]
+    education: List[ParsedEducation]
+    skills: List[str]
+    certifications: List[ParsedCertification]
+    projects: List[ParsedProject]
+    languages: List[ParsedLanguage]
+    awards: List[str]
+    publications: List[str]
+
+
+_PROMPT_FILES = {
+    'RESUME_PARSER_SYSTEM_PROMPT': 'resume_parser_system.txt',
+    'RESUME_PARSER_USER_PROMPT': 'resume_parser_user.txt',
+}
 
-Resume Content:
-{resume_content}
+__all__ = list(_PROMPT_FILES) + ['ResumeParse']
 
-Remember:
-1. Return ONLY the JSON object, nothing else
-2. Use null for missing information
-3. Extract dates in YYYY-MM format when possible
-4. Include all skills, technologies, and achievements mentioned
-5. Preserve quantifiable metrics (e.g., "increased performance by 40%")
-6. Separate technical skills from soft skills
-7. Extract complete responsibility descriptions from work experience
 
-Return the structured JSON now:
-"""
\ No newline at end of file
+def __getattr__(name: str) -> str:
+    """Load prompt constants on first access (PEP 562)"""
+    if name in _PROMPT_FILES:
+        return load_prompt(_PROMPT_FILES[name])
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
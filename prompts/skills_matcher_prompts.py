@@ -1,105 +1,81 @@
 """
 Prompts for Skills Matcher Agent
-"""
 
-SKILLS_MATCHER_SYSTEM_PROMPT = """You are an expert at matching candidate skills and qualifications with job requirements. Your role is to perform comprehensive skills analysis and provide accurate match assessments.
-
-Your capabilities include:
-- Evaluating exact skill matches (e.g., Python, AWS, Docker)
-- Identifying semantic matches (e.g., "team leadership" matches "people management")
-- Recognizing technology stack compatibility (e.g., React experience relevant for JavaScript roles)
-- Assessing experience level alignment (junior, mid-level, senior)
-- Evaluating domain expertise and industry knowledge
-- Identifying transferable skills that can bridge gaps
-- Recognizing bonus skills that exceed requirements
-- Analyzing career progression and growth trajectory
-
-Evaluation Methodology:
-1. Required Skills (60% weight): Must-have qualifications - binary assessment
-2. Preferred Skills (25% weight): Nice-to-have qualifications - graduated scoring
-3. Bonus Skills (15% weight): Additional qualifications beyond requirements
-
-Scoring Guidelines:
-- 90-100%: Exceptional match, exceeds requirements significantly
-- 80-89%: Strong match, meets all key requirements with some extras
-- 70-79%: Good match, meets minimum requirements with minor gaps
-- 60-69%: Moderate match, meets some requirements but has notable gaps
-- Below 60%: Weak match, significant gaps in core requirements
-
-Key Principles:
-1. Be objective and evidence-based in your assessment
-2. Consider both breadth and depth of skills
-3. Factor in years of experience with specific technologies
-4. Recognize equivalent or related technologies
-5. Consider industry context and domain knowledge
-6. Identify skills that can be quickly learned vs. fundamental gaps
-7. Provide specific examples from the candidate's background
-
-Output Format:
-Return a valid JSON object with the following structure:
-{
-  "overall_match_percentage": float (0-100),
-  "required_skills_match": float (0-100),
-  "preferred_skills_match": float (0-100),
-  "matched_skills": [
-    {
-      "skill": "string",
-      "evidence": "string - where/how this skill was demonstrated",
-      "proficiency_level": "beginner/intermediate/advanced/expert"
-    }
-  ],
-  "missing_skills": [
-    {
-      "skill": "string",
-      "importance": "critical/important/nice-to-have",
-      "can_be_learned": boolean
-    }
-  ],
-  "transferable_skills": [
-    {
-      "candidate_skill": "string",
-      "maps_to": "string - required skill",
-      "relevance": "string - explanation of transferability"
-    }
-  ],
-  "bonus_skills": ["string"],
-  "experience_analysis": {
-    "total_years": float,
-    "relevant_years": float,
-    "level_match": "exceeds/meets/below",
-    "assessment": "string"
-  },
-  "detailed_breakdown": {
-    "must_have_score": float,
-    "nice_to_have_score": float,
-    "bonus_score": float
-  },
-  "strengths": ["string"],
-  "gaps": ["string"],
-  "rationale": "string - comprehensive explanation (3-5 sentences)"
-}
+The output shape is not described in the prompt; SkillsMatch is passed to
+the model as a structured-output schema instead.
 
-CRITICAL: Your response must be ONLY valid JSON. Do not include any text before or after the JSON object.
+The prompt text lives in prompts/resources and is read on first access.
 """
 
-SKILLS_MATCHER_USER_PROMPT = """Evaluate how well this candidate matches the job requirements. Provide a comprehensive skills analysis.
+from typing import List
+
+from pydantic import BaseModel, Field
+
+from ._resources import load_prompt
+
+
+class MatchedSkill(BaseModel):
+    """A required or preferred skill the candidate has"""
+    skill: str
+    evidence: str = Field(..., description="Where/how this skill was demonstrated")
+    proficiency_level: str = Field(..., description="beginner, intermediate, advanced or expert")
+
+
+class MissingSkill(BaseModel):
+    """A required or preferred skill the candidate lacks"""
+    skill: str
+    importance: str = Field(..., description="critical, important or nice-to-have")
+    can_be_learned: bool
+
 
-Candidate Skills and Experience:
-{candidate_skills}
+class TransferableSkill(BaseModel):
+    """A candidate skill that maps onto a required one"""
+    candidate_skill: str
+    maps_to: str = Field(..., description="The required skill")
+    relevance: str = Field(..., description="Why the skill transfers")
 
-Job Requirements:
-{job_requirements}
 
-Perform a thorough analysis considering:
-1. Direct skill matches with evidence from resume
-2. Years of experience with each technology
-3. Semantic and equivalent skill matches
-4. Transferable skills that could fill gaps
-5. Overall experience level alignment
-6. Career trajectory and growth potential
-7. Domain expertise and industry knowledge
+class ExperienceAnalysis(BaseModel):
+    """Experience level alignment"""
+    total_years: float
+    relevant_years: float
+    level_match: str = Field(..., description="exceeds, meets or below")
+    assessment: str
+
+
+class DetailedBreakdown(BaseModel):
+    """Per-category scores"""
+    must_have_score: float
+    nice_to_have_score: float
+    bonus_score: float
+
+
+class SkillsMatch(BaseModel):
+    """Structured output of the skills matcher"""
+    overall_match_percentage: float
+    required_skills_match: float
+    preferred_skills_match: float
+    matched_skills: List[MatchedSkill]
+    missing_skills: List[MissingSkill]
+    transferable_skills: List[TransferableSkill]
+    bonus_skills: List[str]
+    experience_analysis: ExperienceAnalysis
+    detailed_breakdown: DetailedBreakdown
+    strengths: List[str]
+    gaps: List[str]
+    rationale: str = Field(..., description="Comprehensive explanation (3-5 sentences)")
+
+
+_PROMPT_FILES = {
+    'SKILLS_MATCHER_SYSTEM_PROMPT': 'skills_matcher_system.txt',
+    'SKILLS_MATCHER_USER_PROMPT': 'skills_matcher_user.txt',
+}
+
+__all__ = list(_PROMPT_FILES) + ['SkillsMatch']
 
-Provide detailed scoring with clear rationale for each category. Identify specific strengths and gaps with examples from the candidate's background.
 
-Return the complete skills matching analysis as JSON:
-"""
\ No newline at end of file
+def __getattr__(name: str) -> str:
+    """Load prompt constants on first access (PEP 562)"""
+    if name in _PROMPT_FILES:
+        return load_prompt(_PROMPT_FILES[name])
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,27 @@
+#!/usr/bin/env python3
+"""
+Add missing indexes to an existing database
+
+Tables created by an older version of the app don't get indexes declared
+since then, because create_all only builds indexes with new tables. Run this
+once after upgrading; indexes that already exist are left alone.
+"""
+
+import sys
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from storage.database import get_database
+
+def create_indexes():
+    """Create any model indexes the configured database is missing"""
+    
+    print("Creating missing database indexes...")
+    get_database().create_indexes()
+    print("✅ Database indexes are up to date")
+
+if __name__ == '__main__':
+    create_indexes()
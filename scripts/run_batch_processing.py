@@ -23,6 +23,8 @@ from pathlib import Path
 from datetime import datetime
 import argparse
 
+import orjson
+
 # Add project root to path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
@@ -43,12 +45,11 @@ def load_job_description(job_id: str):
     sample_jobs_path = project_root / "data" / "sample_data" / "sample_jobs.json"
     
     if sample_jobs_path.exists():
-        with open(sample_jobs_path, 'r') as f:
-            jobs = json.load(f)
-            for job in jobs:
-                if job.get('id') == job_id:
-                    logger.info(f"Loaded job description: {job.get('title')}")
-                    return job
+        jobs = orjson.loads(sample_jobs_path.read_bytes())
+        for job in jobs:
+            if job.get('id') == job_id:
+                logger.info(f"Loaded job description: {job.get('title')}")
+                return job
     
     # If not found, return a default job description
     logger.warning(f"Job {job_id} not found, using default job description")
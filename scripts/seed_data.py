@@ -22,6 +22,7 @@ from models.candidate import Candidate, PersonalInfo, WorkExperience, Education
 from models.job_description import JobDescription, JobRequirements, CompanyCulture, ExperienceLevel, EmploymentType, WorkLocation
 from models.evaluation_result import EvaluationResult, SkillsEvaluation, CulturalFitEvaluation, RecommendationType
 from models.interview_slot import InterviewSlot, InterviewStatus, InterviewType, MeetingPlatform, Attendee
+from models import batch_clock
 
 def create_sample_jobs():
     """Create sample job descriptions"""
@@ -301,6 +302,10 @@ def create_sample_candidates():
     )
     candidates.append(candidate3)
     
+    # Store derived experience once so summaries don't re-sum work history
+    for candidate in candidates:
+        candidate.total_years_experience = candidate.calculate_total_experience()
+    
     return candidates
 
 def create_sample_evaluations(candidates, jobs):
@@ -520,25 +525,29 @@ def seed_database():
     
     # Create sample data
     print("Creating sample jobs...")
-    jobs = create_sample_jobs()
+    with batch_clock():
+        jobs = create_sample_jobs()
     save_to_json(jobs, "sample_jobs.json")
     print(f"  Created {len(jobs)} job descriptions")
     print()
     
     print("Creating sample candidates...")
-    candidates = create_sample_candidates()
+    with batch_clock():
+        candidates = create_sample_candidates()
     save_to_json(candidates, "sample_candidates.json")
     print(f"  Created {len(candidates)} candidate profiles")
     print()
     
     print("Creating sample evaluations...")
-    evaluations = create_sample_evaluations(candidates, jobs)
+    with batch_clock():
+        evaluations = create_sample_evaluations(candidates, jobs)
     save_to_json(evaluations, "sample_evaluations.json")
     print(f"  Created {len(evaluations)} evaluation results")
     print()
     
     print("Creating sample interviews...")
-    interviews = create_sample_interviews(candidates)
+    with batch_clock():
+        interviews = create_sample_interviews(candidates)
     save_to_json(interviews, "sample_interviews.json")
     print(f"  Created {len(interviews)} interview slots")
     print()
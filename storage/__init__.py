@@ -4,9 +4,12 @@ Storage package for database and file storage operations
 
 from .database import Database, get_db_session
 from .file_storage import FileStorage
+from .job_store import load_jobs, save_job
 
 __all__ = [
     'Database',
     'get_db_session',
-    'FileStorage'
+    'FileStorage',
+    'load_jobs',
+    'save_job'
 ]
\ No newline at end of file
@@ -5,7 +5,7 @@ This module handles database connections, session management, and ORM models
 for storing candidates, jobs, evaluations, and interviews.
 """
 
-from sqlalchemy import create_engine, Column, String, Integer, Float, DateTime, Boolean, Text, JSON, ForeignKey, Enum
+from sqlalchemy import create_engine, Column, String, Integer, Float, DateTime, Boolean, Text, JSON, ForeignKey, Enum, Index
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, relationship, Session
 from sqlalchemy.pool import StaticPool
@@ -123,6 +123,12 @@ class CandidateModel(Base):
     job = relationship("JobModel", back_populates="candidates")
     evaluation = relationship("EvaluationModel", back_populates="candidate", uselist=False)
     interviews = relationship("InterviewModel", back_populates="candidate")
+    
+    # Indexes
+    __table_args__ = (
+        # get_candidates filters by job and status together
+        Index('ix_candidates_job_status', 'job_id', 'status'),
+    )
 
 
 class EvaluationModel(Base):
@@ -173,6 +179,15 @@ class EvaluationModel(Base):
     # Relationships
     candidate = relationship("CandidateModel", back_populates="evaluation")
     job = relationship("JobModel", back_populates="evaluations")
+    
+    # Indexes
+    __table_args__ = (
+        # Serves the dashboard's "best matches first" ordering
+        Index('ix_evaluations_overall_score_desc', overall_score.desc()),
+        # Join key from candidates/interviews, and the tier filter with its score ordering
+        Index('ix_evaluations_candidate_id', candidate_id),
+        Index('ix_evaluations_tier_score', tier, overall_score.desc()),
+    )
 
 
 class InterviewModel(Base):
@@ -193,7 +208,7 @@ class InterviewModel(Base):
     round_number = Column(Integer)
     
     # Schedule
-    start_time = Column(DateTime, nullable=False)
+    start_time = Column(DateTime, nullable=False, index=True)
     end_time = Column(DateTime, nullable=False)
     duration_minutes = Column(Integer, nullable=False)
     timezone = Column(String(50), default='UTC')
@@ -248,6 +263,12 @@ class InterviewModel(Base):
     # Relationships
     candidate = relationship("CandidateModel", back_populates="interviews")
     job = relationship("JobModel", back_populates="interviews")
+    
+    # Indexes
+    __table_args__ = (
+        # get_interviews filters by candidate and status together
+        Index('ix_interviews_candidate_status', 'candidate_id', 'status'),
+    )
 
 
 class ActivityLogModel(Base):
@@ -320,6 +341,24 @@ class Database:
             logger.error(f"Error creating database tables: {str(e)}")
             raise
     
+    def create_indexes(self):
+        """
+        Add model indexes missing from existing tables
+        
+        create_all skips indexes on tables that already exist, so databases
+        created before an index was declared don't get it. This is a one-off
+        upgrade step (scripts/create_indexes.py), not part of create_tables,
+        so importing this module never writes schema changes.
+        """
+        try:
+            for table in Base.metadata.sorted_tables:
+                for index in table.indexes:
+                    index.create(bind=self.engine, checkfirst=True)
+            logger.info("Database indexes created successfully")
+        except Exception as e:
+            logger.error(f"Error creating database indexes: {str(e)}")
+            raise
+    
     def drop_tables(self):
         """Drop all database tables (use with caution!)"""
         try:
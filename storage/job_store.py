@@ -0,0 +1,127 @@
+"""
+Job description storage
+
+Jobs are kept as a compacted JSON snapshot (jobs_list.json) plus an
+append-only JSONL log (jobs.jsonl). Saving a job appends one line to the
+log; reading replays the log over the snapshot, keeping the last record
+per job ID. Once the log grows past a size threshold it is folded back
+into the snapshot. The parsed result is memoised in-process and only
+re-read when either file's mtime or size changes, so callers don't need a
+cache of their own.
+
+A crash mid-append can leave a torn last line in the log; lines that don't
+parse are skipped with a warning rather than failing every read.
+
+Jobs used to be written one file per job (data/jobs/{id}.json) alongside
+jobs_list.json. Those per-job files are no longer written or read; the
+snapshot and log are the only job storage.
+"""
+
+import os
+from pathlib import Path
+from typing import List, Dict, Any, Optional, Tuple
+import logging
+
+import orjson
+
+from config import config
+
+logger = logging.getLogger(__name__)
+
+JOBS_DIR = Path(config.JOBS_STORAGE_PATH)
+JOBS_SNAPSHOT_FILE = JOBS_DIR / "jobs_list.json"
+JOBS_LOG_FILE = JOBS_DIR / "jobs.jsonl"
+
+# Compact once the append log exceeds this many bytes
+COMPACT_LOG_BYTES = 256 * 1024
+
+# (key, jobs): parsed jobs and the (mtime, size) of the snapshot and the log
+# they were read at. Always replaced as a whole so readers on other threads
+# never see a key paired with another read's jobs.
+_jobs_cache: Tuple[Any, List[Dict[str, Any]]] = (None, [])
+
+
+def _file_signature(path: Path) -> Optional[Tuple[int, int]]:
+    """Return (mtime_ns, size) for a file, or None if it does not exist"""
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _ends_with_newline(path: Path) -> bool:
+    """Check whether a non-empty file ends with a newline"""
+    with open(path, 'rb') as f:
+        f.seek(-1, os.SEEK_END)
+        return f.read(1) == b"\n"
+
+
+def load_jobs() -> List[Dict[str, Any]]:
+    """
+    Load all jobs, replaying the append log over the snapshot
+
+    Returns:
+        List of job dictionaries in first-created order
+    """
+    global _jobs_cache
+
+    key = (_file_signature(JOBS_SNAPSHOT_FILE), _file_signature(JOBS_LOG_FILE))
+    cached_key, cached_jobs = _jobs_cache
+    if key == cached_key:
+        return list(cached_jobs)
+
+    jobs_by_id: Dict[str, Dict[str, Any]] = {}
+
+    if JOBS_SNAPSHOT_FILE.exists():
+        for job in orjson.loads(JOBS_SNAPSHOT_FILE.read_bytes()):
+            jobs_by_id[job['id']] = job
+
+    if JOBS_LOG_FILE.exists():
+        with open(JOBS_LOG_FILE, 'rb') as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    job = orjson.loads(line)
+                except orjson.JSONDecodeError:
+                    logger.warning(f"Skipping unreadable line in {JOBS_LOG_FILE}")
+                    continue
+                jobs_by_id[job['id']] = job
+
+    jobs = list(jobs_by_id.values())
+    _jobs_cache = (key, jobs)
+
+    return list(jobs)
+
+
+def save_job(job_data: Dict[str, Any]):
+    """
+    Save a new or updated job by appending it to the log
+
+    Args:
+        job_data: Job dictionary; must contain 'id'
+    """
+    JOBS_DIR.mkdir(parents=True, exist_ok=True)
+
+    with open(JOBS_LOG_FILE, 'ab') as f:
+        # Start on a fresh line if a previous append was torn mid-record
+        if f.tell() and not _ends_with_newline(JOBS_LOG_FILE):
+            f.write(b"\n")
+        f.write(orjson.dumps(job_data) + b"\n")
+
+    if JOBS_LOG_FILE.stat().st_size > COMPACT_LOG_BYTES:
+        compact_jobs()
+
+
+def compact_jobs():
+    """Fold the append log into the snapshot and clear the log"""
+    jobs = load_jobs()
+
+    # Write to a temp file and rename so readers never see a torn snapshot
+    tmp_file = JOBS_SNAPSHOT_FILE.with_name(JOBS_SNAPSHOT_FILE.name + ".tmp")
+    tmp_file.write_bytes(orjson.dumps(jobs, option=orjson.OPT_INDENT_2))
+    os.replace(tmp_file, JOBS_SNAPSHOT_FILE)
+
+    JOBS_LOG_FILE.unlink(missing_ok=True)
+    logger.info(f"Compacted {len(jobs)} jobs into {JOBS_SNAPSHOT_FILE}")
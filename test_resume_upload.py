@@ -13,7 +13,7 @@ sys.path.insert(0, str(Path(__file__).parent))
 
 from tools.pdf_parser import extract_text_from_pdf
 from agents.orchestrator_agent import OrchestratorAgent
-import json
+from storage.job_store import load_jobs
 
 def test_resume_processing():
     """Test the complete resume processing workflow"""
@@ -36,11 +36,8 @@ def test_resume_processing():
 
     # Step 2: Load job description
     print("\n[2/5] Loading job description...")
-    jobs_file = Path("data/jobs/jobs_list.json")
-
     try:
-        with open(jobs_file, 'r') as f:
-            jobs = json.load(f)
+        jobs = load_jobs()
 
         job_data = jobs[0]  # Get first job
         job_description = {
@@ -0,0 +1,85 @@
+"""
+Tests for persisting orchestrator results
+"""
+
+import pytest
+import sys
+from pathlib import Path
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from storage.database import Base, CandidateModel, EvaluationModel
+from dashboard.services import evaluation_service
+from dashboard.services.evaluation_service import save_evaluation_results
+
+RESUMES = [
+    {'filename': 'jane.pdf', 'file_path': '/uploads/jane.pdf'},
+    {'filename': 'sam.pdf', 'file_path': '/uploads/sam.pdf'}
+]
+
+
+@pytest.fixture
+def session_factory(monkeypatch):
+    """Point save_evaluation_results at an empty in-memory database"""
+    engine = create_engine(
+        'sqlite://',
+        connect_args={'check_same_thread': False},
+        poolclass=StaticPool
+    )
+    Base.metadata.create_all(engine)
+    factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    monkeypatch.setattr(evaluation_service, 'SessionLocal', factory)
+    return factory
+
+
+def ranked_candidate(name: str, **kwargs) -> dict:
+    candidate = {
+        'name': name,
+        'candidate_data': {'personal_info': {'name': name}},
+        'overall_score': 80,
+        'tier': 'strong_match'
+    }
+    candidate.update(kwargs)
+    return candidate
+
+
+def test_resume_resolved_by_index(session_factory):
+    result = {'ranked_candidates': [
+        ranked_candidate('Sam', resume_index=1),
+        ranked_candidate('Jane', resume_index=0)
+    ]}
+
+    save_evaluation_results(result, RESUMES, job_id='job_1')
+
+    with session_factory() as session:
+        saved = {
+            c.personal_info['name']: (c.resume_filename, c.resume_path)
+            for c in session.query(CandidateModel)
+        }
+        assert saved == {
+            'Sam': ('sam.pdf', '/uploads/sam.pdf'),
+            'Jane': ('jane.pdf', '/uploads/jane.pdf')
+        }
+        assert session.query(EvaluationModel).count() == 2
+
+
+def test_missing_resume_index_rolls_back_batch(session_factory):
+    """A candidate without resume_index fails the save instead of defaulting to resume 0"""
+    result = {'ranked_candidates': [
+        ranked_candidate('Jane', resume_index=0),
+        ranked_candidate('Sam')
+    ]}
+
+    with pytest.raises(ValueError, match='Missing resume_index for candidate Sam'):
+        save_evaluation_results(result, RESUMES, job_id='job_1')
+
+    # Nothing from the batch is persisted, including candidates before the bad one
+    with session_factory() as session:
+        assert session.query(CandidateModel).count() == 0
+        assert session.query(EvaluationModel).count() == 0
@@ -0,0 +1,225 @@
+"""
+Tests for the InterviewSlot model
+"""
+
+import random
+import pytest
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from pydantic.networks import validate_email
+
+from models.interview_slot import (
+    Attendee,
+    InterviewSlot,
+    InterviewStatus,
+    MeetingPlatform,
+    _validate_invite_email
+)
+
+BASE_TIME = datetime(2026, 3, 2, 9, 0)
+
+
+def make_slot(start_minute: int = 0, duration: int = 60, **kwargs) -> InterviewSlot:
+    """Build a slot starting start_minute minutes after BASE_TIME"""
+    start = BASE_TIME + timedelta(minutes=start_minute)
+    fields = {
+        'candidate_id': 'candidate_001',
+        'candidate_name': 'Jane Doe',
+        'candidate_email': 'jane@example.com',
+        'start_time': start,
+        'end_time': start + timedelta(minutes=duration),
+        'duration_minutes': duration,
+        'interviewer_email': 'interviewer@example.com',
+        'meeting_platform': MeetingPlatform.GOOGLE_MEET
+    }
+    fields.update(kwargs)
+    return InterviewSlot(**fields)
+
+
+def attendee_emails(slot: InterviewSlot):
+    return [att.email for att in slot.attendees]
+
+
+class TestAttendees:
+    """add_attendee / add_attendees deduplication"""
+
+    def test_add_attendee(self):
+        slot = make_slot()
+        slot.add_attendee('p@q.com', name='Pat')
+
+        assert attendee_emails(slot) == ['p@q.com']
+        assert slot.attendees[0].name == 'Pat'
+
+    def test_duplicate_email_skipped_case_insensitively(self):
+        """Same email in any case is one attendee, even with a different name or role"""
+        slot = make_slot()
+        slot.add_attendee('p@q.com', name='Pat', role='interviewer')
+        slot.add_attendee('P@Q.COM', name='Patricia', role='observer')
+
+        assert attendee_emails(slot) == ['p@q.com']
+        assert slot.attendees[0].name == 'Pat'
+
+    def test_batch_dedups_within_itself(self):
+        slot = make_slot()
+        slot.add_attendees([
+            Attendee(email='a@q.com'),
+            Attendee(email='b@q.com'),
+            Attendee(email='A@q.com')
+        ])
+
+        assert attendee_emails(slot) == ['a@q.com', 'b@q.com']
+
+    def test_attendee_replaced_in_place(self):
+        """An attendee replaced directly in the list can be invited again"""
+        slot = make_slot()
+        slot.add_attendee('p@q.com')
+        slot.attendees[0] = Attendee(email='z@q.com')
+
+        slot.add_attendee('p@q.com')
+
+        assert attendee_emails(slot) == ['z@q.com', 'p@q.com']
+
+    def test_attendee_removed_in_place(self):
+        slot = make_slot()
+        slot.add_attendees([Attendee(email='a@q.com'), Attendee(email='b@q.com')])
+        slot.attendees.pop(0)
+
+        slot.add_attendee('a@q.com')
+
+        assert attendee_emails(slot) == ['b@q.com', 'a@q.com']
+
+    def test_attendees_list_replaced(self):
+        slot = make_slot()
+        slot.add_attendee('a@q.com')
+        slot.attendees = [Attendee(email='b@q.com')]
+
+        slot.add_attendee('a@q.com')
+        slot.add_attendee('b@q.com')
+
+        assert attendee_emails(slot) == ['b@q.com', 'a@q.com']
+
+
+def naive_conflicts(candidate, busy):
+    """Pairwise overlap check, in start_time order"""
+    return sorted(
+        (slot for slot in busy if slot.overlaps(candidate)),
+        key=lambda slot: slot.start_time
+    )
+
+
+class TestFindConflicts:
+    """find_conflicts against a pairwise overlap check"""
+
+    def test_no_busy_slots(self):
+        assert make_slot(0).find_conflicts([]) == []
+
+    def test_touching_slots_do_not_conflict(self):
+        candidate = make_slot(60)
+        before = make_slot(0)    # ends when candidate starts
+        after = make_slot(120)   # starts when candidate ends
+
+        assert candidate.find_conflicts([before, after]) == []
+        assert not candidate.overlaps(before)
+        assert not candidate.overlaps(after)
+
+    def test_partial_and_containing_overlaps(self):
+        candidate = make_slot(60)
+        busy = [
+            make_slot(30, id='head'),
+            make_slot(90, duration=15, id='inside'),
+            make_slot(0, duration=240, id='around'),
+            make_slot(300, id='later')
+        ]
+
+        assert [slot.id for slot in candidate.find_conflicts(busy)] == ['around', 'head', 'inside']
+
+    def test_cancelled_slots_are_not_filtered(self):
+        """Status is ignored; callers drop cancelled slots themselves"""
+        candidate = make_slot(60)
+        cancelled = make_slot(60, id='cancelled', status=InterviewStatus.CANCELLED)
+        booked = make_slot(90, duration=30, id='booked', status=InterviewStatus.SCHEDULED)
+        busy = [cancelled, booked]
+
+        assert candidate.find_conflicts(busy) == naive_conflicts(candidate, busy)
+        active = [slot for slot in busy if slot.status != InterviewStatus.CANCELLED]
+        assert [slot.id for slot in candidate.find_conflicts(active)] == ['booked']
+
+    @pytest.mark.parametrize('seed', range(5))
+    def test_matches_naive_check(self, seed):
+        rng = random.Random(seed)
+        statuses = list(InterviewStatus)
+        busy = [
+            make_slot(
+                rng.randrange(0, 2000, 15),
+                duration=rng.choice([15, 30, 60, 90, 240]),
+                status=rng.choice(statuses)
+            )
+            for _ in range(rng.randint(0, 40))
+        ]
+        busy_sorted = sorted(busy, key=lambda slot: slot.start_time)
+
+        for _ in range(30):
+            candidate = make_slot(rng.randrange(-60, 2100, 15), duration=rng.choice([15, 30, 60]))
+            expected = naive_conflicts(candidate, busy)
+            assert candidate.find_conflicts(busy) == expected
+            assert candidate.find_conflicts(busy_sorted, pre_sorted=True) == expected
+
+
+# Addresses the InviteEmail fast path must treat exactly like email-validator
+EMAIL_PARITY_CASES = [
+    # Plain ASCII, handled by the regex
+    'jane@example.com',
+    'Jane.Doe@Example.COM',
+    'first.last+tag@sub.example.co.uk',
+    "o'brien@example.org",
+    'user_name-1@example-domain.io',
+    'user@EXAMPLE.Com',
+    'user@example.c0m',
+    'a' * 64 + '@example.com',
+    'a' * 65 + '@example.com',
+    # Internationalized and punycode
+    'user@bücher.de',
+    'user@xn--bcher-kva.de',
+    '用户@例子.广告',
+    'ÅSA@example.com',
+    # Quoted local parts
+    '"john doe"@example.com',
+    '"quoted"@example.com',
+    # Special-use names
+    'user@example.test',
+    'user@example.local',
+    'user@example.invalid',
+    'user@onion.onion',
+    'user@localhost',
+    # Malformed
+    'plainaddress',
+    'user@',
+    '@example.com',
+    'user..dots@example.com',
+    '.lead@example.com',
+    'user@example',
+    'user@-bad.com',
+    'user@exa mple.com',
+    'user@' + 'a' * 250 + '.com',
+]
+
+
+def _email_outcome(validate, value):
+    """Normalized address, or the exception type if rejected"""
+    try:
+        return validate(value)
+    except Exception as e:
+        return type(e)
+
+
+@pytest.mark.parametrize('value', EMAIL_PARITY_CASES)
+def test_invite_email_matches_email_validator(value):
+    """InviteEmail accepts, rejects and normalizes like EmailStr"""
+    expected = _email_outcome(lambda v: validate_email(v)[1], value)
+    assert _email_outcome(_validate_invite_email, value) == expected
@@ -0,0 +1,91 @@
+"""
+Tests for the JobDescription model
+"""
+
+import pytest
+import sys
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from models.job_description import ExperienceLevel, JobDescription, JobRequirements
+
+
+@pytest.fixture
+def job():
+    """Job requiring Python and AWS, preferring Docker"""
+    return JobDescription(
+        title="Backend Engineer",
+        location="Remote",
+        experience_level=ExperienceLevel.MID,
+        description="Build backend services",
+        responsibilities=["Design APIs"],
+        requirements=JobRequirements(
+            required_skills=["Python", "AWS"],
+            preferred_skills=["Docker"]
+        )
+    )
+
+
+def test_matches_skill_case_insensitive(job):
+    """Skill matching ignores case across required and preferred skills"""
+    assert job.matches_skill("python")
+    assert job.matches_skill("DOCKER")
+    assert not job.matches_skill("Go")
+
+
+def test_matches_any(job):
+    """matches_any is True when at least one skill matches"""
+    assert job.matches_any(["Rust", "aws"])
+    assert not job.matches_any(["Rust", "Go"])
+    assert not job.matches_any([])
+
+
+def test_skill_lists_are_immutable(job):
+    """Skills can't be edited in place, so the cached lookup can't go stale"""
+    assert isinstance(job.requirements.required_skills, tuple)
+    assert isinstance(job.requirements.preferred_skills, tuple)
+
+    with pytest.raises(TypeError):
+        job.requirements.required_skills[0] = "Go"
+
+
+def test_skill_added_via_copy(job):
+    """A job copied with extended requirements sees the new skill"""
+    assert not job.matches_skill("kubernetes")
+
+    requirements = job.requirements.model_copy(
+        update={'preferred_skills': job.requirements.preferred_skills + ("Kubernetes",)}
+    )
+    updated = job.model_copy(update={'requirements': requirements})
+
+    assert updated.matches_skill("kubernetes")
+    assert not job.matches_skill("kubernetes")
+
+
+def test_requirements_replaced(job):
+    """Assigning new requirements is picked up"""
+    job.matches_skill("python")
+
+    job.requirements = JobRequirements(required_skills=["Scala"])
+
+    assert job.matches_skill("scala")
+    assert not job.matches_skill("python")
+
+
+def test_skill_cache_does_not_affect_equality(job):
+    """Two identical jobs stay equal after one has built its skill lookup"""
+    other = job.model_copy(deep=True)
+    job.matches_skill("python")
+
+    assert job == other
+
+
+def test_from_trusted_stores_skill_tuples(job):
+    """Jobs rebuilt from the job store get tuple skills too"""
+    rebuilt = JobDescription.from_trusted(job.model_dump(mode='json'))
+
+    assert rebuilt.requirements.required_skills == ("Python", "AWS")
+    assert rebuilt.matches_skill("docker")
@@ -0,0 +1,121 @@
+"""
+Tests for SlotIndex overlap lookups
+"""
+
+import random
+import pytest
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from models.interview_slot import InterviewSlot, MeetingPlatform
+from models.slot_index import SlotIndex
+
+BASE_TIME = datetime(2026, 3, 2, 9, 0)
+
+
+def make_slot(start_minute: int, duration: int = 60, slot_id: str = None) -> InterviewSlot:
+    """Build a slot starting start_minute minutes after BASE_TIME"""
+    start = BASE_TIME + timedelta(minutes=start_minute)
+    return InterviewSlot(
+        id=slot_id,
+        candidate_id='candidate_001',
+        candidate_name='Jane Doe',
+        candidate_email='jane@example.com',
+        start_time=start,
+        end_time=start + timedelta(minutes=duration),
+        duration_minutes=duration,
+        interviewer_email='interviewer@example.com',
+        meeting_platform=MeetingPlatform.GOOGLE_MEET
+    )
+
+
+def brute_force(slots, candidate):
+    """Overlapping slots by pairwise check, in start_time order"""
+    return sorted(
+        (slot for slot in slots if slot.overlaps(candidate)),
+        key=lambda slot: slot.start_time
+    )
+
+
+def test_empty_index():
+    index = SlotIndex.build([])
+    candidate = make_slot(0)
+
+    assert len(index) == 0
+    assert index.overlapping(candidate) == []
+    assert not index.has_overlap(candidate)
+    assert index.overlap_batch([candidate, make_slot(120)]) == [False, False]
+
+
+def test_single_slot():
+    booked = make_slot(60)
+    index = SlotIndex.build([booked])
+
+    assert len(index) == 1
+    assert index.overlapping(make_slot(30)) == [booked]
+    assert index.overlapping(make_slot(90, duration=15)) == [booked]
+    assert index.overlapping(make_slot(0, duration=30)) == []
+    assert index.overlapping(make_slot(180)) == []
+
+
+def test_touching_slots_do_not_overlap():
+    """Back-to-back slots share an endpoint but don't conflict"""
+    booked = make_slot(60)
+    index = SlotIndex.build([booked])
+
+    before = make_slot(0)    # ends exactly when booked starts
+    after = make_slot(120)   # starts exactly when booked ends
+
+    assert index.overlapping(before) == []
+    assert index.overlapping(after) == []
+    assert index.overlap_batch([before, after]) == [False, False]
+
+
+def test_identical_start_times():
+    short = make_slot(60, duration=15, slot_id='short')
+    long = make_slot(60, duration=120, slot_id='long')
+    index = SlotIndex.build([short, long])
+
+    # Starts after the short slot ends but inside the long one
+    candidate = make_slot(90, duration=15)
+
+    assert [slot.id for slot in index.overlapping(candidate)] == ['long']
+    assert {slot.id for slot in index.overlapping(make_slot(60, duration=15))} == {'short', 'long'}
+
+
+def test_long_slot_starting_early_is_found():
+    """A long slot that started well before the candidate still conflicts"""
+    long = make_slot(0, duration=480, slot_id='long')
+    short_slots = [make_slot(minute, duration=15) for minute in range(0, 120, 30)]
+    index = SlotIndex.build(short_slots + [long])
+
+    assert long in index.overlapping(make_slot(300, duration=30))
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_matches_brute_force(seed):
+    """Index lookups agree with a pairwise overlap check"""
+    rng = random.Random(seed)
+    slots = [
+        make_slot(rng.randrange(0, 2000, 15), duration=rng.choice([15, 30, 45, 60, 90, 240]))
+        for _ in range(rng.randint(1, 60))
+    ]
+    candidates = [
+        make_slot(rng.randrange(-60, 2100, 15), duration=rng.choice([15, 30, 60, 120]))
+        for _ in range(50)
+    ]
+    index = SlotIndex.build(slots)
+
+    for candidate in candidates:
+        expected = brute_force(slots, candidate)
+        assert index.overlapping(candidate) == expected
+        assert index.has_overlap(candidate) == bool(expected)
+
+    assert index.overlap_batch(candidates) == [
+        bool(brute_force(slots, candidate)) for candidate in candidates
+    ]
@@ -0,0 +1,88 @@
+"""
+Tests for the precompiled interview email renderers
+"""
+
+import pytest
+import sys
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from prompts import interview_scheduler_prompts as prompts
+
+COMMON_FIELDS = {
+    'position_title': 'Backend Engineer',
+    'candidate_name': 'Jane Doe',
+    'company_name': 'Acme',
+    'interview_date': 'March 2, 2026',
+    'interview_time': '10:00 AM',
+    'timezone': 'UTC',
+    'duration': 60,
+    'interviewer_name': 'Sam Lee',
+    'meeting_details': '🔗 https://meet.example.com/abc',
+    'interview_type': 'technical',
+    'interview_topics': '- System design\n- Python',
+    'preparation_instructions': 'Bring {curly} braces: {{ }}',
+    'recruiter_name': 'Alex Kim',
+    'contact_email': 'recruiting@example.com',
+    'new_interview_date': 'March 3, 2026',
+    'new_interview_time': '2:00 PM',
+    'reason_for_reschedule': 'The interviewer is travelling.'
+}
+
+RENDERERS = [
+    ('render_invite', 'INTERVIEW_EMAIL_TEMPLATE'),
+    ('render_reminder', 'INTERVIEW_REMINDER_TEMPLATE'),
+    ('render_reschedule', 'INTERVIEW_RESCHEDULING_TEMPLATE')
+]
+
+
+@pytest.mark.parametrize('renderer_name, template_name', RENDERERS)
+def test_renderer_matches_str_format(renderer_name, template_name):
+    """Each renderer produces exactly what template.format() does"""
+    template = getattr(prompts, template_name)
+    renderer = getattr(prompts, renderer_name)
+
+    assert renderer(**COMMON_FIELDS) == template.format(**COMMON_FIELDS)
+
+
+@pytest.mark.parametrize('renderer_name, template_name', RENDERERS)
+def test_renderer_missing_key_raises(renderer_name, template_name):
+    """A missing field raises KeyError, as str.format does"""
+    template = getattr(prompts, template_name)
+    renderer = getattr(prompts, renderer_name)
+    fields = dict(COMMON_FIELDS)
+    del fields['candidate_name']
+
+    with pytest.raises(KeyError):
+        template.format(**fields)
+    with pytest.raises(KeyError, match='candidate_name'):
+        renderer(**fields)
+
+
+@pytest.mark.parametrize('template', [
+    'Plain text with no fields',
+    'Escaped {{braces}} around {name}',
+    '{{{name}}}',
+    '{{ }} {name} {{',
+    '{name:>8}|{count:03d}',
+    '{name}{name}',
+    ''
+])
+def test_compile_template_matches_str_format(template):
+    """Literal braces, format specs and repeated fields match str.format"""
+    fields = {'name': 'Jane', 'count': 7}
+
+    assert prompts._compile_template(template)(**fields) == template.format(**fields)
+
+
+@pytest.mark.parametrize('template', ['{}', '{0}', '{name!r}', '{name.upper}', '{items[0]}'])
+def test_compile_template_rejects_unsupported_placeholders(template):
+    with pytest.raises(ValueError):
+        prompts._compile_template(template)
+
+
+def test_renderers_are_compiled_once():
+    assert prompts.render_invite is prompts.render_invite
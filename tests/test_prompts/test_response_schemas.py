@@ -0,0 +1,41 @@
+"""
+Tests that the structured-output models convert to Gemini response schemas
+"""
+
+import pytest
+import sys
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+genai = pytest.importorskip('google.generativeai')
+from google.generativeai.types import generation_types
+
+from prompts import ResumeParse, SkillsMatch
+
+
+def _to_proto_config(schema):
+    """Run a model through the same conversion the SDK applies per request"""
+    config = genai.GenerationConfig(
+        response_mime_type="application/json",
+        response_schema=schema
+    )
+    return genai.protos.GenerationConfig(
+        generation_types.to_generation_config_dict(config)
+    )
+
+
+@pytest.mark.parametrize('schema', [ResumeParse, SkillsMatch])
+def test_schema_converts(schema):
+    proto = _to_proto_config(schema)
+    properties = proto.response_schema.properties
+    assert set(properties) == set(schema.model_fields)
+
+
+def test_optional_resume_fields_are_nullable():
+    proto = _to_proto_config(ResumeParse)
+    personal_info = proto.response_schema.properties['personal_info']
+    assert personal_info.properties['email'].nullable
+    assert not personal_info.properties['name'].nullable
@@ -0,0 +1,135 @@
+"""
+Tests for the job store (JSONL append log over a JSON snapshot)
+"""
+
+import orjson
+import pytest
+import sys
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from storage import job_store
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    """Point the job store at an empty temp directory"""
+    jobs_dir = tmp_path / "jobs"
+    monkeypatch.setattr(job_store, 'JOBS_DIR', jobs_dir)
+    monkeypatch.setattr(job_store, 'JOBS_SNAPSHOT_FILE', jobs_dir / "jobs_list.json")
+    monkeypatch.setattr(job_store, 'JOBS_LOG_FILE', jobs_dir / "jobs.jsonl")
+    monkeypatch.setattr(job_store, '_jobs_cache', (None, []))
+    return job_store
+
+
+def make_job(job_id: str, title: str = "Engineer") -> dict:
+    return {'id': job_id, 'title': title, 'status': 'active'}
+
+
+def test_empty_store(store):
+    assert store.load_jobs() == []
+
+
+def test_save_and_replay(store):
+    store.save_job(make_job('job_1'))
+    store.save_job(make_job('job_2'))
+
+    assert [job['id'] for job in store.load_jobs()] == ['job_1', 'job_2']
+    assert store.JOBS_LOG_FILE.read_bytes().count(b"\n") == 2
+
+
+def test_last_write_wins(store):
+    store.save_job(make_job('job_1', title="Engineer"))
+    store.save_job(make_job('job_2'))
+    store.save_job(make_job('job_1', title="Senior Engineer"))
+
+    jobs = store.load_jobs()
+
+    # Updated in place, keeping first-created order
+    assert [job['id'] for job in jobs] == ['job_1', 'job_2']
+    assert jobs[0]['title'] == "Senior Engineer"
+
+
+def test_log_replays_over_snapshot(store):
+    store.JOBS_DIR.mkdir(parents=True)
+    store.JOBS_SNAPSHOT_FILE.write_bytes(orjson.dumps([
+        make_job('job_1', title="Old title"),
+        make_job('job_2')
+    ]))
+    store.save_job(make_job('job_1', title="New title"))
+    store.save_job(make_job('job_3'))
+
+    jobs = store.load_jobs()
+
+    assert [job['id'] for job in jobs] == ['job_1', 'job_2', 'job_3']
+    assert jobs[0]['title'] == "New title"
+
+
+def test_compaction(store):
+    store.save_job(make_job('job_1', title="Engineer"))
+    store.save_job(make_job('job_2'))
+    store.save_job(make_job('job_1', title="Senior Engineer"))
+    before = store.load_jobs()
+
+    store.compact_jobs()
+
+    assert not store.JOBS_LOG_FILE.exists()
+    assert orjson.loads(store.JOBS_SNAPSHOT_FILE.read_bytes()) == before
+    assert not list(store.JOBS_DIR.glob("*.tmp"))
+    assert store.load_jobs() == before
+
+
+def test_save_compacts_past_threshold(store, monkeypatch):
+    monkeypatch.setattr(job_store, 'COMPACT_LOG_BYTES', 100)
+
+    for i in range(5):
+        store.save_job(make_job(f'job_{i}', title="x" * 40))
+
+    # Saves past the threshold fold the log into the snapshot, so the log
+    # never holds more than the records written since the last compaction
+    assert store.JOBS_SNAPSHOT_FILE.exists()
+    assert store.JOBS_LOG_FILE.stat().st_size <= 100
+    assert [job['id'] for job in store.load_jobs()] == [f'job_{i}' for i in range(5)]
+
+
+def test_truncated_final_line_is_skipped(store):
+    store.save_job(make_job('job_1'))
+    with open(store.JOBS_LOG_FILE, 'ab') as f:
+        f.write(orjson.dumps(make_job('job_2'))[:15])
+
+    assert [job['id'] for job in store.load_jobs()] == ['job_1']
+
+
+def test_save_after_truncated_line(store):
+    """A save after a torn append starts on a fresh line and is readable"""
+    store.save_job(make_job('job_1'))
+    with open(store.JOBS_LOG_FILE, 'ab') as f:
+        f.write(orjson.dumps(make_job('job_2'))[:15])
+
+    store.save_job(make_job('job_3'))
+
+    assert [job['id'] for job in store.load_jobs()] == ['job_1', 'job_3']
+
+
+def test_reads_are_memoised_until_files_change(store):
+    store.save_job(make_job('job_1'))
+    first = store.load_jobs()
+
+    # Callers get a fresh list, so mutating it doesn't poison the memo
+    first.clear()
+    assert [job['id'] for job in store.load_jobs()] == ['job_1']
+
+    store.save_job(make_job('job_2'))
+    assert [job['id'] for job in store.load_jobs()] == ['job_1', 'job_2']
+
+
+def test_no_per_job_files(store):
+    """Only the snapshot and the log are written"""
+    store.save_job(make_job('job_1'))
+    store.compact_jobs()
+    store.save_job(make_job('job_2'))
+
+    assert sorted(path.name for path in store.JOBS_DIR.iterdir()) == ['jobs.jsonl', 'jobs_list.json']